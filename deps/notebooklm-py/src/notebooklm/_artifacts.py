@@ -1042,50 +1042,7 @@ class ArtifactsAPI:
         if not video_art:
             raise ArtifactNotReadyError("video_overview")
 
-        # Extract URL from metadata[8]
-        try:
-            if len(video_art) <= 8:
-                raise ArtifactParseError("video_artifact", details="Invalid structure")
-
-            metadata = video_art[8]
-            if not isinstance(metadata, list):
-                raise ArtifactParseError("video_metadata", details="Invalid structure")
-
-            media_list = None
-            for item in metadata:
-                if (
-                    isinstance(item, list)
-                    and len(item) > 0
-                    and isinstance(item[0], list)
-                    and len(item[0]) > 0
-                    and isinstance(item[0][0], str)
-                    and item[0][0].startswith("http")
-                ):
-                    media_list = item
-                    break
-
-            if not media_list:
-                raise ArtifactParseError("media", details="No media URLs found")
-
-            url = None
-            for item in media_list:
-                if isinstance(item, list) and len(item) > 2 and item[2] == "video/mp4":
-                    url = item[0]
-                    if item[1] == 4:
-                        break
-
-            if not url and len(media_list) > 0:
-                url = media_list[0][0]
-
-            if not url:
-                raise ArtifactDownloadError("media", details="Could not extract download URL")
-
-            return await self._download_url(url, output_path)
-
-        except (IndexError, TypeError) as e:
-            raise ArtifactParseError(
-                "video_artifact", details=f"Failed to parse structure: {e}", cause=e
-            ) from e
+        return await self._download_url(self._video_url(video_art), output_path)
 
     async def download_infographic(
         self, notebook_id: str, output_path: str, artifact_id: str | None = None
@@ -1587,29 +1544,37 @@ class ArtifactsAPI:
         """
         # List all artifacts and find by ID (no poll-by-ID RPC exists)
         artifacts_data = await self._list_raw(notebook_id)
-        for art in artifacts_data:
-            if len(art) > 0 and art[0] == task_id:
-                status_code = art[4] if len(art) > 4 else 0
-                artifact_type = art[2] if len(art) > 2 else 0
-
-                # For media artifacts, verify URL availability before reporting completion.
-                # The API may set status=COMPLETED before media URLs are populated.
-                if status_code == ArtifactStatus.COMPLETED:
-                    if not self._is_media_ready(art, artifact_type):
-                        type_name = self._get_artifact_type_name(artifact_type)
-                        logger.debug(
-                            "Artifact %s (type=%s) status=COMPLETED but media not ready, "
-                            "continuing poll",
-                            task_id,
-                            type_name,
-                        )
-                        # Downgrade to PROCESSING to continue polling
-                        status_code = ArtifactStatus.PROCESSING
+        return self._status_from_raw(task_id, self._find_raw(artifacts_data, task_id))
 
-                status = artifact_status_to_str(status_code)
-                return GenerationStatus(task_id=task_id, status=status)
+    def watch(
+        self,
+        notebook_id: str,
+        task_id: str,
+        initial_interval: float = 2.0,
+        max_interval: float = 15.0,
+        backoff_factor: float = 1.5,
+    ) -> "ArtifactWatcher":
+        """Watch a generation task with one LIST_ARTIFACTS call per poll.
 
-        return GenerationStatus(task_id=task_id, status="pending")
+        Args:
+            notebook_id: The notebook ID.
+            task_id: The task/artifact ID to watch.
+            initial_interval: Seconds between polls after a status change.
+            max_interval: Maximum seconds between polls.
+            backoff_factor: Interval multiplier while nothing changes.
+
+        Returns:
+            An ArtifactWatcher; use it as an async context manager.
+
+        Example:
+            async with client.artifacts.watch(nb_id, status.task_id) as watcher:
+                final = await watcher.wait(timeout=1800)
+                if final.is_complete:
+                    await watcher.download("video.mp4")
+        """
+        return ArtifactWatcher(
+            self, notebook_id, task_id, initial_interval, max_interval, backoff_factor
+        )
 
     async def wait_for_completion(
         self,
@@ -1850,6 +1815,92 @@ class ArtifactsAPI:
             return result[0] if isinstance(result[0], list) else result
         return []
 
+    @staticmethod
+    def _find_raw(
+        artifacts_data: builtins.list[Any], artifact_id: str
+    ) -> builtins.list[Any] | None:
+        """Find an artifact's raw row in _list_raw() data by ID."""
+        for art in artifacts_data:
+            if isinstance(art, list) and len(art) > 0 and art[0] == artifact_id:
+                return art
+        return None
+
+    def _status_from_raw(self, task_id: str, art: builtins.list[Any] | None) -> GenerationStatus:
+        """GenerationStatus for a raw artifact row (None: not listed yet -> pending)."""
+        if art is None:
+            return GenerationStatus(task_id=task_id, status="pending")
+
+        status_code = art[4] if len(art) > 4 else 0
+        artifact_type = art[2] if len(art) > 2 else 0
+
+        # For media artifacts, verify URL availability before reporting completion.
+        # The API may set status=COMPLETED before media URLs are populated.
+        if status_code == ArtifactStatus.COMPLETED:
+            if not self._is_media_ready(art, artifact_type):
+                type_name = self._get_artifact_type_name(artifact_type)
+                logger.debug(
+                    "Artifact %s (type=%s) status=COMPLETED but media not ready, continuing poll",
+                    task_id,
+                    type_name,
+                )
+                # Downgrade to PROCESSING to continue polling
+                status_code = ArtifactStatus.PROCESSING
+
+        status = artifact_status_to_str(status_code)
+        return GenerationStatus(task_id=task_id, status=status)
+
+    def _video_url(self, video_art: builtins.list[Any]) -> str:
+        """Extract the MP4 download URL from a completed video artifact row.
+
+        Raises:
+            ArtifactParseError: If the row has no media URL list.
+            ArtifactDownloadError: If no URL could be picked from it.
+        """
+        # Extract URL from metadata[8]
+        try:
+            if len(video_art) <= 8:
+                raise ArtifactParseError("video_artifact", details="Invalid structure")
+
+            metadata = video_art[8]
+            if not isinstance(metadata, list):
+                raise ArtifactParseError("video_metadata", details="Invalid structure")
+
+            media_list = None
+            for item in metadata:
+                if (
+                    isinstance(item, list)
+                    and len(item) > 0
+                    and isinstance(item[0], list)
+                    and len(item[0]) > 0
+                    and isinstance(item[0][0], str)
+                    and item[0][0].startswith("http")
+                ):
+                    media_list = item
+                    break
+
+            if not media_list:
+                raise ArtifactParseError("media", details="No media URLs found")
+
+            url = None
+            for item in media_list:
+                if isinstance(item, list) and len(item) > 2 and item[2] == "video/mp4":
+                    url = item[0]
+                    if item[1] == 4:
+                        break
+
+            if not url and len(media_list) > 0:
+                url = media_list[0][0]
+
+            if not url:
+                raise ArtifactDownloadError("media", details="Could not extract download URL")
+
+            return url
+
+        except (IndexError, TypeError) as e:
+            raise ArtifactParseError(
+                "video_artifact", details=f"Failed to parse structure: {e}", cause=e
+            ) from e
+
     def _select_artifact(
         self,
         candidates: builtins.list[Any],
@@ -2156,3 +2207,165 @@ class ArtifactsAPI:
                 e,
             )
             return not is_media  # False for media (continue polling), True for non-media
+
+
+class ArtifactWatcher:
+    """Background watcher for one generation task.
+
+    Polls the notebook's artifact list (a single LIST_ARTIFACTS call) once
+    per interval, backing off while nothing changes, and publishes what it
+    sees as asyncio events, so callers await state instead of polling the
+    same RPC themselves:
+
+    - ``changed``: set on every status change (``wait_changed()`` re-arms it)
+    - ``media_ready``: completed and, for video, the MP4 URL is known
+    - ``failed``: the task failed, or polling stopped on an unexpected
+      error (kept in ``error`` and raised from ``wait()``/``wait_changed()``)
+
+    The latest state is in ``status``, ``media_url`` and ``polls``. Create
+    it with ArtifactsAPI.watch().
+    """
+
+    def __init__(
+        self,
+        api: ArtifactsAPI,
+        notebook_id: str,
+        task_id: str,
+        initial_interval: float = 2.0,
+        max_interval: float = 15.0,
+        backoff_factor: float = 1.5,
+    ):
+        self._api = api
+        self.notebook_id = notebook_id
+        self.task_id = task_id
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.status = GenerationStatus(task_id=task_id, status="pending")
+        self.media_url: str | None = None
+        self.polls = 0
+        self.error: BaseException | None = None
+        self.changed = asyncio.Event()
+        self.media_ready = asyncio.Event()
+        self.failed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "ArtifactWatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start polling in the background (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def done(self) -> bool:
+        """True once the media is ready or the task failed."""
+        return self.media_ready.is_set() or self.failed.is_set()
+
+    async def _run(self) -> None:
+        try:
+            await self._poll_loop()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Not a transient poll failure (auth, parsing, ...): stop and let
+            # the waiters see it instead of waiting on a dead task
+            logger.warning("Artifact watch for %s stopped: %s", self.task_id, e)
+            self.error = e
+            self.failed.set()
+
+    async def _poll_loop(self) -> None:
+        interval = self.initial_interval
+        while not self.done:
+            try:
+                rows = await self._api._list_raw(self.notebook_id)
+            except (RPCError, httpx.HTTPError) as e:
+                # Transient; the next poll retries
+                logger.debug("Artifact watch poll failed for %s: %s", self.task_id, e)
+            else:
+                self.polls += 1
+                if self._update(self._api._find_raw(rows, self.task_id)):
+                    interval = self.initial_interval
+            if self.done:
+                break
+            await asyncio.sleep(interval)
+            interval = min(interval * self.backoff_factor, self.max_interval)
+
+    def _update(self, art: builtins.list[Any] | None) -> bool:
+        """Apply one poll result; returns True if the status changed."""
+        status = self._api._status_from_raw(self.task_id, art)
+        changed = status.status != self.status.status
+        self.status = status
+        if changed:
+            self.changed.set()
+
+        if status.is_failed:
+            self.failed.set()
+        elif status.is_complete and art is not None:
+            if len(art) > 2 and art[2] == ArtifactTypeCode.VIDEO:
+                try:
+                    self.media_url = self._api._video_url(art)
+                except (ArtifactParseError, ArtifactDownloadError):
+                    return changed  # URL not populated yet; keep polling
+            self.media_ready.set()
+        return changed
+
+    async def _first(self, events: builtins.list[asyncio.Event], timeout: float | None) -> bool:
+        """Wait for any of `events`; False on timeout."""
+        waiters = [asyncio.ensure_future(e.wait()) for e in events]
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for w in waiters:
+                w.cancel()
+        return bool(done)
+
+    async def wait_changed(self, timeout: float | None = None) -> GenerationStatus:
+        """Wait for the next status change (or the end of the task); returns the status."""
+        await self._first([self.changed, self.media_ready, self.failed], timeout)
+        self.changed.clear()
+        if self.error is not None:
+            raise self.error
+        return self.status
+
+    async def wait(self, timeout: float | None = None) -> GenerationStatus:
+        """Wait until the media is ready or the task failed.
+
+        Raises:
+            TimeoutError: If neither happens within timeout.
+            Exception: The error that stopped polling, if any.
+        """
+        self.start()
+        if not await self._first([self.media_ready, self.failed], timeout):
+            raise TimeoutError(f"Task {self.task_id} timed out after {timeout}s")
+        if self.error is not None:
+            raise self.error
+        return self.status
+
+    async def download(self, output_path: str) -> str:
+        """Download the finished video from the URL the watcher already saw.
+
+        Falls back to ArtifactsAPI.download_video() when no URL was captured.
+        """
+        if self.media_url:
+            return await self._api._download_url(self.media_url, output_path)
+        return await self._api.download_video(
+            self.notebook_id, output_path, artifact_id=self.task_id
+        )
@@ -10,8 +10,6 @@ from time import monotonic
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-import httpx
-
 from ._core import ClientCore
 from ._url_utils import is_youtube_url
 from .exceptions import ValidationError
@@ -49,6 +47,8 @@ class SourcesAPI:
             core: The core client infrastructure.
         """
         self._core = core
+        # In-flight list() per notebook, joined by concurrent status pollers
+        self._snapshots: dict[str, asyncio.Future[builtins.list[Source]]] = {}
 
     async def list(self, notebook_id: str) -> list[Source]:
         """List all sources in a notebook.
@@ -153,6 +153,20 @@ class SourcesAPI:
 
         return sources
 
+    async def _poll_snapshot(self, notebook_id: str) -> builtins.list[Source]:
+        """list() for status polling, shared by concurrent pollers.
+
+        A poll that starts while another GET_NOTEBOOK for the same notebook
+        is in flight awaits that response instead of sending its own.
+        """
+        pending = self._snapshots.get(notebook_id)
+        if pending is None:
+            pending = asyncio.ensure_future(self.list(notebook_id))
+            self._snapshots[notebook_id] = pending
+            pending.add_done_callback(lambda _: self._snapshots.pop(notebook_id, None))
+        # Shielded: one cancelled waiter must not cancel the fetch for the others
+        return await asyncio.shield(pending)
+
     async def get(self, notebook_id: str, source_id: str) -> Source | None:
         """Get details of a specific source.
 
@@ -221,7 +235,8 @@ class SourcesAPI:
             if elapsed >= timeout:
                 raise SourceTimeoutError(source_id, timeout, last_status)
 
-            source = await self.get(notebook_id, source_id)
+            sources = await self._poll_snapshot(notebook_id)
+            source = next((s for s in sources if s.id == source_id), None)
 
             if source is None:
                 raise SourceNotFoundError(source_id)
@@ -250,13 +265,18 @@ class SourcesAPI:
         timeout: float = 120.0,
         **kwargs: Any,
     ) -> builtins.list[Source]:
-        """Wait for multiple sources to become ready in parallel.
+        """Wait for multiple sources to become ready.
+
+        All sources are checked from one notebook fetch per poll (a single
+        GET_NOTEBOOK per interval, however many sources are waited on),
+        with the same backoff as wait_until_ready().
 
         Args:
             notebook_id: The notebook ID.
             source_ids: List of source IDs to wait for.
             timeout: Per-source timeout in seconds.
-            **kwargs: Additional arguments passed to wait_until_ready().
+            **kwargs: Polling arguments of wait_until_ready() (initial_interval,
+                max_interval, backoff_factor).
 
         Returns:
             List of ready Source objects in the same order as source_ids.
@@ -275,10 +295,41 @@ class SourcesAPI:
                 nb_id, [s.id for s in sources]
             )
         """
-        tasks = [
-            self.wait_until_ready(notebook_id, sid, timeout=timeout, **kwargs) for sid in source_ids
-        ]
-        return list(await asyncio.gather(*tasks))
+        polling = {"initial_interval": 1.0, "max_interval": 10.0, "backoff_factor": 1.5}
+        for name in kwargs:
+            if name not in polling:
+                raise TypeError(f"wait_for_sources() got an unexpected keyword argument '{name}'")
+        polling.update(kwargs)
+
+        start = monotonic()
+        interval = polling["initial_interval"]
+        ready: dict[str, Source] = {}
+        last_status: dict[str, int] = {}
+
+        while True:
+            snapshot = {s.id: s for s in await self._poll_snapshot(notebook_id)}
+            for sid in source_ids:
+                if sid in ready:
+                    continue
+                source = snapshot.get(sid)
+                if source is None:
+                    raise SourceNotFoundError(sid)
+                last_status[sid] = source.status
+                if source.is_ready:
+                    ready[sid] = source
+                elif source.is_error:
+                    raise SourceProcessingError(sid, source.status)
+
+            if len(ready) == len(set(source_ids)):
+                return [ready[sid] for sid in source_ids]
+
+            remaining = timeout - (monotonic() - start)
+            if remaining <= 0:
+                waiting = next(sid for sid in source_ids if sid not in ready)
+                raise SourceTimeoutError(waiting, timeout, last_status.get(waiting))
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * polling["backoff_factor"], polling["max_interval"])
 
     async def add_url(
         self,
@@ -962,17 +1013,16 @@ class SourcesAPI:
             }
         )
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, content=body)
-            response.raise_for_status()
+        # Reuse the core's pooled client so concurrent uploads share connections
+        client = self._core.get_http_client()
+        response = await client.post(url, headers=headers, content=body, timeout=60.0)
+        response.raise_for_status()
 
-            upload_url = response.headers.get("x-goog-upload-url")
-            if not upload_url:
-                raise SourceAddError(
-                    filename, message="Failed to get upload URL from response headers"
-                )
+        upload_url = response.headers.get("x-goog-upload-url")
+        if not upload_url:
+            raise SourceAddError(filename, message="Failed to get upload URL from response headers")
 
-            return upload_url
+        return upload_url
 
     async def _upload_file_streaming(self, upload_url: str, file_path: Path) -> None:
         """Stream upload file content to the resumable upload URL.
@@ -1001,6 +1051,8 @@ class SourcesAPI:
                 while chunk := f.read(65536):  # 64KB chunks
                     yield chunk
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(upload_url, headers=headers, content=file_stream())
-            response.raise_for_status()
+        client = self._core.get_http_client()
+        response = await client.post(
+            upload_url, headers=headers, content=file_stream(), timeout=300.0
+        )
+        response.raise_for_status()
@@ -9,6 +9,12 @@ Usage:
     python publish.py --input output/         # Specify input dir
     python publish.py --skip-upload           # Subtitle only, no upload
     python publish.py --platforms bilibili weixin_channels  # Choose platforms
+    python publish.py --in-memory-audio       # Transcribe from shared memory, no temp WAV
+    python publish.py --trim-silence          # Skip dead air / long pauses before ASR
+    python publish.py --no-pipeline           # Don't overlap next video's ASR with uploads
+    python publish.py --no-resume             # Ignore stage checkpoints (jobs.jsonl)
+    python publish.py --no-browser-service    # Fresh browser per WeChat login/upload
+    python publish.py --upload-bandwidth 20   # Share a 20 Mbit/s uplink between uploads
 
 Requires:
     pip install imageio-ffmpeg faster-whisper "biliup>=1.1.29" playwright python-dotenv requests
@@ -24,12 +30,15 @@ _os.environ.setdefault("MKL_THREADING_LAYER", "sequential")
 _os.environ.setdefault("OMP_NUM_THREADS", "1")
 _os.environ.setdefault("MKL_NUM_THREADS", "1")
 
+import abc
 import argparse
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -48,7 +57,19 @@ DEFAULT_OUTPUT = PROJECT_ROOT / "output_subtitled"
 COOKIE_FILE = PROJECT_ROOT / "cookies" / "bilibili" / "account.json"
 WEIXIN_STORAGE_STATE = PROJECT_ROOT / "cookies" / "weixin" / "storage_state.json"
 WEIXIN_MP_PROFILE_DIR = PROJECT_ROOT / "cookies" / "weixin_mp" / "browser_profile"
-RUN_HISTORY_FILE = PROJECT_ROOT / "skills" / "paper-talker" / "references" / "run_history.json"
+BROWSER_SERVICE_FILE = PROJECT_ROOT / "cookies" / "browser_service.json"
+BROWSER_SERVICE_LOG = PROJECT_ROOT / "cookies" / "browser_service.log"
+BROWSER_SERVICE_TIMEOUT = 1200  # Max wait for one browser service job (20 min)
+USE_BROWSER_SERVICE = True  # --no-browser-service: launch a browser per login/upload
+LOGIN_HEALTH_FILE = PROJECT_ROOT / "cookies" / "login_health.json"
+LOGIN_HEALTH_TTL = 30 * 60       # A successful probe is trusted this long
+LOGIN_REFRESH_INTERVAL = 10 * 60  # Background re-probe period during a batch
+LOGIN_PROBE_TIMEOUT = 8
+# 视频号 auth_data errCodes meaning "not logged in / session expired"; any
+# other nonzero code (rate limit, server error) leaves the state unknown
+WEIXIN_CHANNELS_AUTH_ERRORS = {300330, 300333, 300334}
+RUN_HISTORY_FILE = PROJECT_ROOT / "skills" / "paper-talker" / "references" / "run_history.json"  # legacy, imported once
+RUN_HISTORY_DB = RUN_HISTORY_FILE.with_suffix(".db")
 
 def _get_biliup_exe() -> Path:
     """Get platform-specific biliup binary path."""
@@ -65,6 +86,42 @@ def _get_biliup_exe() -> Path:
 MAX_CHARS_PER_LINE = 18  # Max Chinese chars per subtitle line (screen width)
 MAX_DURATION_PER_SUB = 6.0  # Max seconds a single subtitle can display
 
+# FFmpeg watchdog: kill an encode whose -progress output stops advancing
+FFMPEG_STALL_TIMEOUT = 120
+
+# publish.py pipeline: prepared videos allowed to wait for upload
+PIPELINE_DEPTH = 1
+# Per-thread output settings; the pipeline producer sets quiet_progress so its
+# in-place ffmpeg progress does not overwrite the uploader's lines
+_OUTPUT = threading.local()
+
+# --retry scheduler: concurrent uploads across videos
+RETRY_GLOBAL_LIMIT = 3
+RETRY_PLATFORM_LIMITS = {"bilibili": 2, "weixin_channels": 1}  # 视频号 drives one browser profile
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 30   # seconds; doubles per attempt, full jitter
+RETRY_BACKOFF_MAX = 300
+RETRY_ATTEMPT_TIMEOUT = 1200  # 20 min max per upload attempt
+
+# Upload bandwidth: concurrent uploads share one uplink. With a budget, the
+# platform that gates a later step gets its measured rate first.
+UPLOAD_BANDWIDTH = 0  # Total Mbit/s for concurrent uploads (--upload-bandwidth); 0 = unlimited
+UPLOAD_PRIORITY = ("bilibili", "weixin_channels")  # Bilibili first: the 公众号 article needs its BV link
+UPLOAD_MIN_SHARE = 0.25  # Each lower-priority upload keeps at least this share of the budget
+THROUGHPUT_WINDOW = 10   # Recent uploads per platform used for the rate estimate
+THROUGHPUT_CAPPED = 0.9  # A transfer this close to its plan's rate was limited by it
+
+# Subtitle-burn encode profiles. "master" is the archived {topic}.mp4; the
+# other keys are platform names, each encoded from the same decode (split
+# filter) into {topic}.{platform}.mp4 and uploaded instead of the master
+# when smaller. height caps the output (never upscales); maxrate caps the
+# CRF bitrate (with bufsize) for faster uploads.
+TRANSCODE_PROFILES = {
+    "master":          {"crf": 18, "preset": "fast"},
+    "bilibili":        {"crf": 20, "preset": "fast", "height": 1080, "maxrate": "8M", "bufsize": "16M"},
+    "weixin_channels": {"crf": 23, "preset": "fast", "height": 1080, "maxrate": "3M", "bufsize": "6M"},
+}
+
 # ── Colors ──────────────────────────────────────────────────
 G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; C = "\033[96m"; B = "\033[1m"; D = "\033[2m"; X = "\033[0m"
 
@@ -181,13 +238,116 @@ def make_tags(topic: str) -> str:
 
 # ── Cover extraction ────────────────────────────────────────
 
+# Cover picker: keyframes are decoded at this size and scored for quality
+COVER_SAMPLE_SIZE = (160, 90)
+COVER_SKIP_EDGES = 0.03  # Ignore first/last 3% (title card, outro)
+
+
+def _score_cover_frames(frames):
+    """Score RGB frames (N, H, W, 3 uint8) for use as a cover; higher is better.
+
+    Combines, per frame and fully vectorised over the batch:
+    - sharpness: variance of the 4-neighbour Laplacian of luma
+    - contrast: standard deviation of luma
+    - colourfulness: Hasler–Süsstrunk metric on the rg / yb opponent channels
+    Each metric is normalised by its batch maximum; near-black and near-white
+    frames (fades, blank slides) are scored 0.
+    """
+    import numpy as np
+
+    f = frames.astype(np.float32)
+    r, g, b = f[..., 0], f[..., 1], f[..., 2]
+    luma = 0.299 * r + 0.587 * g + 0.114 * b
+
+    lap = (4 * luma[:, 1:-1, 1:-1] - luma[:, :-2, 1:-1] - luma[:, 2:, 1:-1]
+           - luma[:, 1:-1, :-2] - luma[:, 1:-1, 2:])
+    sharpness = lap.var(axis=(1, 2))
+    contrast = luma.std(axis=(1, 2))
+    rg = r - g
+    yb = 0.5 * (r + g) - b
+    colourfulness = (np.sqrt(rg.std(axis=(1, 2)) ** 2 + yb.std(axis=(1, 2)) ** 2)
+                     + 0.3 * np.sqrt(rg.mean(axis=(1, 2)) ** 2 + yb.mean(axis=(1, 2)) ** 2))
+
+    def _norm(x):
+        peak = x.max()
+        return x / peak if peak > 0 else x
+
+    score = 0.4 * _norm(sharpness) + 0.3 * _norm(contrast) + 0.3 * _norm(colourfulness)
+    brightness = luma.mean(axis=(1, 2))
+    score[(brightness < 16) | (brightness > 240)] = 0.0
+    return score
+
+
+def pick_cover_time(ffmpeg: str, video_path: Path) -> float | None:
+    """Pick the best cover timestamp by scoring keyframes in one FFmpeg pipe.
+
+    Decodes keyframes only (-skip_frame nokey) downscaled to COVER_SAMPLE_SIZE
+    as raw RGB on stdout, takes their timestamps from showinfo on stderr, and
+    scores them with _score_cover_frames(). Typically well under a second.
+
+    Returns:
+        Timestamp (seconds) of the best frame, or None if NumPy is missing or
+        decoding failed (caller falls back to the first frame).
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    w, h = COVER_SAMPLE_SIZE
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-skip_frame", "nokey", "-i", str(video_path), "-an",
+             "-vf", f"scale={w}:{h},showinfo", "-vsync", "0",
+             "-pix_fmt", "rgb24", "-f", "rawvideo", "pipe:1"],
+            capture_output=True, timeout=60,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    stderr = result.stderr.decode("utf-8", errors="replace")
+    times = [float(t) for t in re.findall(r"pts_time:\s*([\d.]+)", stderr)]
+    frame_bytes = w * h * 3
+    n = min(len(times), len(result.stdout) // frame_bytes)
+    if n == 0:
+        return None
+    frames = np.frombuffer(result.stdout[:n * frame_bytes], dtype=np.uint8).reshape(n, h, w, 3)
+    times = np.array(times[:n])
+
+    scores = _score_cover_frames(frames)
+    duration = _parse_ffmpeg_duration(stderr) or float(times[-1])
+    inner = (times >= duration * COVER_SKIP_EDGES) & (times <= duration * (1 - COVER_SKIP_EDGES))
+    if inner.any():
+        scores = np.where(inner, scores, -1.0)
+    best = int(scores.argmax())
+    if scores[best] <= 0:
+        return None
+    return float(times[best])
+
+
 def extract_cover(ffmpeg: str, video_path: Path, cover_path: Path) -> bool:
-    """Extract first frame from original video as cover image (JPEG).
+    """Extract a cover image (JPEG) from the original video.
 
-    Always uses the original (un-subtitled) video to get a clean first frame.
+    Always uses the original (un-subtitled) video to get a clean frame.
+    Picks the sharpest / most colourful keyframe via pick_cover_time(), and
+    falls back to the first frame (NotebookLM videos often open on a blank or
+    title card, so frame 0 is only the last resort).
     Tries multiple FFmpeg approaches for robustness.
     """
-    # Approach 1: seek to 0 and grab 1 frame
+    # Approach 1: best-scoring keyframe, written at full resolution
+    t = pick_cover_time(ffmpeg, video_path)
+    if t is not None:
+        result = subprocess.run(
+            [ffmpeg, "-ss", f"{t:.3f}", "-i", str(video_path), "-vframes", "1",
+             "-q:v", "2", "-y", str(cover_path)],
+            capture_output=True, text=True, encoding="utf-8", errors="replace",
+        )
+        if result.returncode == 0 and cover_path.exists() and cover_path.stat().st_size > 0:
+            return True
+
+    # Approach 2: seek to 0 and grab 1 frame
     result = subprocess.run(
         [ffmpeg, "-ss", "0", "-i", str(video_path), "-vframes", "1",
          "-q:v", "2", "-y", str(cover_path)],
@@ -196,7 +356,7 @@ def extract_cover(ffmpeg: str, video_path: Path, cover_path: Path) -> bool:
     if result.returncode == 0 and cover_path.exists() and cover_path.stat().st_size > 0:
         return True
 
-    # Approach 2: without -ss, raw first frame
+    # Approach 3: without -ss, raw first frame
     result = subprocess.run(
         [ffmpeg, "-i", str(video_path), "-vframes", "1", "-q:v", "2",
          "-y", str(cover_path)],
@@ -263,17 +423,175 @@ def get_ffmpeg():
     return imageio_ffmpeg.get_ffmpeg_exe()
 
 
-def extract_audio(ffmpeg: str, video_path: Path, wav_path: Path) -> bool:
-    """Extract audio from video to 16kHz mono WAV."""
-    result = subprocess.run(
+def _parse_ffmpeg_duration(line: str) -> float:
+    """Parse 'Duration: HH:MM:SS.xx' from an FFmpeg stderr line (0.0 if absent)."""
+    m = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", line)
+    if not m:
+        return 0.0
+    return int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3))
+
+
+def _fmt_eta(seconds: float) -> str:
+    """Format seconds as M:SS for progress display."""
+    seconds = max(0, int(seconds))
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def run_ffmpeg_progress(cmd: list, label: str = "",
+                        stall_timeout: float = FFMPEG_STALL_TIMEOUT) -> dict:
+    """Run an FFmpeg command with streamed ``-progress`` parsing.
+
+    Adds ``-progress pipe:1 -nostats`` so FFmpeg emits key=value progress
+    blocks on stdout; stderr is drained line by line (only the tail is kept)
+    instead of being buffered whole by ``capture_output``. Progress (percent,
+    fps, speed, ETA) is redrawn in place after ``label`` (not on threads that set
+    ``_OUTPUT.quiet_progress``). An encode that stops
+    advancing for ``stall_timeout`` seconds is killed.
+
+    Returns:
+        {"ok": bool, "error": str, "elapsed": float, "duration": float,
+         "frames": int, "fps": float, "speed": float, "stalled": bool}
+        fps/speed are averages over the whole run (throughput, not the last tick).
+    """
+    import collections
+    import threading
+    import time
+
+    cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+    stats = {"ok": False, "error": "", "elapsed": 0.0, "duration": 0.0,
+             "frames": 0, "fps": 0.0, "speed": 0.0, "stalled": False}
+    t0 = time.time()
+    try:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, encoding="utf-8", errors="replace",
+        )
+    except OSError as e:
+        stats["error"] = str(e)
+        return stats
+
+    err_tail = collections.deque(maxlen=20)
+    last_advance = [time.time()]
+
+    def _drain_stderr():
+        for line in proc.stderr:
+            line = line.rstrip()
+            if not stats["duration"]:
+                stats["duration"] = _parse_ffmpeg_duration(line)
+            if line:
+                err_tail.append(line)
+
+    def _watchdog():
+        while proc.poll() is None:
+            if time.time() - last_advance[0] > stall_timeout:
+                stats["stalled"] = True
+                proc.kill()
+                return
+            time.sleep(1)
+
+    stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+    stderr_thread.start()
+    threading.Thread(target=_watchdog, daemon=True).start()
+
+    block = {}
+    out_time = 0.0
+    last_draw = 0.0
+    drawn = False
+    quiet = getattr(_OUTPUT, "quiet_progress", False)
+    for line in proc.stdout:
+        key, _, value = line.strip().partition("=")
+        if not key:
+            continue
+        block[key] = value
+        if key != "progress":
+            continue
+
+        # End of one progress block: update counters
+        now = time.time()
+        try:
+            t = int(block.get("out_time_us", "0")) / 1e6
+        except ValueError:
+            t = out_time  # "N/A" before the first packet
+        try:
+            frames = int(block.get("frame", "0"))
+        except ValueError:
+            frames = stats["frames"]
+        if t > out_time or frames > stats["frames"]:
+            last_advance[0] = now
+        out_time = max(out_time, t)
+        stats["frames"] = max(stats["frames"], frames)
+        try:
+            cur_fps = float(block.get("fps", "0"))
+        except ValueError:
+            cur_fps = 0.0
+        try:
+            cur_speed = float(block.get("speed", "0").rstrip("x") or 0)
+        except ValueError:
+            cur_speed = 0.0
+        block = {}
+
+        if label and not quiet and (now - last_draw >= 1.0 or value == "end"):
+            last_draw = now
+            parts = []
+            if stats["duration"]:
+                parts.append(f"{min(out_time / stats['duration'], 1.0) * 100:3.0f}%")
+            if cur_fps:
+                parts.append(f"{cur_fps:.0f} fps")
+            if cur_speed:
+                parts.append(f"{cur_speed:.2f}x")
+                if stats["duration"]:
+                    parts.append(f"ETA {_fmt_eta((stats['duration'] - out_time) / cur_speed)}")
+            sys.stdout.write(f"\r{label}{D}{' | '.join(parts)}{X}   ")
+            sys.stdout.flush()
+            drawn = True
+
+    proc.wait()
+    stderr_thread.join(timeout=5)
+    if drawn:
+        # Clear the progress text so the caller's ok()/fail() lands after the label
+        sys.stdout.write("\r" + " " * (len(label) + 60) + "\r" + label)
+        sys.stdout.flush()
+
+    stats["elapsed"] = round(time.time() - t0, 2)
+    if stats["elapsed"] > 0:
+        stats["fps"] = round(stats["frames"] / stats["elapsed"], 1)
+        stats["speed"] = round(out_time / stats["elapsed"], 2)
+    stats["ok"] = proc.returncode == 0 and not stats["stalled"]
+    if stats["stalled"]:
+        stats["error"] = f"no progress for {int(stall_timeout)}s, killed"
+    elif not stats["ok"]:
+        stats["error"] = "\n".join(err_tail)
+    return stats
+
+
+def _throughput_str(stats: dict) -> str:
+    """Short human summary of run_ffmpeg_progress() stats for ok() lines."""
+    parts = []
+    if stats.get("fps"):
+        parts.append(f"{stats['fps']:.0f} fps")
+    if stats.get("speed"):
+        parts.append(f"{stats['speed']:.1f}x")
+    parts.append(f"{stats.get('elapsed', 0):.1f}s")
+    return ", ".join(parts)
+
+
+def extract_audio(ffmpeg: str, video_path: Path, wav_path: Path,
+                  label: str = "", trace: dict = None) -> bool:
+    """Extract audio from video to 16kHz mono WAV.
+
+    Progress is streamed after `label`; run stats are stored in trace["audio"].
+    """
+    stats = run_ffmpeg_progress(
         [ffmpeg, "-i", str(video_path), "-vn", "-acodec", "pcm_s16le",
          "-ar", "16000", "-ac", "1", str(wav_path), "-y"],
-        capture_output=True, text=True, encoding="utf-8", errors="replace",
+        label=label,
     )
-    return result.returncode == 0
+    if trace is not None:
+        trace["audio"] = stats
+    return stats["ok"]
 
 
-def transcribe(wav_path: Path, workers: int = 3) -> list:
+def transcribe(wav_path: Path, workers: int = 3, pcm=None, trim_silence: bool = False) -> list:
     """Transcribe audio using faster-whisper with parallel chunk processing.
 
     Delegates to src/transcribe.transcribe_parallel() which splits audio into
@@ -282,6 +600,9 @@ def transcribe(wav_path: Path, workers: int = 3) -> list:
     Args:
         wav_path: Path to 16kHz mono WAV file
         workers: Number of parallel workers (default: 3, 1=no split)
+        pcm: Optional SharedPCM (--in-memory-audio); used instead of wav_path
+        trim_silence: Only transcribe speech regions (--trim-silence); subtitle
+            timestamps still refer to the original video
     """
     # Import from src/transcribe.py (shared implementation)
     src_dir = Path(__file__).resolve().parent / "src"
@@ -289,7 +610,7 @@ def transcribe(wav_path: Path, workers: int = 3) -> list:
         sys.path.insert(0, str(src_dir))
     from transcribe import transcribe_parallel, verify_segments
 
-    return transcribe_parallel(wav_path, workers=workers)
+    return transcribe_parallel(wav_path, workers=workers, pcm=pcm, trim_silence=trim_silence)
 
 
 def seconds_to_srt(s: float) -> str:
@@ -535,13 +856,84 @@ def generate_srt(segments: list, srt_path: Path) -> int:
     return len(entries)
 
 
-def burn_subtitles(ffmpeg: str, input_mp4: Path, srt_path: Path, output_mp4: Path) -> bool:
+def _encode_args(profile: dict) -> list:
+    """libx264 arguments for a TRANSCODE_PROFILES entry."""
+    args = ["-c:v", "libx264", "-crf", str(profile["crf"]), "-preset", profile["preset"]]
+    if profile.get("maxrate"):
+        args += ["-maxrate", profile["maxrate"], "-bufsize", profile["bufsize"]]
+    return args
+
+
+def profile_outputs(output_mp4: Path, platforms: list[str]) -> dict:
+    """Platform-tuned output paths ({topic}.{platform}.mp4) for platforms with a profile."""
+    return {p: output_mp4.with_name(f"{output_mp4.stem}.{p}.mp4")
+            for p in platforms if p in TRANSCODE_PROFILES and p != "master"}
+
+
+def platform_video(output_mp4: Path, platform: str) -> Path:
+    """Smallest acceptable file for a platform: its profile output if present and smaller."""
+    candidate = output_mp4.with_name(f"{output_mp4.stem}.{platform}.mp4")
+    try:
+        if candidate.stat().st_size < output_mp4.stat().st_size:
+            return candidate
+    except OSError:
+        pass
+    return output_mp4
+
+
+def _profile_groups(extra_outputs: dict) -> dict:
+    """Group extra outputs by identical profile: {encoded name: [names that reuse its file]}.
+
+    Profiles identical to master are grouped under "master" and not encoded again.
+    """
+    groups, by_profile = {}, {tuple(sorted(TRANSCODE_PROFILES["master"].items())): "master"}
+    for name in extra_outputs or {}:
+        key = tuple(sorted(TRANSCODE_PROFILES[name].items()))
+        if key in by_profile:
+            groups.setdefault(by_profile[key], []).append(name)
+        else:
+            by_profile[key] = name
+            groups[name] = []
+    return groups
+
+
+def _burn_cmd(ffmpeg: str, input_mp4: Path, vf: str, output_mp4: Path,
+              extra_outputs: dict = None) -> list:
+    """Build the burn command; with extra_outputs, decode once and split to every distinct profile."""
+    master = TRANSCODE_PROFILES["master"]
+    names = [n for n in _profile_groups(extra_outputs) if n != "master"]
+    if not names:
+        return [ffmpeg, "-i", str(input_mp4), "-vf", vf,
+                *_encode_args(master), "-c:a", "copy", "-y", str(output_mp4)]
+
+    graph = f"[0:v]{vf},split={len(names) + 1}[vm]" + "".join(f"[v{i}]" for i in range(len(names)))
+    for i, name in enumerate(names):
+        height = TRANSCODE_PROFILES[name].get("height")
+        scale = f"scale=-2:'min(ih,{height})'" if height else "null"
+        graph += f";[v{i}]{scale}[o{i}]"
+
+    cmd = [ffmpeg, "-i", str(input_mp4), "-filter_complex", graph, "-y",
+           "-map", "[vm]", "-map", "0:a?", *_encode_args(master), "-c:a", "copy", str(output_mp4)]
+    for i, name in enumerate(names):
+        cmd += ["-map", f"[o{i}]", "-map", "0:a?", *_encode_args(TRANSCODE_PROFILES[name]),
+                "-c:a", "copy", "-movflags", "+faststart", str(extra_outputs[name])]
+    return cmd
+
+
+def burn_subtitles(ffmpeg: str, input_mp4: Path, srt_path: Path, output_mp4: Path,
+                   label: str = "", trace: dict = None, extra_outputs: dict = None) -> bool:
     """Burn hardcoded subtitles into video using FFmpeg.
     
     Auto-detects platform to use the correct font:
     - Windows: Microsoft YaHei
     - macOS: PingFang SC (苹方) → Hiragino Sans GB → STHeiti → Arial Unicode MS
     - Linux: Noto Sans CJK SC → WenQuanYi Micro Hei → sans-serif
+
+    extra_outputs ({platform: path}, see profile_outputs()) are encoded in the
+    same ffmpeg run from a single decode, using TRANSCODE_PROFILES.
+
+    Encode progress (fps / speed / ETA) is streamed after `label`; run stats
+    are stored in trace["burn"] (with output sizes under "outputs").
     """
     import platform as _plat
     
@@ -562,13 +954,9 @@ def burn_subtitles(ffmpeg: str, input_mp4: Path, srt_path: Path, output_mp4: Pat
         f"PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,"
         f"Outline=2,MarginV=30'"
     )
-    result = subprocess.run(
-        [ffmpeg, "-i", str(input_mp4), "-vf", vf,
-         "-c:v", "libx264",  "-crf", "18", "-preset", "fast",
-         "-c:a", "copy", "-y", str(output_mp4)],
-        capture_output=True, text=True, encoding="utf-8", errors="replace",
-    )
-    if result.returncode != 0:
+    stats = run_ffmpeg_progress(_burn_cmd(ffmpeg, input_mp4, vf, output_mp4, extra_outputs),
+                                label=label)
+    if not stats["ok"] and not stats["stalled"]:
         # Retry without force_style font (let libass pick default)
         print(f"  {Y}subtitle burn failed with {font_name}, retrying with default font...{X}", flush=True)
         vf_fallback = (
@@ -577,13 +965,20 @@ def burn_subtitles(ffmpeg: str, input_mp4: Path, srt_path: Path, output_mp4: Pat
             f"PrimaryColour=&H00FFFFFF,OutlineColour=&H00000000,"
             f"Outline=2,MarginV=30'"
         )
-        result = subprocess.run(
-            [ffmpeg, "-i", str(input_mp4), "-vf", vf_fallback,
-             "-c:v", "libx264", "-crf", "18", "-preset", "fast",
-             "-c:a", "copy", "-y", str(output_mp4)],
-            capture_output=True, text=True, encoding="utf-8", errors="replace",
-        )
-    return result.returncode == 0
+        stats = run_ffmpeg_progress(_burn_cmd(ffmpeg, input_mp4, vf_fallback, output_mp4, extra_outputs),
+                                    label=label)
+    if stats["ok"]:
+        import shutil
+        # Profiles shared by several platforms were encoded once; copy the file
+        # (master duplicates need no copy, platform_video() falls back to master)
+        for name, dups in _profile_groups(extra_outputs).items():
+            for dup in dups if name != "master" else ():
+                shutil.copyfile(extra_outputs[name], extra_outputs[dup])
+        outputs = {"master": output_mp4, **(extra_outputs or {})}
+        stats["outputs"] = {name: path.stat().st_size for name, path in outputs.items() if path.exists()}
+    if trace is not None:
+        trace["burn"] = stats
+    return stats["ok"]
 
 
 def _detect_macos_cjk_font(ffmpeg: str = None) -> str:
@@ -637,19 +1032,22 @@ def _detect_linux_cjk_font() -> str:
     return "Noto Sans CJK SC"
 
 
-def ensure_bilibili_login() -> bool:
-    """Auto-login to Bilibili if cookies are missing.
+def ensure_bilibili_login(force: bool = False) -> bool:
+    """Auto-login to Bilibili if cookies are missing (or `force`: known expired).
 
     Two strategies (auto-fallback):
     1. Python API: call Bilibili TV QR login directly, display QR in terminal.
        Zero interactive menus — user just scans with Bilibili App.
     2. Bat fallback: write a temp .bat launching biliup.exe login in a new window.
     """
-    if COOKIE_FILE.exists():
+    if COOKIE_FILE.exists() and not force:
         print(f"  {G}✓ B站Cookie已缓存，跳过登录{X}", flush=True)
         return True
 
-    print(f"  {Y}! B站Cookie不存在，需要扫码登录{X}", flush=True)
+    if force:
+        print(f"  {Y}! B站Cookie已失效，需要重新扫码登录{X}", flush=True)
+    else:
+        print(f"  {Y}! B站Cookie不存在，需要扫码登录{X}", flush=True)
     COOKIE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # Strategy 1: Python API QR login (fully non-interactive)
@@ -759,6 +1157,335 @@ def _qr_login_api() -> bool:
     return False
 
 
+# ── Browser service (warm Playwright for WeChat) ────────────
+
+_browser_service_start_lock = threading.Lock()
+
+
+def _service_request(addr: dict, req: dict, timeout: float = BROWSER_SERVICE_TIMEOUT) -> dict | None:
+    """One request/response round trip.
+
+    None only if the service cannot be reached. Once the request is sent the
+    job belongs to the service: a timeout or dropped connection comes back as
+    {"ok": False, "error": ...} so the caller does not run it a second time.
+    """
+    import socket
+    try:
+        sock = socket.create_connection(("127.0.0.1", addr["port"]), timeout=5)
+    except (OSError, KeyError):
+        return None
+    buf = b""
+    with sock:
+        try:
+            sock.settimeout(timeout)
+            sock.sendall((json.dumps({**req, "token": addr["token"]}, ensure_ascii=False) + "\n").encode("utf-8"))
+            while not buf.endswith(b"\n"):
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+        except socket.timeout:
+            return {"ok": False, "error": f"browser service timeout ({int(timeout)}s)", "timeout": True}
+        except OSError as e:
+            return {"ok": False, "error": f"browser service: {e}"}
+    try:
+        return json.loads(buf)
+    except ValueError:
+        return {"ok": False, "error": "browser service closed the connection"}
+
+
+def _browser_service_addr(start: bool = True) -> dict | None:
+    """Address of a live browser service (src/workers/browser_service.py),
+    starting one in the background if none answers."""
+    def _live():
+        try:
+            addr = json.loads(BROWSER_SERVICE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return addr if (_service_request(addr, {"op": "ping"}, timeout=5) or {}).get("ok") else None
+
+    addr = _live()
+    if addr or not start:
+        return addr
+    with _browser_service_start_lock:
+        addr = _live()  # Another thread may have started it meanwhile
+        if addr:
+            return addr
+        import time
+        BROWSER_SERVICE_FILE.unlink(missing_ok=True)
+        BROWSER_SERVICE_LOG.parent.mkdir(parents=True, exist_ok=True)
+        detach = ({"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP} if sys.platform == "win32"
+                  else {"start_new_session": True})
+        with open(BROWSER_SERVICE_LOG, "a", encoding="utf-8") as log:
+            subprocess.Popen(
+                [sys.executable, "-u", str(PROJECT_ROOT / "src/workers/browser_service.py")],
+                stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT,
+                env={**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUNBUFFERED": "1"},
+                **detach,
+            )
+        deadline = time.time() + 30
+        while time.time() < deadline:
+            time.sleep(0.5)
+            addr = _live()
+            if addr:
+                return addr
+    return None
+
+
+def browser_service_call(op: str, timeout: float = BROWSER_SERVICE_TIMEOUT, **fields) -> dict | None:
+    """Run a job in the warm browser service; None if it is disabled or unreachable.
+
+    Only None means "run it elsewhere"; a failed job returns its error dict.
+    """
+    if not USE_BROWSER_SERVICE:
+        return None
+    addr = _browser_service_addr()
+    if addr is None:
+        return None
+    return _service_request(addr, {"op": op, **fields}, timeout)
+
+
+async def browser_service_call_async(op: str, **fields) -> dict | None:
+    """Async browser_service_call(); None only if the service is disabled or unreachable.
+
+    Cancellation (timeouts) closes the connection, which makes the service
+    cancel the job.
+    """
+    import asyncio
+    if not USE_BROWSER_SERVICE:
+        return None
+    addr = await asyncio.to_thread(_browser_service_addr)
+    if addr is None:
+        return None
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", addr["port"])
+    except OSError:
+        return None
+    try:
+        writer.write((json.dumps({"op": op, **fields, "token": addr["token"]}, ensure_ascii=False) + "\n").encode("utf-8"))
+        await writer.drain()
+        line = await reader.readline()
+        if not line:
+            return {"ok": False, "error": "browser service closed the connection"}
+        return json.loads(line)
+    except (OSError, ValueError) as e:
+        return {"ok": False, "error": f"browser service: {e}"}
+    finally:
+        writer.close()
+
+
+def _login_via_service(profile: str, name: str) -> bool | None:
+    """Login check/QR wait in the warm browser; None if the service is unavailable."""
+    if not USE_BROWSER_SERVICE:
+        return None
+    print(f"  {D}使用常驻浏览器检查{name}登录 (日志: cookies/{BROWSER_SERVICE_LOG.name}){X}", flush=True)
+    print(f"  {D}如浏览器中出现二维码，请用微信扫码并在手机上确认登录 (最多10分钟){X}", flush=True)
+    ret = browser_service_call("login", timeout=700, profile=profile)
+    if ret is None:
+        print(f"  {Y}浏览器服务不可用，改用独立浏览器{X}", flush=True)
+        return None
+    if ret.get("ok"):
+        print(f"  {G}✓ {name}{'已缓存登录，无需扫码' if ret.get('cached') else '登录成功!'}{X}", flush=True)
+        return True
+    print(f"  {R}{name}登录失败: {ret.get('error', '')}{X}", flush=True)
+    return False
+
+
+# ── Login health ────────────────────────────────────────────
+
+def _probe_bilibili() -> tuple[bool | None, str]:
+    """Bilibili: /x/web-interface/nav with the biliup cookies."""
+    if not COOKIE_FILE.exists():
+        return False, "no cookie"
+    import requests
+    try:
+        account = json.loads(COOKIE_FILE.read_text(encoding="utf-8"))
+        cookies = {c["name"]: c["value"] for c in account.get("cookie_info", {}).get("cookies", [])}
+        session = requests.Session()
+        session.trust_env = False  # Bypass proxy for Chinese Bilibili API
+        r = session.get("https://api.bilibili.com/x/web-interface/nav", cookies=cookies,
+                        headers={"User-Agent": "Mozilla/5.0"}, timeout=LOGIN_PROBE_TIMEOUT).json()
+    except (OSError, ValueError, KeyError, requests.RequestException) as e:
+        return None, str(e)
+    if r.get("code") == 0 and r.get("data", {}).get("isLogin"):
+        return True, r["data"].get("uname", "")
+    if r.get("code") == -101:  # 账号未登录
+        return False, "cookie expired"
+    return None, f"code {r.get('code')}: {r.get('message', '')}"
+
+
+def _probe_weixin_channels() -> tuple[bool | None, str]:
+    """WeChat Channels: auth_data with the cookies saved at the last login."""
+    try:
+        state = json.loads(WEIXIN_STORAGE_STATE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, "no storage state"
+    import time
+    now = time.time()
+    cookies = {c["name"]: c["value"] for c in state.get("cookies", [])
+               if "weixin.qq.com" in c.get("domain", "")
+               and (c.get("expires", -1) < 0 or c["expires"] > now)}
+    if not cookies:
+        return False, "cookies expired"
+    import requests
+    try:
+        session = requests.Session()
+        session.trust_env = False
+        r = session.post(
+            "https://channels.weixin.qq.com/cgi-bin/mmfinderassistant-bin/auth/auth_data",
+            json={"timestamp": str(int(now * 1000))}, cookies=cookies,
+            headers={"User-Agent": "Mozilla/5.0", "Origin": "https://channels.weixin.qq.com",
+                     "Referer": "https://channels.weixin.qq.com/platform/post/create"},
+            timeout=LOGIN_PROBE_TIMEOUT,
+        ).json()
+    except (OSError, ValueError, requests.RequestException) as e:
+        return None, str(e)
+    code = r.get("errCode")
+    if code == 0:
+        return True, r.get("data", {}).get("finderUser", {}).get("nickname", "")
+    return (False if code in WEIXIN_CHANNELS_AUTH_ERRORS else None), f"errCode {code}: {r.get('errMsg', '')}"
+
+
+def _probe_weixin_article() -> tuple[bool | None, str]:
+    """WeChat 公众号: an access token when API credentials are configured.
+
+    The browser fallback has no cheap probe (its session lives in the
+    Playwright profile), so that case is reported as unknown.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / ".env")
+    appid = os.getenv("WECHAT_APPID", "")
+    appsecret = os.getenv("WECHAT_APPSECRET", "")
+    if not appid or not appsecret or "your_" in appid or "your_" in appsecret:
+        return None, "browser session"
+    import requests
+    try:
+        r = requests.get("https://api.weixin.qq.com/cgi-bin/token",
+                         params={"grant_type": "client_credential", "appid": appid, "secret": appsecret},
+                         timeout=LOGIN_PROBE_TIMEOUT).json()
+    except (OSError, ValueError, requests.RequestException) as e:
+        return None, str(e)
+    if "access_token" in r:
+        return True, "api"
+    # Bad credentials fall back to the browser upload, so not "expired"
+    return None, f"api: {r.get('errmsg', 'token failed')}"
+
+
+class LoginHealth:
+    """Cached credential probes, one per platform.
+
+    check() returns True (session valid), False (expired — a QR login is
+    needed) or None (no cheap probe / probe failed: fall back to the
+    browser check). Valid results are cached in LOGIN_HEALTH_FILE for
+    LOGIN_HEALTH_TTL; anything else is re-probed on every check.
+    """
+
+    PROBES = {
+        "bilibili": _probe_bilibili,
+        "weixin_channels": _probe_weixin_channels,
+        "weixin_article": _probe_weixin_article,
+    }
+
+    def __init__(self, path: Path = LOGIN_HEALTH_FILE, ttl: float = LOGIN_HEALTH_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self._entries = None
+        self._stop = None
+
+    @property
+    def entries(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def record(self, platform: str, state: bool | None, detail: str = ""):
+        import time
+        with self.lock:
+            self.entries[platform] = {"ok": state, "checked": time.time(), "detail": detail}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8")
+                tmp.replace(self.path)
+            except OSError:
+                pass
+
+    def check(self, platform: str, force: bool = False) -> bool | None:
+        import time
+        entry = self.entries.get(platform)
+        if (not force and entry and entry.get("ok") is True
+                and time.time() - entry.get("checked", 0) < self.ttl):
+            return True
+        probe = self.PROBES.get(platform)
+        if probe is None:
+            return None
+        state, detail = probe()
+        self.record(platform, state, detail)
+        return state
+
+    def check_all(self, platforms: list[str], force: bool = False) -> dict:
+        """Probe `platforms` concurrently; {platform: True/False/None}."""
+        from concurrent.futures import ThreadPoolExecutor
+        platforms = [p for p in platforms if p in self.PROBES]
+        if not platforms:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(platforms)) as pool:
+            return dict(zip(platforms, pool.map(lambda p: self.check(p, force), platforms)))
+
+    def expired(self, platform: str) -> bool:
+        """Last probe said the session is gone."""
+        entry = self.entries.get(platform)
+        return bool(entry) and entry.get("ok") is False
+
+    def start_refresh(self, platforms: list[str], interval: float = LOGIN_REFRESH_INTERVAL):
+        """Re-probe in the background while the batch runs.
+
+        A WeChat session that expires mid-batch gets its QR login opened in
+        the warm browser service right away (instead of when the upload
+        reaches it). Without the service it is only flagged: a second
+        browser on the profile an upload may be driving would clash, so the
+        next upload logs in. Bilibili is re-logged-in at upload time
+        (terminal QR).
+        """
+        self.stop_refresh()
+        stop = self._stop = threading.Event()
+        relogin = {"weixin_channels": ("weixin", "微信视频号"),
+                   "weixin_article": ("weixin_mp", "微信公众号")}
+
+        def _loop():
+            while not stop.wait(interval):
+                before = {p: self.entries.get(p, {}).get("ok") for p in platforms}
+                for plat, state in self.check_all(platforms, force=True).items():
+                    # Act once, when a session goes from usable to expired
+                    if state is not False or before[plat] is False or stop.is_set():
+                        continue
+                    if plat in relogin:
+                        profile, name = relogin[plat]
+                        if not USE_BROWSER_SERVICE or _browser_service_addr() is None:
+                            print(f"\n  {Y}! {name}登录已失效，上传前将重新扫码{X}", flush=True)
+                            continue
+                        print(f"\n  {Y}! {name}登录已失效，请在浏览器中重新扫码{X}", flush=True)
+                        ok = _login_via_service(profile, name)
+                        if ok is not None:
+                            self.record(plat, ok, "login")
+                    else:
+                        print(f"\n  {Y}! B站Cookie已失效，上传前将重新扫码{X}", flush=True)
+
+        threading.Thread(target=_loop, daemon=True, name="login-health").start()
+
+    def stop_refresh(self):
+        if self._stop is not None:
+            self._stop.set()
+            self._stop = None
+
+
+LOGIN_HEALTH = LoginHealth()
+
+
 # ── WeChat Publishing ───────────────────────────────────────
 
 def ensure_weixin_login() -> bool:
@@ -768,9 +1495,16 @@ def ensure_weixin_login() -> bool:
     If not logged in, opens browser to channels.weixin.qq.com login page
     and waits for user to scan QR code + confirm on phone.
 
+    Runs in the warm browser service when available, so the upload that
+    follows reuses the same logged-in browser.
+
     Returns:
         True if logged in (or login succeeded), False otherwise.
     """
+    via_service = _login_via_service("weixin", "微信视频号")
+    if via_service is not None:
+        return via_service
+
     profile_dir = WEIXIN_STORAGE_STATE.parent / "browser_profile"
     profile_dir.mkdir(parents=True, exist_ok=True)
 
@@ -810,6 +1544,9 @@ def ensure_weixin_login() -> bool:
 
             if "post/create" in current_url:
                 print(f"  {G}✓ 微信视频号已缓存登录，无需扫码{X}", flush=True)
+                # Refresh the cookie snapshot the login health probe reads
+                WEIXIN_STORAGE_STATE.parent.mkdir(parents=True, exist_ok=True)
+                context.storage_state(path=str(WEIXIN_STORAGE_STATE))
             elif "login" in current_url.lower():
                 print(f"\n  {'='*50}")
                 print(f"  {Y}请用微信扫描浏览器中的二维码登录{X}")
@@ -891,9 +1628,15 @@ def ensure_weixin_mp_login() -> bool:
     Uses browser_profile directory to persist login across sessions.
     If not logged in, opens browser for QR scan and waits.
 
+    Runs in the warm browser service when available.
+
     Returns:
         True if logged in (or login succeeded), False otherwise.
     """
+    via_service = _login_via_service("weixin_mp", "微信公众号")
+    if via_service is not None:
+        return via_service
+
     WEIXIN_MP_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -1407,34 +2150,6 @@ def upload_weixin_channels(video_path: Path, title: str, desc: str, tags: str, c
         return {"ok": False, "error": str(e)}
 
 
-def upload_weixin_article(video_path: Path, title: str, desc: str, tags: str, cover_path: Path, srt_path: Path, bilibili_result: str) -> dict:
-    """Publish article to WeChat Official Account.
-
-    Strategy:
-    1. Try WeChat API (if WECHAT_APPID/WECHAT_APPSECRET configured in .env)
-    2. Fall back to Playwright browser automation (QR scan login)
-    """
-    from dotenv import load_dotenv
-    load_dotenv(PROJECT_ROOT / ".env")
-
-    appid = os.getenv("WECHAT_APPID", "")
-    appsecret = os.getenv("WECHAT_APPSECRET", "")
-    has_api_creds = appid and appsecret and "your_" not in appid and "your_" not in appsecret
-
-    # Generate article HTML content
-    html_content = generate_article_html(title, desc, srt_path, bilibili_result)
-
-    if has_api_creds:
-        # Strategy 1: WeChat API
-        ret = _upload_weixin_article_api(title, desc, html_content, cover_path, appid, appsecret)
-        if ret["ok"]:
-            return ret
-        print(f"      {Y}API方式失败 ({ret['error']})，尝试浏览器方式...{X}", flush=True)
-
-    # Strategy 2: Playwright subprocess
-    return _run_weixin_mp_subprocess(title, html_content, str(cover_path) if cover_path else None)
-
-
 def generate_article_html(title: str, desc: str, srt_path: Path, bilibili_result: str) -> str:
     """Generate HTML content for WeChat article from SRT transcript.
 
@@ -1539,41 +2254,6 @@ def _upload_weixin_article_api(title: str, desc: str, html_content: str, cover_p
         return {"ok": False, "error": str(e)}
 
 
-def _run_weixin_mp_subprocess(title: str, content_html: str, cover_path: str = None) -> dict:
-    """Run WeChat Official Account article upload in subprocess via Playwright."""
-    import tempfile
-
-    result_file = Path(tempfile.mktemp(suffix=".json", prefix="weixin_mp_result_"))
-    worker_script = PROJECT_ROOT / "_weixin_mp_upload_worker.py"
-
-    args_json = json.dumps({
-        "title": title,
-        "content_html": content_html,
-        "cover_path": cover_path,
-    }, ensure_ascii=False)
-
-    try:
-        proc = subprocess.run(
-            [sys.executable, "-u", str(worker_script), args_json, str(result_file)],
-            timeout=1200,
-            env={**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUNBUFFERED": "1"},
-        )
-        if result_file.exists():
-            ret = json.loads(result_file.read_text(encoding="utf-8"))
-            result_file.unlink(missing_ok=True)
-            return ret
-        elif proc.returncode != 0:
-            return {"ok": False, "error": f"Subprocess exit code {proc.returncode}"}
-        else:
-            return {"ok": False, "error": "No result from subprocess"}
-    except subprocess.TimeoutExpired:
-        return {"ok": False, "error": "Upload timeout (20min)"}
-    except Exception as e:
-        return {"ok": False, "error": f"Subprocess error: {e}"}
-    finally:
-        result_file.unlink(missing_ok=True)
-
-
 def _qr_login_bat() -> bool:
     """Fallback: launch biliup CLI login in a new terminal (Windows/macOS/Linux)."""
     import time
@@ -1789,15 +2469,24 @@ def _qr_login_bat() -> bool:
 
 
 def upload_bilibili(video_path, title: str, desc: str, tags: str,
-                    cover_path=None) -> dict:
-    """Upload video to Bilibili with title, desc, tags, and optional cover."""
+                    cover_path=None, tasks: int = None, rate_limit=None) -> dict:
+    """Upload video to Bilibili with title, desc, tags, and optional cover.
+
+    The file goes up in resumable chunks (src/upload_bilibili.upload_part):
+    a retry after a crash or network drop only sends the missing chunks.
+    `tasks` fixes chunk concurrency; None auto-tunes it to throughput.
+    `rate_limit` (upload_bilibili.RateLimit) paces the chunks. The result
+    carries the bytes sent and transfer time ("bytes", "transfer_s").
+    """
     video_path = Path(video_path) if not isinstance(video_path, Path) else video_path
     if cover_path:
         cover_path = Path(cover_path) if not isinstance(cover_path, Path) else cover_path
-    if not COOKIE_FILE.exists():
-        if not ensure_bilibili_login():
+    if not COOKIE_FILE.exists() or LOGIN_HEALTH.expired("bilibili"):
+        if not ensure_bilibili_login(force=COOKIE_FILE.exists()):
             return {"ok": False, "bvid": "", "error": "B站未登录"}
+        LOGIN_HEALTH.record("bilibili", True, "login")
 
+    submitted = False
     try:
         from biliup.plugins.bili_webup import BiliBili, Data
 
@@ -1824,48 +2513,351 @@ def upload_bilibili(video_path, title: str, desc: str, tags: str,
                 except Exception as e:
                     info(f"Cover upload failed ({e}), using auto-generated cover")
 
-            video_part = bili.upload_file(str(video_path), lines="AUTO", tasks=3)
+            src_dir = Path(__file__).resolve().parent / "src"
+            if str(src_dir) not in sys.path:
+                sys.path.insert(0, str(src_dir))
+            from upload_bilibili import upload_part
+
+            xfer = {}
+            video_part = upload_part(bili, account, video_path, tasks, rate_limit=rate_limit, trace=xfer)
             video_part["title"] = title[:80]
             data.append(video_part)
+            submitted = True  # From here a failure may still have created the post
             ret = bili.submit()
             bvid = ret.get("data", {}).get("bvid", "")
-            return {"ok": True, "bvid": bvid, "error": ""}
+            return {"ok": True, "bvid": bvid, "error": "",
+                    "bytes": xfer.get("bytes", 0), "transfer_s": xfer.get("seconds", 0.0)}
 
     except Exception as e:
-        return {"ok": False, "bvid": "", "error": str(e)}
+        return {"ok": False, "bvid": "", "error": str(e), "submitted": submitted}
 
 
 # ── Run history ─────────────────────────────────────────────
 
-def load_run_history() -> list:
-    """Load previous successful run records."""
+_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id     INTEGER PRIMARY KEY,
+    date   TEXT NOT NULL,
+    topic  TEXT NOT NULL,
+    job    TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_topic ON runs(topic);
+CREATE INDEX IF NOT EXISTS runs_date ON runs(date);
+CREATE TABLE IF NOT EXISTS uploads (
+    run_id   INTEGER NOT NULL REFERENCES runs(id),
+    platform TEXT NOT NULL,
+    status   TEXT NOT NULL,
+    ok       INTEGER NOT NULL,
+    PRIMARY KEY (run_id, platform)
+);
+CREATE INDEX IF NOT EXISTS uploads_failed ON uploads(ok, platform);
+CREATE TABLE IF NOT EXISTS throughput (
+    platform TEXT NOT NULL,
+    date     TEXT NOT NULL,
+    bytes    INTEGER NOT NULL,
+    seconds  REAL NOT NULL,
+    cap      REAL NOT NULL DEFAULT 0  -- RateLimit bytes/s the transfer ran under (0 = uncapped)
+);
+CREATE INDEX IF NOT EXISTS throughput_platform ON throughput(platform, date);
+"""
+
+
+def _history_db():
+    """Open the run-history database (WAL, safe for concurrent writers).
+
+    The first open of an empty database imports the legacy run_history.json,
+    if any, and renames it to run_history.json.imported once the import has
+    succeeded. A JSON file that cannot be read, or that shows up after the
+    database already has runs, is left untouched.
+    """
+    import sqlite3
+    RUN_HISTORY_DB.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(RUN_HISTORY_DB, timeout=30)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA busy_timeout=30000")
+    db.executescript(_HISTORY_SCHEMA)
+    if "cap" not in {row[1] for row in db.execute("PRAGMA table_info(throughput)")}:
+        db.execute("ALTER TABLE throughput ADD COLUMN cap REAL NOT NULL DEFAULT 0")
     if RUN_HISTORY_FILE.exists():
-        try:
-            return json.loads(RUN_HISTORY_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return []
-    return []
+        imported = False
+        db.execute("BEGIN IMMEDIATE")  # One importer even with concurrent first opens
+        with db:
+            if RUN_HISTORY_FILE.exists() and not db.execute("SELECT 1 FROM runs LIMIT 1").fetchone():
+                try:
+                    legacy = json.loads(RUN_HISTORY_FILE.read_text(encoding="utf-8"))
+                except Exception:
+                    legacy = None
+                if isinstance(legacy, list):
+                    for rec in legacy:
+                        _insert_run(db, rec)
+                    imported = True
+        if imported:
+            try:
+                RUN_HISTORY_FILE.replace(RUN_HISTORY_FILE.with_suffix(".json.imported"))
+            except OSError:
+                pass  # Runs are in the database; the next open skips the import
+    return db
+
+
+def _insert_run(db, record: dict) -> int:
+    cur = db.execute(
+        "INSERT INTO runs (date, topic, job, record) VALUES (?, ?, ?, ?)",
+        (record.get("date", ""), record.get("topic", ""), record.get("job"),
+         json.dumps(record, ensure_ascii=False)),
+    )
+    _write_uploads(db, cur.lastrowid, record.get("uploads", {}))
+    return cur.lastrowid
+
+
+def _write_uploads(db, run_id: int, uploads: dict):
+    db.executemany(
+        "INSERT OR REPLACE INTO uploads (run_id, platform, status, ok) VALUES (?, ?, ?, ?)",
+        [(run_id, plat, status, int(status.startswith("ok")))
+         for plat, status in uploads.items() if isinstance(status, str)],
+    )
+
+
+def load_run_history(limit: int = None) -> list:
+    """Load run records, oldest first (only the last `limit` when given)."""
+    try:
+        db = _history_db()
+    except Exception:
+        return []
+    try:
+        if limit:
+            rows = db.execute("SELECT record FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()[::-1]
+        else:
+            rows = db.execute("SELECT record FROM runs ORDER BY id").fetchall()
+        return [json.loads(r[0]) for r in rows]
+    finally:
+        db.close()
+
+
+def find_runs(topic: str = None, date: str = None) -> list[tuple[int, dict]]:
+    """Indexed lookup of (run_id, record) by exact topic and/or date prefix (YYYY-MM-DD)."""
+    where, params = [], []
+    if topic:
+        where.append("topic = ?")
+        params.append(topic)
+    if date:
+        # Range scan on the date index instead of LIKE
+        where.append("date >= ? AND date < ?")
+        params += [date, date + "\uffff"]
+    sql = "SELECT id, record FROM runs" + (f" WHERE {' AND '.join(where)}" if where else "") + " ORDER BY id"
+    db = _history_db()
+    try:
+        return [(rid, json.loads(rec)) for rid, rec in db.execute(sql, params)]
+    finally:
+        db.close()
 
 
-def save_run_record(record: dict):
-    """Append a successful run record to history."""
-    history = load_run_history()
-    history.append(record)
-    # Keep last 50 records
-    history = history[-50:]
-    RUN_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    RUN_HISTORY_FILE.write_text(json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8")
+def find_failed_uploads(platforms: list[str]) -> list[tuple[int, dict, list[str]]]:
+    """(run_id, record, failed platforms) for runs with a FAIL upload on `platforms`."""
+    if not platforms:
+        return []
+    marks = ",".join("?" * len(platforms))
+    db = _history_db()
+    try:
+        rows = db.execute(
+            f"SELECT r.id, r.record, group_concat(u.platform) FROM uploads u "
+            f"JOIN runs r ON r.id = u.run_id "
+            f"WHERE u.ok = 0 AND u.status LIKE 'FAIL%' AND u.platform IN ({marks}) "
+            f"GROUP BY r.id ORDER BY r.id",
+            platforms,
+        ).fetchall()
+    finally:
+        db.close()
+    return [(rid, json.loads(rec), plats.split(",")) for rid, rec, plats in rows]
+
+
+def save_run_record(record: dict) -> int:
+    """Append a run record to history; returns its run id."""
+    db = _history_db()
+    try:
+        with db:
+            return _insert_run(db, record)
+    finally:
+        db.close()
+
+
+def update_run_uploads(run_id: int, uploads: dict):
+    """Store new upload statuses for an existing run."""
+    db = _history_db()
+    try:
+        with db:
+            row = db.execute("SELECT record FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return
+            record = json.loads(row[0])
+            record["uploads"] = uploads
+            db.execute("UPDATE runs SET record = ? WHERE id = ?",
+                       (json.dumps(record, ensure_ascii=False), run_id))
+            _write_uploads(db, run_id, uploads)
+    finally:
+        db.close()
+
+
+def record_throughput(platform: str, nbytes: int, seconds: float, cap: float = 0):
+    """Store one measured upload transfer (bytes sent, seconds spent sending).
+
+    `cap` is the bandwidth plan's rate for the upload (bytes/s, 0 if none), so
+    platform_throughput() can tell a capped transfer from the link's speed.
+    """
+    if nbytes <= 0 or seconds <= 0:
+        return
+    db = _history_db()
+    try:
+        with db:
+            db.execute("INSERT INTO throughput (platform, date, bytes, seconds, cap) VALUES (?, ?, ?, ?, ?)",
+                       (platform, datetime.now().isoformat(), nbytes, seconds, cap or 0))
+    finally:
+        db.close()
+
+
+def platform_throughput(platform: str, window: int = THROUGHPUT_WINDOW) -> float | None:
+    """Median upload rate (bytes/s) over the last `window` transfers; None without history.
+
+    Transfers that ran at (or near) their RateLimit only show the cap, not
+    what the platform can take, and are left out; otherwise each plan would
+    feed its own cap back and the estimate would only ever shrink.
+    """
+    try:
+        db = _history_db()
+    except Exception:
+        return None
+    try:
+        rows = db.execute(
+            "SELECT bytes / seconds FROM throughput WHERE platform = ? AND (cap = 0 OR bytes / seconds < cap * ?)"
+            " ORDER BY date DESC LIMIT ?",
+            (platform, THROUGHPUT_CAPPED, window),
+        ).fetchall()
+    finally:
+        db.close()
+    if not rows:
+        return None
+    rates = sorted(r[0] for r in rows)
+    return rates[len(rates) // 2]
+
+
+# ── Job checkpoints ─────────────────────────────────────────
+
+JOB_STAGES = ["audio", "cover", "transcript", "srt", "burn", "upload"]
+JOB_STORE_NAME = "jobs.jsonl"  # Lives in the output base (output_subtitled/)
+
+
+def _quick_hash(path: Path, block: int = 1 << 20) -> str:
+    """Cheap content fingerprint: size + SHA-256 of the first and last `block` bytes."""
+    import hashlib
+    try:
+        size = path.stat().st_size
+        h = hashlib.sha256(str(size).encode())
+        with open(path, "rb") as f:
+            h.update(f.read(block))
+            if size > block:
+                f.seek(max(block, size - block))
+                h.update(f.read(block))
+        return h.hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+class JobStore:
+    """Append-only JSONL log of per-video stage checkpoints.
+
+    Each line records one completed stage of one job (a source video,
+    identified by _quick_hash) with its artifact paths, artifact hashes and
+    small stage data (segment count, durations, upload results). A restart
+    replays the log and resumes each video after its last stage whose
+    artifacts are still on disk unchanged.
+    """
+
+    def __init__(self, path: Path):
+        import threading
+        self.path = Path(path)
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._torn = False
+        if self.path.exists():
+            text = self.path.read_text(encoding="utf-8")
+            self._torn = bool(text) and not text.endswith("\n")
+            for line in text.splitlines():
+                try:
+                    self._apply(json.loads(line))
+                except (json.JSONDecodeError, KeyError):
+                    continue  # Torn last line from a crash
+
+    def _apply(self, entry: dict):
+        self.jobs.setdefault(entry["job"], {})[entry["stage"]] = entry
+
+    def checkpoint(self, job_id: str, stage: str, artifacts: dict = None, **data):
+        """Record `stage` as complete for `job_id` (fsync'd before returning)."""
+        entry = {
+            "job": job_id,
+            "stage": stage,
+            "ts": datetime.now().isoformat(),
+            "artifacts": {name: {"path": str(path), "hash": _quick_hash(Path(path))}
+                          for name, path in (artifacts or {}).items()},
+            "data": data,
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                if self._torn:
+                    f.write("\n")  # Don't glue onto a half-written line
+                    self._torn = False
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(entry)
+
+    def stage(self, job_id: str, stage: str) -> dict | None:
+        return self.jobs.get(job_id, {}).get(stage)
+
+    def completed(self, job_id: str) -> dict:
+        """Stages of `job_id` whose artifacts still exist with matching hashes."""
+        done = {}
+        for stage, entry in self.jobs.get(job_id, {}).items():
+            if all(_quick_hash(Path(a["path"])) == a["hash"] and a["hash"]
+                   for a in entry["artifacts"].values()):
+                done[stage] = entry
+        return done
+
+
+def _save_segments(segments: list, path: Path):
+    """Persist post-processed segments (transcript checkpoint)."""
+    data = [{"start": s.start, "end": s.end, "text": s.text,
+             "words": [{"start": w.start, "end": w.end, "word": w.word} for w in s.words] if s.words else None}
+            for s in segments]
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _load_segments(path: Path) -> list:
+    from types import SimpleNamespace
+    segments = []
+    for d in json.loads(path.read_text(encoding="utf-8")):
+        words = [SimpleNamespace(**w) for w in d["words"]] if d.get("words") else None
+        segments.append(SimpleNamespace(start=d["start"], end=d["end"], text=d["text"], words=words))
+    return segments
 
 
 def _run_weixin_channels_subprocess(video_path: Path, title: str, desc: str, tags: str, cover_path: Path = None) -> dict:
-    """Run WeChat Channels upload in a subprocess using async Playwright API.
+    """Run WeChat Channels upload in the warm browser service, or a subprocess.
 
     The main process's event loop state conflicts with Playwright's sync API.
-    This launches _weixin_upload_worker.py which uses the async API with asyncio.run()
-    in a clean subprocess, avoiding all event loop conflicts.
+    Without the service this launches src/workers/weixin_upload_worker.py, which
+    uses the async API with asyncio.run() in a clean subprocess, avoiding all
+    event loop conflicts.
     """
     import tempfile
 
+    ret = browser_service_call("upload_weixin_channels", args={
+        "video_path": str(video_path), "title": title, "desc": desc, "tags": tags,
+        "cover_path": str(cover_path) if cover_path else None,
+    })
+    if ret is not None:
+        return ret
+
     result_file = Path(tempfile.mktemp(suffix=".json", prefix="weixin_result_"))
     worker_script = PROJECT_ROOT / "src/workers/weixin_upload_worker.py"
 
@@ -1892,16 +2884,299 @@ def _run_weixin_channels_subprocess(video_path: Path, title: str, desc: str, tag
         else:
             return {"ok": False, "error": "No result from subprocess"}
     except subprocess.TimeoutExpired:
-        return {"ok": False, "error": "Upload timeout (20min)"}
+        return {"ok": False, "error": "Upload timeout (20min)", "timeout": True}
     except Exception as e:
         return {"ok": False, "error": f"Subprocess error: {e}"}
     finally:
         result_file.unlink(missing_ok=True)
 
 
+# ── Upload orchestrator ─────────────────────────────────────
+
+UPLOAD_TIMEOUT = 1200  # 20 min max per platform
+PLATFORM_LABELS = {"bilibili": "Bilibili", "weixin_channels": "WeChat视频号", "weixin_article": "WeChat公众号"}
+
+
+@dataclass
+class UploadResult:
+    """Outcome of one platform upload."""
+    platform: str
+    ok: bool
+    ref: str = ""        # bvid / publish_id
+    error: str = ""
+    elapsed: float = 0.0
+    phases: dict = field(default_factory=dict)  # phase -> seconds since start (browser uploads)
+    nbytes: int = 0         # Video bytes sent ...
+    transfer_s: float = 0.0  # ... and time spent sending them
+
+    @classmethod
+    def from_dict(cls, platform: str, ret: dict, elapsed: float = 0.0) -> "UploadResult":
+        ref = ret.get("bvid") or ret.get("publish_id") or ""
+        return cls(platform, bool(ret.get("ok")), ref, ret.get("error", ""), round(elapsed, 1),
+                   ret.get("phases") or {}, ret.get("bytes", 0), ret.get("transfer_s", 0.0))
+
+    @property
+    def rate(self) -> float:
+        """Measured upload rate in bytes/s (0 if not measured)."""
+        return self.nbytes / self.transfer_s if self.nbytes and self.transfer_s else 0.0
+
+    def status(self) -> str:
+        """Run-history status string: "ok", "ok:<ref>" or "FAIL:<error>"."""
+        if self.ok:
+            return f"ok:{self.ref}" if self.ref else "ok"
+        return f"FAIL:{self.error}"
+
+
+async def _run_worker_async(script: Path, args: dict, prefix: str) -> dict:
+    """Run an upload worker script (argv: args_json, result_file) without blocking the loop.
+
+    The worker is killed if the awaiting task is cancelled (timeout / Ctrl-C).
+    """
+    import asyncio
+    import tempfile
+
+    result_file = Path(tempfile.mktemp(suffix=".json", prefix=prefix))
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-u", str(script), json.dumps(args, ensure_ascii=False), str(result_file),
+        env={**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUNBUFFERED": "1"},
+    )
+    try:
+        await proc.wait()
+        if result_file.exists():
+            return json.loads(result_file.read_text(encoding="utf-8"))
+        elif proc.returncode != 0:
+            return {"ok": False, "error": f"Subprocess exit code {proc.returncode}"}
+        return {"ok": False, "error": "No result from subprocess"}
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        result_file.unlink(missing_ok=True)
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Await fn(*args, **kwargs) running in its own daemon thread.
+
+    Unlike asyncio.to_thread(), the thread is not in the loop's default
+    executor: when the awaiting task times out, asyncio.run() does not block
+    at shutdown waiting for it, and the abandoned call ends with the process.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def _settle(ok: bool, value):
+        if not fut.done():
+            fut.set_result(value) if ok else fut.set_exception(value)
+
+    def _call():
+        try:
+            ret, ok = fn(*args, **kwargs), True
+        except BaseException as e:
+            ret, ok = e, False
+        try:
+            loop.call_soon_threadsafe(_settle, ok, ret)
+        except RuntimeError:
+            pass  # Loop already closed (the caller gave up on this call)
+
+    threading.Thread(target=_call, daemon=True).start()
+    return await fut
+
+
+class Uploader(abc.ABC):
+    """One upload target. Subclasses implement upload() and may declare
+    depends_on: platforms whose results are passed in as `deps` (the
+    dependency only orders the uploads; a failed dependency still runs
+    this one). Blocking work goes through _run_blocking()."""
+
+    name = ""
+    depends_on: tuple = ()
+    timeout = UPLOAD_TIMEOUT
+
+    @abc.abstractmethod
+    async def upload(self, ctx: dict, deps: dict) -> dict:
+        """Upload ctx["video"]; returns the usual {"ok", "error", ...} dict."""
+
+
+def plan_bandwidth(platforms: list[str], budget: float) -> dict:
+    """Split `budget` (bytes/s) across the video uploads in `platforms`.
+
+    In UPLOAD_PRIORITY order each platform gets its historical rate (what
+    it can actually use), keeping UPLOAD_MIN_SHARE of the budget for each
+    one after it; the last gets what is left. Returns {platform: bytes/s},
+    empty without a budget.
+    """
+    video = [p for p in UPLOAD_PRIORITY if p in platforms]
+    if budget <= 0 or not video:
+        return {}
+    plan, left = {}, budget
+    for i, plat in enumerate(video):
+        waiting = len(video) - i - 1
+        share = left - waiting * budget * UPLOAD_MIN_SHARE
+        if waiting:
+            hist = platform_throughput(plat)
+            if hist:
+                share = min(share, hist)
+        plan[plat] = max(share, budget * UPLOAD_MIN_SHARE)
+        left -= plan[plat]
+    return plan
+
+
+def _bandwidth_limit(ctx: dict, platform: str):
+    """upload_bilibili.RateLimit for `platform`'s planned share; None when unlimited.
+
+    The limiter is kept in ctx so _orchestrate_uploads can hand it the
+    bandwidth of uploads that finish first.
+    """
+    bw = ctx.get("bandwidth")
+    if not bw or platform not in bw["plan"]:
+        return None
+    src_dir = Path(__file__).resolve().parent / "src"
+    if str(src_dir) not in sys.path:
+        sys.path.insert(0, str(src_dir))
+    from upload_bilibili import RateLimit
+    limit = bw["limits"][platform] = RateLimit(bw["plan"][platform])
+    return limit
+
+
+class BilibiliUploader(Uploader):
+    name = "bilibili"
+
+    async def upload(self, ctx, deps):
+        # biliup is synchronous; run it off the loop
+        return await _run_blocking(
+            upload_bilibili, platform_video(ctx["video"], self.name),
+            ctx["title"], ctx["desc"], ctx["tags"], ctx["cover"],
+            rate_limit=_bandwidth_limit(ctx, self.name))
+
+
+class WeixinChannelsUploader(Uploader):
+    name = "weixin_channels"
+
+    async def upload(self, ctx, deps):
+        args = {
+            "video_path": str(platform_video(ctx["video"], self.name)),
+            "title": ctx["title"],
+            "desc": ctx["desc"],
+            "tags": ctx["tags"],
+            "cover_path": str(ctx["cover"]) if ctx["cover"] else None,
+        }
+        bw = ctx.get("bandwidth")
+        if bw and self.name in bw["plan"]:
+            args["upload_limit"] = int(bw["plan"][self.name])  # Browser-side throttle, fixed per upload
+        # Prefer the warm browser service; otherwise a one-off worker process
+        # (its Playwright state must not mix with the sync Playwright used by
+        # the login helpers in this process)
+        ret = await browser_service_call_async("upload_weixin_channels", args=args)
+        if ret is not None:
+            return ret
+        return await _run_worker_async(PROJECT_ROOT / "src/workers/weixin_upload_worker.py",
+                                       args, prefix="weixin_result_")
+
+
+class WeixinArticleUploader(Uploader):
+    name = "weixin_article"
+    depends_on = ("bilibili",)  # Article embeds the BV link
+
+    async def upload(self, ctx, deps):
+        from dotenv import load_dotenv
+        load_dotenv(PROJECT_ROOT / ".env")
+
+        bili = deps.get("bilibili")
+        bili_info = bili.status() if bili and bili.ok else ctx["prior"].get("bilibili", "")
+        html_content = generate_article_html(ctx["title"], ctx["desc"], ctx["srt"], bili_info)
+
+        appid = os.getenv("WECHAT_APPID", "")
+        appsecret = os.getenv("WECHAT_APPSECRET", "")
+        if appid and appsecret and "your_" not in appid and "your_" not in appsecret:
+            ret = await _run_blocking(_upload_weixin_article_api, ctx["title"], ctx["desc"],
+                                      html_content, ctx["cover"], appid, appsecret)
+            if ret["ok"]:
+                return ret
+            print(f"      {Y}API方式失败 ({ret['error']})，尝试浏览器方式...{X}", flush=True)
+        return await _run_worker_async(PROJECT_ROOT / "_weixin_mp_upload_worker.py", {
+            "title": ctx["title"],
+            "content_html": html_content,
+            "cover_path": str(ctx["cover"]) if ctx["cover"] else None,
+        }, prefix="weixin_mp_result_")
+
+
+UPLOADERS = {u.name: u for u in (BilibiliUploader(), WeixinChannelsUploader(), WeixinArticleUploader())}
+
+
+async def _orchestrate_uploads(uploaders: list[Uploader], ctx: dict) -> dict:
+    import asyncio
+    import time
+
+    tasks = {}
+    running = {u.name for u in uploaders}
+    bw = ctx.get("bandwidth")
+
+    async def _run(u: Uploader) -> UploadResult:
+        # Dependencies outside this run (not selected / already uploaded) are skipped
+        deps = {d: await tasks[d] for d in u.depends_on if d in tasks}
+        t0 = time.monotonic()
+        try:
+            ret = await asyncio.wait_for(u.upload(ctx, deps), u.timeout)
+        except (asyncio.TimeoutError, TimeoutError):
+            # A blocking uploader may still be running in its daemon thread;
+            # it is abandoned and the upload is reported as timed out
+            ret = {"ok": False, "error": f"Upload timeout ({u.timeout // 60}min)"}
+        except Exception as e:
+            ret = {"ok": False, "error": str(e)}
+        finally:
+            running.discard(u.name)
+            if bw and bw["limits"]:
+                # Hand the finished upload's share to the ones still sending
+                plan = plan_bandwidth(running, bw["budget"])
+                for plat, limit in bw["limits"].items():
+                    if plat in plan:
+                        limit.rate = plan[plat]
+        return UploadResult.from_dict(u.name, ret, time.monotonic() - t0)
+
+    for u in uploaders:
+        tasks[u.name] = asyncio.ensure_future(_run(u))
+    try:
+        results = await asyncio.gather(*tasks.values())
+    finally:
+        for t in tasks.values():
+            t.cancel()
+    return {r.platform: r for r in results}
+
+
+def run_uploads(platforms: list[str], ctx: dict) -> dict:
+    """Upload to `platforms` concurrently, respecting Uploader.depends_on.
+
+    ctx: video (master mp4), title, desc, tags, cover, srt, prior (statuses
+    already uploaded for this video). Returns {platform: UploadResult}.
+
+    With UPLOAD_BANDWIDTH set, video uploads share that budget per
+    plan_bandwidth(). Measured rates are stored for later plans.
+    """
+    import asyncio
+    uploaders = [UPLOADERS[p] for p in platforms if p in UPLOADERS]
+    if not uploaders:
+        return {}
+    budget = UPLOAD_BANDWIDTH * 125_000  # Mbit/s -> bytes/s
+    plan = plan_bandwidth([u.name for u in uploaders], budget)
+    if plan:
+        info("Bandwidth: " + ", ".join(f"{PLATFORM_LABELS.get(p, p)} {r * 8 / 1e6:.1f}"
+                                       for p, r in plan.items()) + f" / {UPLOAD_BANDWIDTH:g} Mbit/s")
+    ctx = {**ctx, "bandwidth": {"budget": budget, "plan": plan, "limits": {}} if plan else None}
+    results = asyncio.run(_orchestrate_uploads(uploaders, ctx))
+    for r in results.values():
+        if r.rate:
+            try:
+                record_throughput(r.platform, r.nbytes, r.transfer_s, cap=plan.get(r.platform, 0))
+            except Exception:
+                pass  # Stats are best-effort
+    return results
+
+
 # ── Main pipeline ───────────────────────────────────────────
 
-def process_video(
+def prepare_video(
     video_path: Path,
     date_dir: Path,
     index: int,
@@ -1910,179 +3185,250 @@ def process_video(
     platforms: list[str],
     skip_upload: bool,
     workers: int = 3,
-) -> dict:
-    """Process a single video through the full downstream pipeline."""
+    in_memory_audio: bool = False,
+    trim_silence: bool = False,
+    store: JobStore = None,
+) -> tuple[dict, dict | None]:
+    """Local (CPU-bound) stages for one video: audio, cover, ASR, SRT, burn.
+
+    Returns (result, job); job is None when a step failed, otherwise it
+    carries what publish_video() needs for the upload stage.
+
+    With in_memory_audio, step 1 decodes PCM into shared memory that the
+    transcription workers slice directly; no {topic}.wav is written (falls
+    back to the WAV path if the in-memory extraction fails).
+
+    With a JobStore, each stage is checkpointed and stages already done for
+    this source video (artifacts unchanged on disk) are skipped.
+    """
     raw_name = video_path.stem
     topic = extract_topic(raw_name)
-    result = {"video": raw_name, "topic": topic, "subtitle": "FAIL", "uploads": {}}
+    result = {"video": raw_name, "topic": topic, "subtitle": "FAIL", "uploads": {}, "trace": {}}
 
     print(f"\n--- [{index}/{total}] {video_path.name} ---")
     print(f"  Topic: {C}{topic}{X}")
 
+    job_id = _quick_hash(video_path)
+    done = store.completed(job_id) if store else {}
+    chain = ["audio", "transcript", "srt", "burn"]
+
+    def _skip(stage: str) -> bool:
+        """A chain stage is skipped once it or any later chain stage is checkpointed."""
+        return any(s in done for s in chain[chain.index(stage):])
+
+    def _artifact(stage: str, name: str, default: Path) -> Path:
+        """Checkpointed artifact path (may be in an earlier date folder)."""
+        if stage in done and name in done[stage]["artifacts"]:
+            return Path(done[stage]["artifacts"][name]["path"])
+        return default
+
+    if done:
+        info(f"Resuming from checkpoint ({', '.join(s for s in JOB_STAGES if s in done)})")
+
     # Step 1: Extract audio
-    wav_path = date_dir / f"{topic}.wav"
-    print(f"[1/7] Extract audio......... ", end="", flush=True)
-    if extract_audio(ffmpeg, video_path, wav_path):
-        ok("")
+    wav_path = _artifact("audio", "wav", date_dir / f"{topic}.wav")
+    pcm = None
+    label = "[1/7] Extract audio......... "
+    print(label, end="", flush=True)
+    if _skip("audio"):
+        ok("(checkpoint)")
     else:
-        fail("FFmpeg audio extraction failed")
-        return result
+        if in_memory_audio:
+            import time
+            src_dir = Path(__file__).resolve().parent / "src"
+            if str(src_dir) not in sys.path:
+                sys.path.insert(0, str(src_dir))
+            from transcribe import extract_audio_shared
+            t_audio = time.time()
+            pcm = extract_audio_shared(ffmpeg, video_path)
+            elapsed = round(time.time() - t_audio, 2)
+            if pcm is None:
+                info("(in-memory extraction failed, falling back to WAV)")
+                print(label, end="", flush=True)
+        if pcm is not None:
+            result["trace"]["audio"] = {
+                "ok": True, "in_memory": True, "elapsed": elapsed, "duration": round(pcm.duration, 2),
+                "speed": round(pcm.duration / elapsed, 2) if elapsed > 0 else 0.0,
+            }
+            ok(f"(in memory, {pcm.n_samples * 2 / 1e6:.0f} MB, {_throughput_str(result['trace']['audio'])})")
+        elif extract_audio(ffmpeg, video_path, wav_path, label=label, trace=result["trace"]):
+            ok(f"({_throughput_str(result['trace']['audio'])})")
+            if store:
+                store.checkpoint(job_id, "audio", {"wav": wav_path})
+        else:
+            fail(f"FFmpeg audio extraction failed: {result['trace']['audio']['error'][-200:]}")
+            return result, None
 
-    # Step 2: Extract cover (first frame)
-    cover_path = date_dir / f"{topic}_cover.jpg"
+    # Step 2: Extract cover (best-scoring keyframe)
+    cover_path = _artifact("cover", "cover", date_dir / f"{topic}_cover.jpg")
     print(f"[2/7] Extract cover......... ", end="", flush=True)
-    if extract_cover(ffmpeg, video_path, cover_path):
+    if "cover" in done:
+        ok(f"(checkpoint) -> {cover_path.name}")
+    elif extract_cover(ffmpeg, video_path, cover_path):
         ok(f"-> {cover_path.name}")
+        if store:
+            store.checkpoint(job_id, "cover", {"cover": cover_path})
     else:
         info("(failed, will use default)")
         cover_path = None
 
     # Step 3: Transcribe
+    segments_path = _artifact("transcript", "segments", date_dir / f"{topic}.segments.json")
     print(f"[3/7] Transcribe............ ", end="", flush=True)
-    try:
-        segments = transcribe(wav_path, workers=workers)
-        total_dur = segments[-1].end if segments else 0
-        mins, secs = int(total_dur) // 60, int(total_dur) % 60
-        duration_str = f"{mins}:{secs:02d}"
-        # Deduplicate consecutive identical/near-identical segments
-        segments, dup_count = deduplicate_segments(segments)
-        # Convert Traditional Chinese to Simplified Chinese
-        for seg in segments:
-            seg.text = t2s(seg.text)
-            if seg.words:
-                for w in seg.words:
-                    w.word = t2s(w.word)
-        dup_info = f", {dup_count} duplicates removed" if dup_count else ""
-        ok(f"({len(segments)} segments, {duration_str}{dup_info})")
-    except Exception as e:
-        fail(str(e))
-        return result
-
-    # Step 3b: Verify subtitles (second-pass)
-    src_dir = Path(__file__).resolve().parent / "src"
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-    from transcribe import verify_segments
-    segments, fixes = verify_segments(segments)
-    if fixes:
-        print(f"      {Y}Verify:{X} {len(fixes)} fixes applied")
-        for fix in fixes:
-            print(f"        {D}{fix}{X}")
+    if _skip("transcript"):
+        duration_str = store.stage(job_id, "transcript")["data"]["duration"]
+        segments = _load_segments(segments_path) if "transcript" in done and not _skip("srt") else None
+        ok(f"(checkpoint, {duration_str})")
+    else:
+        try:
+            try:
+                segments = transcribe(wav_path, workers=workers, pcm=pcm, trim_silence=trim_silence)
+            finally:
+                if pcm is not None:
+                    pcm.close()
+            total_dur = segments[-1].end if segments else 0
+            mins, secs = int(total_dur) // 60, int(total_dur) % 60
+            duration_str = f"{mins}:{secs:02d}"
+            # Deduplicate consecutive identical/near-identical segments
+            segments, dup_count = deduplicate_segments(segments)
+            # Convert Traditional Chinese to Simplified Chinese
+            for seg in segments:
+                seg.text = t2s(seg.text)
+                if seg.words:
+                    for w in seg.words:
+                        w.word = t2s(w.word)
+            dup_info = f", {dup_count} duplicates removed" if dup_count else ""
+            ok(f"({len(segments)} segments, {duration_str}{dup_info})")
+        except Exception as e:
+            fail(str(e))
+            return result, None
+
+        # Step 3b: Verify subtitles (second-pass)
+        src_dir = Path(__file__).resolve().parent / "src"
+        if str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+        from transcribe import verify_segments
+        segments, fixes = verify_segments(segments)
+        if fixes:
+            print(f"      {Y}Verify:{X} {len(fixes)} fixes applied")
+            for fix in fixes:
+                print(f"        {D}{fix}{X}")
+        if store:
+            _save_segments(segments, segments_path)
+            store.checkpoint(job_id, "transcript", {"segments": segments_path}, duration=duration_str)
 
     # Step 4: Generate SRT (with smart chunking)
-    srt_path = date_dir / f"{topic}.srt"
+    srt_path = _artifact("srt", "srt", date_dir / f"{topic}.srt")
     print(f"[4/7] Generate SRT.......... ", end="", flush=True)
-    count = generate_srt(segments, srt_path)
-    ok(f"({count} subtitles) -> {date_dir.name}/{topic}.srt")
+    if _skip("srt"):
+        srt_path = Path(store.stage(job_id, "srt")["artifacts"]["srt"]["path"])
+        count = store.stage(job_id, "srt")["data"]["count"]
+        ok(f"(checkpoint, {count} subtitles) -> {srt_path.parent.name}/{srt_path.name}")
+    else:
+        count = generate_srt(segments, srt_path)
+        ok(f"({count} subtitles) -> {date_dir.name}/{topic}.srt")
+        if store:
+            store.checkpoint(job_id, "srt", {"srt": srt_path}, count=count)
     result["subtitle"] = "ok"
     result["sub_count"] = count
 
     # Step 5: Burn subtitles
     output_mp4 = date_dir / f"{topic}.mp4"
-    print(f"[5/7] Burn subtitles........ ", end="", flush=True)
-    if burn_subtitles(ffmpeg, video_path, srt_path, output_mp4):
-        ok(f"-> {date_dir.name}/{topic}.mp4")
+    extra_outputs = {} if skip_upload else profile_outputs(output_mp4, platforms)
+    label = "[5/7] Burn subtitles........ "
+    print(label, end="", flush=True)
+    if "burn" in done:
+        burned = done["burn"]["artifacts"]
+        output_mp4 = Path(burned["master"]["path"])
+        extra_outputs = {p: Path(a["path"]) for p, a in burned.items() if p != "master"}
+        ok(f"(checkpoint) -> {output_mp4.parent.name}/{output_mp4.name}")
+    elif burn_subtitles(ffmpeg, video_path, srt_path, output_mp4, label=label, trace=result["trace"],
+                        extra_outputs=extra_outputs):
+        ok(f"-> {date_dir.name}/{topic}.mp4 ({_throughput_str(result['trace']['burn'])})")
+        sizes = result["trace"]["burn"].get("outputs", {})
+        if extra_outputs:
+            info("Profiles: " + ", ".join(f"{name} {size / 1e6:.1f} MB" for name, size in sizes.items()))
+        if store:
+            store.checkpoint(job_id, "burn", {"master": output_mp4, **extra_outputs})
     else:
-        fail("FFmpeg subtitle burn failed")
-        return result
+        fail(f"FFmpeg subtitle burn failed: {result['trace']['burn']['error'][-200:]}")
+        return result, None
+
+    job = {
+        "video_path": video_path, "wav_path": wav_path, "topic": topic, "raw_name": raw_name,
+        "cover_path": cover_path, "srt_path": srt_path, "output_mp4": output_mp4,
+        "extra_outputs": extra_outputs, "count": count, "duration_str": duration_str,
+        "job_id": job_id, "segments_path": segments_path,
+    }
+    return result, job
+
+
+def publish_video(result: dict, job: dict, platforms: list[str], skip_upload: bool,
+                  store: JobStore = None) -> dict:
+    """Upload stage for a prepared video (steps 6-7) and run-history record.
+
+    Platforms already uploaded for this job (JobStore "upload" checkpoint)
+    are not uploaded again.
+    """
+    video_path, wav_path = job["video_path"], job["wav_path"]
+    topic, raw_name = job["topic"], job["raw_name"]
+    cover_path, srt_path, output_mp4 = job["cover_path"], job["srt_path"], job["output_mp4"]
+    extra_outputs, count, duration_str = job["extra_outputs"], job["count"], job["duration_str"]
+    job_id = job["job_id"]
+
+    prev = store.stage(job_id, "upload") if store else None
+    prior = {p: v for p, v in (prev["data"].get("uploads", {}) if prev else {}).items()
+             if p in platforms and v.startswith("ok")}
+    result["uploads"].update(prior)
 
     # Step 6: Upload with smart title/desc/tags
     title = make_title(topic)
     desc = make_desc(topic, count, duration_str)
     tags = make_tags(topic)
 
-    print(f"[6/7] Upload:")
+    print(f"[6/7] Upload: {C}{topic}{X}")
     info(f"Title: {title}")
     info(f"Tags:  {tags}")
 
     if skip_upload:
         info("(skipped)")
     else:
-        # Async upload: launch all platforms concurrently (先登先传)
-        # Each upload function handles its own login inline
-        import threading
-
-        upload_results = {}
-        upload_lock = threading.Lock()
-
-        def _upload_platform(plat_name, upload_func, args_tuple):
-            """Run platform upload in a thread; store result."""
-            try:
-                ret = upload_func(*args_tuple)
-            except Exception as e:
-                ret = {"ok": False, "error": str(e)}
-            with upload_lock:
-                upload_results[plat_name] = ret
-
-        upload_threads = []
+        # Async upload: all platforms concurrently (先登先传); weixin_article
+        # waits for the Bilibili BV link. Each uploader handles its own login.
+        pending = [p for p in platforms if p not in prior]
         for plat in platforms:
-            if plat == "bilibili":
-                t = threading.Thread(
-                    target=_upload_platform,
-                    args=("bilibili", upload_bilibili,
-                          (output_mp4, title, desc, tags, cover_path)),
-                    daemon=True,
-                )
-                upload_threads.append(("bilibili", t))
-                t.start()
-            elif plat == "weixin_channels":
-                t = threading.Thread(
-                    target=_upload_platform,
-                    args=("weixin_channels", _run_weixin_channels_subprocess,
-                          (output_mp4, title, desc, tags, cover_path)),
-                    daemon=True,
-                )
-                upload_threads.append(("weixin_channels", t))
-                t.start()
-            elif plat == "weixin_article":
-                # weixin_article depends on bilibili result for BV link — defer
-                upload_threads.append(("weixin_article", None))
-            else:
+            if plat in prior:
+                print(f"      {PLATFORM_LABELS.get(plat, plat)}  {G}ok{X}  (checkpoint: {prior[plat]})")
+            elif plat not in UPLOADERS:
                 print(f"      {plat.capitalize()}  {Y}-{X}  (not implemented)")
                 result["uploads"][plat] = "-"
 
-        # Wait for all async uploads (except deferred)
-        for plat_name, t in upload_threads:
-            if t is not None:
-                t.join(timeout=1200)  # 20 min max per platform
-
-        # Handle deferred weixin_article (needs bilibili BV link)
-        if "weixin_article" in platforms:
-            bili_result = upload_results.get("bilibili", {})
-            bili_info = f"ok:{bili_result.get('bvid','')}" if bili_result.get("ok") else ""
-            ret = upload_weixin_article(output_mp4, title, desc, tags, cover_path, srt_path, bili_info)
-            upload_results["weixin_article"] = ret
+        upload_results = run_uploads(pending, {
+            "video": output_mp4, "title": title, "desc": desc, "tags": tags,
+            "cover": cover_path, "srt": srt_path, "prior": prior,
+        })
 
         # Report results
         for plat in platforms:
             if plat in upload_results:
                 ret = upload_results[plat]
-                if plat == "bilibili":
-                    if ret.get("ok"):
-                        print(f"      Bilibili  {G}ok{X}  {ret.get('bvid','')}")
-                        result["uploads"]["bilibili"] = f"ok:{ret.get('bvid','')}"
-                    else:
-                        print(f"      Bilibili  {R}FAIL{X}  {ret.get('error','')}")
-                        result["uploads"]["bilibili"] = f"FAIL:{ret.get('error','')}"
-                elif plat == "weixin_channels":
-                    if ret.get("ok"):
-                        print(f"      WeChat视频号  {G}ok{X}")
-                        result["uploads"]["weixin_channels"] = "ok"
-                    else:
-                        print(f"      WeChat视频号  {R}FAIL{X}  {ret.get('error','')}")
-                        result["uploads"]["weixin_channels"] = f"FAIL:{ret.get('error','')}"
-                elif plat == "weixin_article":
-                    if ret.get("ok"):
-                        print(f"      WeChat公众号  {G}ok{X}  {ret.get('publish_id','')}")
-                        result["uploads"]["weixin_article"] = f"ok:{ret.get('publish_id','')}"
-                    else:
-                        print(f"      WeChat公众号  {R}FAIL{X}  {ret.get('error','')}")
-                        result["uploads"]["weixin_article"] = f"FAIL:{ret.get('error','')}"
+                label = PLATFORM_LABELS.get(plat, plat)
+                rate = f", {ret.rate / 1e6:.1f} MB/s" if ret.rate else ""
+                if ret.ok:
+                    print(f"      {label}  {G}ok{X}  {ret.ref}  {D}({ret.elapsed:.0f}s{rate}){X}")
+                else:
+                    print(f"      {label}  {R}FAIL{X}  {ret.error}")
+                result["uploads"][plat] = ret.status()
+                result["trace"].setdefault("uploads", {})[plat] = {
+                    "elapsed": ret.elapsed, "phases": ret.phases,
+                    "bytes": ret.nbytes, "transfer_s": ret.transfer_s,
+                }
 
     # Step 7: Cleanup
     print(f"[7/7] Cleanup............... ", end="", flush=True)
     try:
         wav_path.unlink(missing_ok=True)
+        job["segments_path"].unlink(missing_ok=True)
         if cover_path:
             cover_path.unlink(missing_ok=True)
         # Only delete original if upload succeeded (or was skipped)
@@ -2091,15 +3437,22 @@ def process_video(
         )
         if upload_ok:
             video_path.unlink(missing_ok=True)
+            # Platform encodes are only kept around for --retry
+            for path in extra_outputs.values():
+                path.unlink(missing_ok=True)
             ok("(original + temp deleted)")
         else:
             ok("(temp deleted, original kept — upload failed)")
     except Exception as e:
         fail(str(e))
 
+    if store and not skip_upload:
+        store.checkpoint(job_id, "upload", uploads=result["uploads"])
+
     # Save run history
     record = {
         "date": datetime.now().isoformat(),
+        "job": job_id,
         "topic": topic,
         "file": raw_name,
         "subtitles": count,
@@ -2107,19 +3460,92 @@ def process_video(
         "title": title,
         "tags": tags,
         "uploads": result["uploads"],
+        "trace": result["trace"],
     }
     save_run_record(record)
 
     return result
 
 
+def process_video(
+    video_path: Path,
+    date_dir: Path,
+    index: int,
+    total: int,
+    ffmpeg: str,
+    platforms: list[str],
+    skip_upload: bool,
+    workers: int = 3,
+    in_memory_audio: bool = False,
+    trim_silence: bool = False,
+    store: JobStore = None,
+) -> dict:
+    """Process a single video through the full downstream pipeline."""
+    result, job = prepare_video(video_path, date_dir, index, total, ffmpeg, platforms,
+                                skip_upload, workers, in_memory_audio, trim_silence, store)
+    if job is None:
+        return result
+    return publish_video(result, job, platforms, skip_upload, store)
+
+
+def run_pipeline(videos: list[Path], date_dir: Path, ffmpeg: str, platforms: list[str],
+                 skip_upload: bool, workers: int = 3, in_memory_audio: bool = False,
+                 trim_silence: bool = False, store: JobStore = None,
+                 depth: int = PIPELINE_DEPTH) -> list[dict]:
+    """Process videos as a two-stage pipeline: local work overlaps uploads.
+
+    A background thread runs prepare_video() (extract → transcribe → burn)
+    for video N+1 while the caller's thread uploads video N. The queue
+    between them is bounded by `depth` so finished-but-unuploaded videos
+    cannot pile up on disk. Results are returned in input order.
+    """
+    import queue
+    import threading
+
+    ready = queue.Queue(maxsize=depth)
+    done = object()
+
+    def _prepare_all():
+        _OUTPUT.quiet_progress = True  # Uploads print concurrently on the main thread
+        try:
+            for i, video in enumerate(videos, 1):
+                try:
+                    item = prepare_video(video, date_dir, i, len(videos), ffmpeg, platforms,
+                                         skip_upload, workers, in_memory_audio, trim_silence, store)
+                except Exception as e:
+                    fail(f"{video.name}: {e}")
+                    item = ({"video": video.stem, "topic": extract_topic(video.stem),
+                             "subtitle": "FAIL", "uploads": {}, "trace": {}}, None)
+                ready.put((i, item))
+        finally:
+            ready.put(done)
+
+    producer = threading.Thread(target=_prepare_all, daemon=True)
+    producer.start()
+
+    results = {}
+    while True:
+        item = ready.get()
+        if item is done:
+            break
+        i, (result, job) = item
+        if job is not None:
+            result = publish_video(result, job, platforms, skip_upload, store)
+        results[i] = result
+    producer.join()
+    return [results[i] for i in sorted(results)]
+
+
 def ensure_all_logins(platforms: list[str]) -> dict:
     """Pre-authenticate all platforms concurrently before uploading.
 
-    Phase 1: Quick cache/credential check for all platforms
+    Phase 1: Credential probes for all platforms (LoginHealth, cached with a TTL)
     Phase 2: Start all needed QR logins at once (B站 terminal + WeChat browsers)
     Phase 3: Wait for all to complete and report results
 
+    Platforms whose probe confirms a live session skip the browser check;
+    ones without a usable probe are verified as before.
+
     Returns:
         dict mapping platform -> bool (True=ready, False=failed)
     """
@@ -2128,33 +3554,46 @@ def ensure_all_logins(platforms: list[str]) -> dict:
     results = {}
     need_login = []
 
-    # ── Phase 1: Cache check ──
+    # ── Phase 1: Credential probes ──
     print(f"\n  {B}[登录预检]{X} 检查各平台认证状态")
+    probed = LOGIN_HEALTH.check_all(platforms)
 
     if "bilibili" in platforms:
-        if COOKIE_FILE.exists():
-            print(f"    B站:       {G}✓ Cookie已缓存{X}")
+        state = probed.get("bilibili")
+        if state is True:
+            print(f"    B站:       {G}✓ 会话有效{X}")
+            results["bilibili"] = True
+        elif state is None and COOKIE_FILE.exists():
+            print(f"    B站:       {G}✓ Cookie已缓存{X} {D}(未能验证){X}")
             results["bilibili"] = True
         else:
-            print(f"    B站:       {Y}! 需要扫码登录{X}")
+            print(f"    B站:       {Y}! {'Cookie已失效，' if COOKIE_FILE.exists() else ''}需要扫码登录{X}")
             need_login.append("bilibili")
 
     if "weixin_channels" in platforms:
         profile_dir = WEIXIN_STORAGE_STATE.parent / "browser_profile"
         has_profile = profile_dir.exists() and any(profile_dir.iterdir()) if profile_dir.exists() else False
-        if has_profile:
-            print(f"    微信视频号: {D}有缓存，需浏览器验证{X}")
+        if probed.get("weixin_channels") is True:
+            print(f"    微信视频号: {G}✓ 会话有效{X}")
+            results["weixin_channels"] = True
         else:
-            print(f"    微信视频号: {Y}! 需要扫码登录{X}")
-        need_login.append("weixin_channels")
+            if has_profile and probed.get("weixin_channels") is None:
+                print(f"    微信视频号: {D}有缓存，需浏览器验证{X}")
+            else:
+                print(f"    微信视频号: {Y}! 需要扫码登录{X}")
+            need_login.append("weixin_channels")
 
     if "weixin_article" in platforms:
         has_profile = WEIXIN_MP_PROFILE_DIR.exists() and any(WEIXIN_MP_PROFILE_DIR.iterdir()) if WEIXIN_MP_PROFILE_DIR.exists() else False
-        if has_profile:
-            print(f"    微信公众号: {D}有缓存，需浏览器验证{X}")
+        if probed.get("weixin_article") is True:
+            print(f"    微信公众号: {G}✓ API凭证有效{X}")
+            results["weixin_article"] = True
         else:
-            print(f"    微信公众号: {Y}! 需要扫码登录{X}")
-        need_login.append("weixin_article")
+            if has_profile:
+                print(f"    微信公众号: {D}有缓存，需浏览器验证{X}")
+            else:
+                print(f"    微信公众号: {Y}! 需要扫码登录{X}")
+            need_login.append("weixin_article")
 
     if not need_login:
         print(f"\n  {G}✓ 所有平台已就绪!{X}\n")
@@ -2193,12 +3632,16 @@ def ensure_all_logins(platforms: list[str]) -> dict:
 
     # B站 login in main thread (terminal QR code — no thread conflicts)
     if has_bilibili:
-        results["bilibili"] = ensure_bilibili_login()
+        results["bilibili"] = ensure_bilibili_login(force=COOKIE_FILE.exists())
 
     # Wait for all background threads
     for t in threads:
         t.join(timeout=720)
 
+    for plat in need_login:
+        if plat in results:
+            LOGIN_HEALTH.record(plat, results[plat] or False, "login")
+
     # ── Phase 3: Summary ──
     print(f"\n  {B}[登录结果]{X}")
     failed = []
@@ -2221,41 +3664,109 @@ def ensure_all_logins(platforms: list[str]) -> dict:
     return results
 
 
+def run_upload_retries(tasks: list[dict], global_limit: int = RETRY_GLOBAL_LIMIT,
+                       platform_limits: dict = None, attempts: int = RETRY_ATTEMPTS,
+                       attempt_timeout: float = RETRY_ATTEMPT_TIMEOUT) -> dict:
+    """Run upload tasks concurrently with per-platform and global caps.
+
+    Each task is {"key", "platform", "label", "fn", "args"}; fn(*args) returns
+    the usual {"ok": bool, "error": str, ...} dict. A failed attempt is retried
+    up to `attempts` times with full-jitter exponential backoff; caps are
+    released while backing off so other uploads keep the slots busy.
+
+    Each attempt runs in a daemon thread joined with `attempt_timeout`. An
+    attempt that hits the deadline is recorded as failed and not retried in
+    this run (it may still be publishing), so the next --retry picks it up;
+    its slots stay taken until the thread actually exits, so an abandoned
+    upload never shares a browser profile with the next one. Results marked
+    "timeout" (outcome unknown) or "submitted" (failed after the submit /
+    publish request went out) are not retried either, so a video is never
+    posted twice.
+
+    Returns {key: last result}.
+    """
+    import random
+    import threading
+    import time
+
+    limits = {**RETRY_PLATFORM_LIMITS, **(platform_limits or {})}
+    global_sem = threading.BoundedSemaphore(global_limit)
+    plat_sems = {p: threading.BoundedSemaphore(limits.get(p, 1)) for p in {t["platform"] for t in tasks}}
+    results = {}
+    lock = threading.Lock()
+
+    def _attempt(task) -> dict:
+        box = {}
+        slots = (plat_sems[task["platform"]], global_sem)
+
+        def _call():
+            try:
+                box["ret"] = task["fn"](*task["args"])
+            except Exception as e:
+                box["ret"] = {"ok": False, "error": str(e)}
+            finally:
+                for sem in slots:  # Released when the upload really ends, not at the deadline
+                    sem.release()
+
+        for sem in slots:
+            sem.acquire()
+        worker = threading.Thread(target=_call, daemon=True)
+        worker.start()
+        worker.join(timeout=attempt_timeout)
+        if worker.is_alive():
+            return {"ok": False, "error": f"timed out after {int(attempt_timeout)}s", "timeout": True}
+        return box.get("ret", {"ok": False, "error": "no result"})
+
+    def _run(task):
+        ret = {"ok": False, "error": "not started"}
+        for attempt in range(1, attempts + 1):
+            ret = _attempt(task)
+            if ret.get("ok"):
+                with lock:
+                    print(f"    {task['label']}  {G}ok{X}  {ret.get('bvid', '')}", flush=True)
+                break
+            if attempt < attempts and not ret.get("timeout") and not ret.get("submitted"):
+                delay = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (attempt - 1)))
+                with lock:
+                    print(f"    {task['label']}  {Y}retry {attempt}/{attempts - 1} in {delay:.0f}s{X}  "
+                          f"{ret.get('error', '')}", flush=True)
+                time.sleep(delay)
+            else:
+                with lock:
+                    print(f"    {task['label']}  {R}FAIL{X}  {ret.get('error', '')}", flush=True)
+                break
+        with lock:
+            results[task["key"]] = ret
+
+    threads = [threading.Thread(target=_run, args=(t,), daemon=True) for t in tasks]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
 def _retry_failed_uploads(output_base: Path, platforms: list[str]):
     """Retry uploading subtitled videos that previously failed upload.
     
-    Scans run_history.json for entries with FAIL uploads, finds the corresponding
-    subtitled video in output_subtitled/, and re-uploads to the failed platforms.
+    Queries the run-history index for FAIL uploads, finds the corresponding
+    subtitled video in output_subtitled/ (via the job's burn checkpoint when the
+    record has one), and re-uploads to the failed platforms. All pending
+    uploads across videos run concurrently through run_upload_retries().
     """
-    import threading
-
     print(f"\n{B}═══════════════════════════════════════════════════════════{X}")
     print(f"{B}  PaperTalker-CLI · 重新上传未发布视频{X}")
     print(f"{'═'*59}\n")
 
-    history = load_run_history()
-    if not history:
-        print(f"  {Y}没有运行历史记录{X}")
-        return
-
-    # Find entries with failed uploads
-    pending = []
-    for rec in history:
-        uploads = rec.get("uploads", {})
-        failed_plats = []
-        for plat, status in uploads.items():
-            if isinstance(status, str) and status.startswith("FAIL"):
-                if plat in platforms:
-                    failed_plats.append(plat)
-        if failed_plats:
-            pending.append((rec, failed_plats))
+    # Find entries with failed uploads (indexed on upload status)
+    pending = find_failed_uploads(platforms)
 
     if not pending:
         print(f"  {G}✓ 没有需要重新上传的视频{X}")
         return
 
     print(f"  发现 {len(pending)} 个未发布视频:\n")
-    for rec, failed_plats in pending:
+    for _, rec, failed_plats in pending:
         topic = rec.get("topic", "?")
         date = rec.get("date", "?")[:10]
         plats_str = ", ".join(failed_plats)
@@ -2264,7 +3775,7 @@ def _retry_failed_uploads(output_base: Path, platforms: list[str]):
     print()
 
     # Pre-authenticate
-    all_failed_plats = list(set(p for _, fps in pending for p in fps))
+    all_failed_plats = list(set(p for _, _, fps in pending for p in fps))
     login_results = ensure_all_logins(all_failed_plats)
     active_plats = [p for p in all_failed_plats if login_results.get(p) is not False]
     if not active_plats:
@@ -2272,12 +3783,15 @@ def _retry_failed_uploads(output_base: Path, platforms: list[str]):
         print(f"  {Y}请先完成平台登录，然后重新运行: python publish.py --retry{X}")
         return
 
-    # Process each pending video
-    success_count = 0
-    for rec, failed_plats in pending:
+    # Collect one retry task per (video, platform)
+    store = JobStore(output_base / JOB_STORE_NAME)
+    upload_fns = {"bilibili": upload_bilibili, "weixin_channels": _run_weixin_channels_subprocess}
+    tasks = []
+    retry_runs = {}
+    for run_id, rec, failed_plats in pending:
         topic = rec.get("topic", "unknown")
         date_str = rec.get("date", "")[:10]
-        retry_plats = [p for p in failed_plats if p in active_plats]
+        retry_plats = [p for p in failed_plats if p in active_plats and p in upload_fns]
         if not retry_plats:
             continue
 
@@ -2286,85 +3800,62 @@ def _retry_failed_uploads(output_base: Path, platforms: list[str]):
         video_path = date_dir / f"{topic}.mp4"
         srt_path = date_dir / f"{topic}.srt"
         cover_path = date_dir / f"{topic}_cover.jpg"
+        burn = store.completed(rec["job"]).get("burn") if rec.get("job") else None
+        if burn:
+            video_path = Path(burn["artifacts"]["master"]["path"])
+            srt_path = video_path.with_suffix(".srt")
+            cover_path = video_path.with_name(f"{video_path.stem}_cover.jpg")
 
         if not video_path.exists():
             # Try fuzzy match
             candidates = list(date_dir.glob("*.mp4")) if date_dir.exists() else []
+            # Skip platform encodes ({topic}.{platform}.mp4)
+            candidates = [c for c in candidates if c.stem.rsplit(".", 1)[-1] not in TRANSCODE_PROFILES]
             matched = [c for c in candidates if topic[:10] in c.stem]
             if matched:
                 video_path = matched[0]
                 srt_path = video_path.with_suffix(".srt")
             else:
-                print(f"\n  {Y}⚠ 找不到视频: {video_path}{X}")
+                print(f"  {Y}⚠ 找不到视频: {video_path}{X}")
                 continue
 
-        print(f"\n{'─'*59}")
-        print(f"  重新上传: {C}{topic}{X} → {', '.join(retry_plats)}")
-
         title = rec.get("title", make_title(topic))
         tags = rec.get("tags", f"{topic},AI科研,学术科普,论文解读,前沿研究,深度解读")
         desc = f"【AI科研科普】{topic}：前沿研究深度解读"
         cover = cover_path if cover_path.exists() else None
 
-        upload_results = {}
-
-        def _upload_platform_retry(plat_name, upload_fn, upload_args):
-            try:
-                ret = upload_fn(*upload_args)
-                upload_results[plat_name] = ret
-            except Exception as e:
-                upload_results[plat_name] = {"ok": False, "error": str(e)}
-
-        upload_threads = []
+        retry_runs[run_id] = (rec, retry_plats)
         for plat in retry_plats:
-            if plat == "bilibili":
-                t = threading.Thread(
-                    target=_upload_platform_retry,
-                    args=("bilibili", _run_bilibili_upload,
-                          (video_path, title, desc, tags, cover)),
-                    daemon=True,
-                )
-                upload_threads.append(t)
-                t.start()
-            elif plat == "weixin_channels":
-                t = threading.Thread(
-                    target=_upload_platform_retry,
-                    args=("weixin_channels", _run_weixin_channels_subprocess,
-                          (video_path, title, desc, tags, cover)),
-                    daemon=True,
-                )
-                upload_threads.append(t)
-                t.start()
-
-        for t in upload_threads:
-            t.join(timeout=1200)
-
-        # Report and update history
+            tasks.append({
+                "key": (run_id, plat), "platform": plat, "label": f"{topic} → {plat}",
+                "fn": upload_fns[plat],
+                "args": (platform_video(video_path, plat), title, desc, tags, cover),
+            })
+
+    print(f"\n{'─'*59}")
+    print(f"  并发重传 {len(tasks)} 个上传任务 (全局上限 {RETRY_GLOBAL_LIMIT}, "
+          + ", ".join(f"{p} {RETRY_PLATFORM_LIMITS.get(p, 1)}" for p in sorted({t['platform'] for t in tasks}))
+          + ")")
+    results = run_upload_retries(tasks)
+
+    # Report and update history
+    success_count = 0
+    for run_id, (rec, retry_plats) in retry_runs.items():
         all_ok = True
         for plat in retry_plats:
-            ret = upload_results.get(plat, {})
-            if plat == "bilibili":
-                if ret.get("ok"):
-                    print(f"    Bilibili  {G}ok{X}  {ret.get('bvid','')}")
-                    rec["uploads"]["bilibili"] = f"ok:{ret.get('bvid','')}"
-                else:
-                    print(f"    Bilibili  {R}FAIL{X}  {ret.get('error','')}")
-                    all_ok = False
-            elif plat == "weixin_channels":
-                if ret.get("ok"):
-                    print(f"    WeChat视频号  {G}ok{X}")
-                    rec["uploads"]["weixin_channels"] = "ok"
-                else:
-                    print(f"    WeChat视频号  {R}FAIL{X}  {ret.get('error','')}")
-                    all_ok = False
-
+            ret = results.get((run_id, plat), {})
+            if not ret.get("ok"):
+                all_ok = False
+            elif plat == "bilibili":
+                rec["uploads"]["bilibili"] = f"ok:{ret.get('bvid','')}"
+            else:
+                rec["uploads"][plat] = "ok"
+        update_run_uploads(run_id, rec["uploads"])
+        if rec.get("job"):
+            store.checkpoint(rec["job"], "upload", uploads=rec["uploads"])
         if all_ok:
             success_count += 1
 
-    # Save updated history
-    RUN_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    RUN_HISTORY_FILE.write_text(json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8")
-
     print(f"\n{'═'*59}")
     print(f"  重新上传完成: {success_count}/{len(pending)} 成功")
     print(f"{'═'*59}\n")
@@ -2378,12 +3869,31 @@ def main():
                         choices=PLATFORMS, help="Upload platforms")
     parser.add_argument("--skip-upload", action="store_true", help="Skip upload step")
     parser.add_argument("--workers", type=int, default=3, help="Parallel transcription workers (default: 3, 1=no split)")
+    parser.add_argument("--in-memory-audio", action="store_true",
+                        help="Decode audio into shared memory for transcription (no temp WAV on disk)")
+    parser.add_argument("--trim-silence", action="store_true",
+                        help="Detect speech regions by loudness and skip dead air before transcription")
+    parser.add_argument("--no-pipeline", action="store_true",
+                        help="Process videos strictly one after another (no upload/ASR overlap)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Ignore stage checkpoints in jobs.jsonl and process every video from scratch")
+    parser.add_argument("--no-browser-service", action="store_true",
+                        help="Launch a fresh browser for each WeChat login/upload instead of the warm service")
+    parser.add_argument("--upload-bandwidth", type=float, default=0, metavar="MBIT",
+                        help="Total upload bandwidth budget in Mbit/s shared by concurrent uploads "
+                             "(Bilibili gets priority; default: unlimited)")
     parser.add_argument("--retry", action="store_true",
                         help="Retry uploading previously subtitled but unpublished videos from output_subtitled/")
     args = parser.parse_args()
 
     input_dir = Path(args.input).resolve()
     output_base = Path(args.output).resolve()
+    if args.no_browser_service:
+        global USE_BROWSER_SERVICE
+        USE_BROWSER_SERVICE = False
+    if args.upload_bandwidth:
+        global UPLOAD_BANDWIDTH
+        UPLOAD_BANDWIDTH = args.upload_bandwidth
 
     # ── Retry mode: re-upload subtitled videos that failed upload ──
     if args.retry:
@@ -2396,7 +3906,7 @@ def main():
         sys.exit(1)
 
     # Show run history summary
-    history = load_run_history()
+    history = load_run_history(limit=1)
     if history:
         last = history[-1]
         print(f"Last run: {D}{last.get('date','?')[:10]} | {last.get('topic','?')} | {last.get('uploads',{})}{X}")
@@ -2433,13 +3943,25 @@ def main():
             print(f"{R}所有平台登录失败，无法上传。{X}")
             return
         args.platforms = active_platforms
-
-    # Process each video
-    results = []
-    for i, video in enumerate(videos, 1):
-        r = process_video(video, date_dir, i, len(videos), ffmpeg,
-                          args.platforms, args.skip_upload, args.workers)
-        results.append(r)
+        # Keep probing while the CPU stages run, so a session that expires
+        # mid-batch is re-logged-in before its upload comes up
+        LOGIN_HEALTH.start_refresh(args.platforms)
+
+    # Per-stage checkpoints: a crashed batch resumes where each video stopped
+    store = None if args.no_resume else JobStore(output_base / JOB_STORE_NAME)
+
+    # Process each video (pipelined: next video's ASR/burn overlaps current upload)
+    if args.skip_upload or args.no_pipeline or len(videos) == 1:
+        results = []
+        for i, video in enumerate(videos, 1):
+            r = process_video(video, date_dir, i, len(videos), ffmpeg,
+                              args.platforms, args.skip_upload, args.workers,
+                              args.in_memory_audio, args.trim_silence, store)
+            results.append(r)
+    else:
+        results = run_pipeline(videos, date_dir, ffmpeg, args.platforms, args.skip_upload,
+                               args.workers, args.in_memory_audio, args.trim_silence, store)
+    LOGIN_HEALTH.stop_refresh()
 
     # Summary report
     print(f"\n{'='*70}")
@@ -9,6 +9,7 @@ PaperTalker-CLI · quick_video.py — 一键主题→视频 (独立版)
     python quick_video.py "LLM药物发现" --source search --style anime --no-confirm
     python quick_video.py "Attention机制" --source file --files paper.pdf
     python quick_video.py "Transformer" --source paper
+    python quick_video.py "生物智能体" "蛋白质折叠" --concurrency 2   # 多主题并发
 
 来源模式 (--source):
     research   NotebookLM Deep/Fast Research 自动搜索网络资料（默认）
@@ -19,16 +20,21 @@ PaperTalker-CLI · quick_video.py — 一键主题→视频 (独立版)
     paper      按标题搜索论文，列出候选让用户选择后导入
 
 流程:
-    1. 创建笔记本
+    1. 创建笔记本 (7 天内有相同/相近主题的笔记本则复用，只导入新增来源；--fresh 强制新建)
     2. 获取来源（research / search / upload / mixed / file / paper）
     3. 阶段性确认：展示来源列表，用户确认后继续
     4. 等待来源处理
     5. 生成视频
     6. 等待完成 + 下载
+
+断点续跑: 每完成一步写入运行日志 (src/utils/run_journal.py)，崩溃或超时后
+以相同主题重跑会从最后完成的一步继续；--fresh 则重新开始。
 """
 
 import argparse
 import asyncio
+import contextlib
+import contextvars
 import os
 import subprocess
 import sys
@@ -56,8 +62,8 @@ for key in ("HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
         os.environ[key] = val
         os.environ[key.lower()] = val
 
-from notebooklm import NotebookLMClient, VideoStyle, ArtifactNotReadyError
-from notebooklm.exceptions import ArtifactParseError
+from notebooklm import NotebookLMClient, VideoStyle
+from notebooklm.exceptions import NetworkError, RateLimitError, ServerError
 
 # ── 颜色 / 日志 ──────────────────────────────────────────
 G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; C = "\033[96m"; B = "\033[1m"; D = "\033[2m"; X = "\033[0m"
@@ -65,12 +71,36 @@ G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; C = "\033[96m"; B = "\033[1m"; D
 # 可导入 NotebookLM 的文件类型
 IMPORTABLE_EXTS = {".pdf", ".txt", ".md", ".docx"}
 
+# 来源就绪轮询 (步骤5): 每次轮询一次 GET_NOTEBOOK，拿到全部来源状态
+SOURCE_WAIT_MAX_S = 300        # 最长等待 (与原固定等待的上限相同)
+SOURCE_POLL_INITIAL_S = 2.0    # 有进展时回到该间隔
+SOURCE_POLL_MAX_S = 15.0       # 无进展时按 1.5 倍退避到该间隔
+SOURCE_READY_QUORUM = 0.9      # 已就绪/出错达到该比例后 ...
+SOURCE_STALL_S = 30            # ... 剩余来源这么久无进展就不再等待
+VIDEO_POLL_INITIAL_S = 3.0     # 视频状态变化后回到该轮询间隔
+VIDEO_POLL_MAX_S = 10.0        # 状态不变时按 1.5 倍退避到该间隔
+BATCH_CONCURRENCY = 3          # 批量模式同时生成的主题数
+IMPORT_BATCH_MAX = 15          # Research 批量导入的初始/最大批次
+IMPORT_BATCH_MIN = 3           # 批次失败时折半的下限
+IMPORT_CONCURRENCY = 6         # 逐个添加 URL 的并发上限
+IMPORT_RETRIES = 2             # 逐个添加遇到临时错误的重试次数
+ADD_SOURCE_TIMEOUT_S = 45      # 单个 URL 添加超时（秒）
+FILE_UPLOAD_CONCURRENCY = 4    # 本地文件同时上传数
+_NOTEBOOK_INDEX = None         # 见 notebook_index()
+_RESEARCH_CACHE = None         # 见 research_cache()
+_PROGRESS_TAG = contextvars.ContextVar("progress_tag", default="")  # 批量模式: 当前主题前缀
+
 def step(i, n, msg):   print(f"  {C}[{i}/{n}]{X} {msg}", flush=True)
 def ok(msg):            print(f"  {G}  ✓ {msg}{X}", flush=True)
 def warn(msg):          print(f"  {Y}  ⚠ {msg}{X}", flush=True)
 def err(msg):           print(f"  {R}  ✗ {msg}{X}", flush=True)
 def info(msg):          print(f"  {D}    {msg}{X}", flush=True)
 
+def progress(msg):
+    """原地刷新的进度行；批量模式下带主题前缀，区分并发的主题。"""
+    sys.stdout.write(f"\r{_PROGRESS_TAG.get()}{msg}")
+    sys.stdout.flush()
+
 async def preflight_check() -> bool:
     """快速连通性预检: 连接 NotebookLM 并列出笔记本，验证认证有效。"""
     storage = os.environ.get(
@@ -209,11 +239,24 @@ def print_sources_table(sources: list[dict], label: str = "来源"):
 #  来源获取策略
 # ══════════════════════════════════════════════════════════
 
-async def source_deep_research(client, notebook_id: str, topic: str, mode: str = "deep") -> list[dict]:
+async def source_deep_research(client, notebook_id: str, topic: str, mode: str = "deep",
+                               use_cache: bool = True, no_confirm: bool = False) -> list[dict]:
     """Deep Research: 启动 → 轮询 → 返回发现的来源。
 
-    如果 Deep Research 失败（速率限制等），提示用户切换账号或自动降级到 Fast Research。
+    如果 Deep Research 失败（速率限制等），提示用户切换账号或自动降级到 Fast Research；
+    no_confirm (含批量模式) 时不提示，直接降级。
+    完成的结果按主题 + 模式缓存 (src/utils/research_cache.py)，TTL 内再次运行
+    同一主题直接返回缓存的来源，不再启动 Research。
     """
+    if use_cache:
+        cached = research_cache().get(topic, mode)
+        sources = [src for src in (cached or {}).get("sources", []) if src.get("url")]
+        if sources:
+            age_h = (time.time() - cached["time"]) / 3600
+            step(2, 7, f"复用 Research 缓存 ({cached['mode']}, {age_h:.1f} 小时前)")
+            ok(f"缓存来源 {len(sources)} 个，跳过 Research")
+            return sources
+
     step(2, 7, f"启动 Deep Research ({mode})...")
     t0 = time.time()
 
@@ -236,8 +279,8 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
                 print(f"  {'='*60}")
                 print()
 
-                # 询问用户
-                response = input(f"  是否切换账号？(y/N): ").strip().lower()
+                # 询问用户 (无人值守时直接降级)
+                response = "" if no_confirm else input(f"  是否切换账号？(y/N): ").strip().lower()
                 if response in ['y', 'yes', '是']:
                     print(f"\n  {Y}正在重新登录 NotebookLM...{X}")
                     # 删除旧的认证文件
@@ -256,7 +299,7 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
                         )
                         if result.returncode == 0:
                             print(f"  {G}✓ 账号切换成功，请重新运行脚本{X}")
-                            sys.exit(0)
+                            return []
                         else:
                             err("账号切换失败")
                             return []
@@ -265,7 +308,8 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
                         return []
                 else:
                     warn("自动降级到 Fast Research...")
-                    return await source_deep_research(client, notebook_id, topic, mode="fast")
+                    return await source_deep_research(client, notebook_id, topic, mode="fast",
+                                                      use_cache=use_cache, no_confirm=no_confirm)
             else:
                 err(f"Fast Research 也被限流: {e}")
                 print(f"\n  {Y}建议切换 Google 账号后重试{X}")
@@ -278,7 +322,8 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
     if not task:
         if mode == "deep":
             warn("Deep Research 启动失败，尝试降级到 Fast Research...")
-            return await source_deep_research(client, notebook_id, topic, mode="fast")
+            return await source_deep_research(client, notebook_id, topic, mode="fast",
+                                              use_cache=use_cache, no_confirm=no_confirm)
         else:
             err("Fast Research 启动失败")
             return []
@@ -295,8 +340,7 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
             consecutive_errors = 0  # 重置错误计数
         except Exception as e:
             consecutive_errors += 1
-            sys.stdout.write(f"\r    轮询 #{i+1}: 网络波动 ({consecutive_errors}/10)，重试中...   ")
-            sys.stdout.flush()
+            progress(f"    轮询 #{i+1}: 网络波动 ({consecutive_errors}/10)，重试中...   ")
             if consecutive_errors >= 10:
                 print()
                 err(f"连续 {consecutive_errors} 次网络错误，放弃: {e}")
@@ -304,8 +348,7 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
             continue
         status = result.get("status", "")
         n = len(result.get("sources", []))
-        sys.stdout.write(f"\r    轮询 #{i+1}: status={status}, sources={n}   ")
-        sys.stdout.flush()
+        progress(f"    轮询 #{i+1}: status={status}, sources={n}   ")
         if status == "completed":
             sources = result.get("sources", [])
             print()
@@ -313,6 +356,8 @@ async def source_deep_research(client, notebook_id: str, topic: str, mode: str =
             summary = result.get("summary", "")
             if summary:
                 info(f"摘要: {summary[:200]}...")
+            research_cache().put(topic, mode, sources, summary,
+                                 task_id=result.get("task_id") or task_id, notebook_id=notebook_id)
             return sources
         elif status in ("failed", "error"):
             print()
@@ -360,11 +405,17 @@ async def source_upload(client, notebook_id: str) -> list[dict]:
     return result
 
 
-async def source_local_files(client, notebook_id: str, paths: list[str]) -> list[dict]:
+async def source_local_files(client, notebook_id: str, paths: list[str],
+                             concurrency: int = FILE_UPLOAD_CONCURRENCY,
+                             known: dict | None = None) -> list[dict]:
     """导入本地文件（PDF/txt/md/docx）到 NotebookLM。
 
     paths 可以是文件路径或目录路径（自动递归扫描）。
     直接调用 client.sources.add_file()，无需再经过 import_sources()。
+    最多 concurrency 个文件同时上传，共用客户端的 HTTP 连接池；
+    每个文件完成时打印耗时与速率，最后汇总总吞吐。
+    known 为笔记本索引中已登记的来源 {键: source_id}，内容哈希在其中的文件不再上传。
+    返回的每项带 "key" ("sha256:<哈希>")，供登记到索引。
     """
     # 收集所有待导入文件
     files = []
@@ -386,33 +437,63 @@ async def source_local_files(client, notebook_id: str, paths: list[str]) -> list
         err("没有找到可导入的文件")
         return []
 
-    # 去重
+    # 去重: 相同路径、相同内容 (SHA-256)、索引中已登记的内容；同名不同内容的文件照常上传
+    from src.utils.source_dedup import dedup_files, file_digest
     files = list(dict.fromkeys(files))
+    digests = {}
+    if known:
+        # 哈希读整个文件，放到线程里，不阻塞事件循环 (批量模式下其他主题还在跑)
+        hashes = await asyncio.gather(*(asyncio.to_thread(file_digest, f) for f in files))
+        digests = dict(zip(files, hashes))
+    files, skipped = await asyncio.to_thread(dedup_files, files, known or (), digests)
+    for f in skipped:
+        info(f"跳过重复文件: {f.name}")
+    if not files:
+        warn("所有文件都已在笔记本中")
+        return []
 
     step(2, 7, f"准备导入 {len(files)} 个本地文件...")
     for i, f in enumerate(files, 1):
         size_kb = f.stat().st_size / 1024
         info(f"{i:>3}. {f.name} ({size_kb:.0f} KB)")
 
-    step(3, 7, f"上传文件到 NotebookLM...")
-    imported = []
-    for i, f in enumerate(files, 1):
-        try:
-            src = await client.sources.add_file(notebook_id, str(f))
-            imported.append({
-                "title": f.stem,
-                "url": "",
-                "source": "file",
-                "id": getattr(src, "id", ""),
-            })
-            sys.stdout.write(f"\r    已上传 {i}/{len(files)}: {f.name}")
-            sys.stdout.flush()
-        except Exception as e:
-            print()
-            warn(f"上传失败 [{f.name}]: {e}")
-    if imported:
-        print()
-    ok(f"成功导入 {len(imported)}/{len(files)} 个文件")
+    concurrency = max(1, concurrency)
+    step(3, 7, f"上传文件到 NotebookLM (并发 {concurrency})...")
+    sem = asyncio.Semaphore(concurrency)
+    done = 0
+    sent = 0
+
+    async def upload(f: Path) -> dict | None:
+        nonlocal done, sent
+        async with sem:
+            t = time.time()
+            try:
+                src = await client.sources.add_file(notebook_id, str(f))
+            except Exception as e:
+                warn(f"上传失败 [{f.name}]: {e}")
+                return None
+            dt = time.time() - t
+        size = f.stat().st_size
+        done += 1
+        sent += size
+        if f not in digests:
+            digests[f] = await asyncio.to_thread(file_digest, f)
+        info(f"[{done}/{len(files)}] {f.name}  {size/1e6:.1f} MB  {dt:.1f}s"
+             f"  ({size/1e6/max(dt, 1e-3):.1f} MB/s)")
+        return {
+            "title": f.stem,
+            "url": "",
+            "source": "file",
+            "id": getattr(src, "id", ""),
+            "key": f"sha256:{digests[f]}",
+        }
+
+    t0 = time.time()
+    results = await asyncio.gather(*(upload(f) for f in files))
+    imported = [r for r in results if r]
+    elapsed = time.time() - t0
+    ok(f"成功导入 {len(imported)}/{len(files)} 个文件  "
+       f"({sent/1e6:.1f} MB, {elapsed:.1f}s, {sent/1e6/max(elapsed, 1e-3):.1f} MB/s)")
     return imported
 
 
@@ -476,100 +557,279 @@ async def import_sources(client, notebook_id: str, sources: list[dict], task_id:
     
     优化策略:
     - 不限制来源数量 (Deep Research 发现多少就导入多少)
-    - 批量导入失败时，用较小批次重试再 fallback 到逐个添加
-    - 逐个添加时设置单个超时 (ADD_SOURCE_TIMEOUT_S)，避免长时间卡死
+    - research/mixed 模式先按批次导入，批次大小随失败自适应 (见 _import_batches)
+    - 批量导入不了的来源并发逐个添加 (见 _add_urls)，总耗时不再随来源数线性增长
+    - 导入前按规范化 URL / DOI / arXiv 编号去重，并跳过笔记本中已有的来源
     """
-    ADD_SOURCE_TIMEOUT_S = 45 # 单个 URL 添加超时（秒）
+    from src.utils.source_dedup import dedup_sources
 
     if not sources:
         return 0
 
-    # 尝试批量导入 (research/mixed 模式)
+    sources, dropped = dedup_sources(sources, await existing_sources(client, notebook_id))
+    if dropped:
+        info(f"去重: 跳过 {dropped} 个重复或已在笔记本中的来源")
+    if not sources:
+        return 0
+
+    count, pending = 0, sources
     if source_mode in ("research", "mixed") and task_id:
-        total_imported = 0
-        # 先尝试大批次，失败则用小批次重试
-        for batch_size in (15, 5):
-            if total_imported > 0:
+        count, pending = await _import_batches(client, notebook_id, task_id, sources)
+        if not pending:
+            return count
+        info(f"{len(pending)} 个来源改为逐个添加 (并发 {IMPORT_CONCURRENCY})...")
+    return count + await _add_urls(client, notebook_id, pending)
+
+
+async def existing_sources(client, notebook_id: str) -> set[str]:
+    """笔记本中已有来源的 URL 规范键；获取失败时返回空集合。"""
+    from src.utils.source_dedup import normalize_url
+
+    try:
+        current = await client.sources.list(notebook_id)
+    except Exception:
+        return set()
+    return {k for src in current if (k := normalize_url(getattr(src, "url", None) or ""))}
+
+
+def research_cache():
+    """进程内共用的 ResearchCache。"""
+    global _RESEARCH_CACHE
+    if _RESEARCH_CACHE is None:
+        from src.utils.research_cache import ResearchCache
+        _RESEARCH_CACHE = ResearchCache()
+    return _RESEARCH_CACHE
+
+
+def notebook_index():
+    """进程内共用的 NotebookIndex (批量模式下各主题共用，避免互相覆盖)。"""
+    global _NOTEBOOK_INDEX
+    if _NOTEBOOK_INDEX is None:
+        from src.utils.notebook_index import NotebookIndex
+        _NOTEBOOK_INDEX = NotebookIndex()
+    return _NOTEBOOK_INDEX
+
+
+async def reuse_notebook(client, index, topic: str, source_mode: str) -> tuple[str, list[str]] | None:
+    """查找最近用过的、来源模式相同的相同/相近主题笔记本，返回 (ID, 已有来源 ID)；
+    没有或不可用返回 None。
+
+    复用时来源照常获取，import_sources / source_local_files 去重后只导入新增的来源；
+    已有来源 ID 供 wait_sources_ready 只等新来源。
+    """
+    nid = index.find(topic, source_mode)
+    if nid is None:
+        return None
+    step(1, 7, "复用已有笔记本...")
+    try:
+        existing = await client.sources.list(nid)
+    except Exception as e:
+        warn(f"笔记本 {nid} 不可用 ({e})，改为新建")
+        index.forget(nid)
+        return None
+    ok(f"笔记本: {nid}  (主题「{index.entries[nid]['topic']}」, 已有 {len(existing)} 个来源)")
+    return nid, [src.id for src in existing]
+
+
+async def record_sources(client, index, notebook_id: str, discovered: list[dict]) -> dict:
+    """把笔记本当前来源登记到索引 (URL 规范键 / 文件哈希 → source_id)，返回登记的映射。"""
+    from src.utils.source_dedup import normalize_url
+
+    found = {d["key"]: d["id"] for d in discovered if d.get("key") and d.get("id")}
+    try:
+        current = await client.sources.list(notebook_id)
+    except Exception:
+        current = []
+    for src in current:
+        key = normalize_url(getattr(src, "url", None) or "")
+        if key:
+            found[key] = src.id
+    index.add_sources(notebook_id, found)
+    return found
+
+
+def has_resumable_run(topic: str, source_mode: str = "research") -> bool:
+    """该主题是否有已提交视频生成、可续跑的未完成运行 (供 run_scheduled.py 判断)。"""
+    from src.utils.run_journal import RunJournal
+    journal = RunJournal(topic)
+    return bool(journal.resume(source_mode)) and journal.has("generation")
+
+
+async def _import_batches(client, notebook_id: str, task_id: str,
+                          sources: list[dict]) -> tuple[int, list[dict]]:
+    """按批次导入 Research 来源，返回 (导入数, 需逐个添加的来源)。
+
+    批次失败时折半后重试同一批，并记住失败过的大小作为上限；成功后按
+    IMPORT_BATCH_MIN 逐步加大，但不超过该上限，避免反复撞到同样的失败。
+    折半到 IMPORT_BATCH_MIN 仍失败的批次留给逐个添加，连续两次则放弃批量。
+    """
+    size, ceiling, i, n = IMPORT_BATCH_MAX, IMPORT_BATCH_MAX, 0, 0
+    count, left, min_failures = 0, [], 0
+    while i < len(sources):
+        batch = sources[i:i + size]
+        n += 1
+        try:
+            imported = await client.research.import_sources(notebook_id, task_id, batch)
+        except Exception as e:
+            warn(f"批次 {n} (size={len(batch)}) 导入失败: {e}")
+            ceiling = max(IMPORT_BATCH_MIN, min(ceiling, len(batch) - 1))
+            if size > IMPORT_BATCH_MIN:
+                size = max(IMPORT_BATCH_MIN, size // 2)
+                info(f"缩小批次到 {size} 重试...")
+                continue
+            left.extend(batch)
+            min_failures += 1
+            if min_failures >= 2:
+                left.extend(sources[i + len(batch):])
                 break
-            for i in range(0, len(sources), batch_size):
-                batch = sources[i:i + batch_size]
-                try:
-                    imported = await client.research.import_sources(notebook_id, task_id, batch)
-                    total_imported += len(imported)
-                    info(f"批次 {i//batch_size+1} (size={batch_size}): 导入 {len(imported)} 个")
-                except Exception as e:
-                    warn(f"批次 {i//batch_size+1} (size={batch_size}) 导入失败: {e}")
-                    if batch_size == 15:
-                        info("切换到小批次重试...")
-                    break
-        if total_imported > 0:
-            return total_imported
-
-    # Fallback: 逐个添加 (带超时)
-    count = 0
-    total = len(sources)
-    for s in sources:
+        else:
+            count += len(imported)
+            min_failures = 0
+            info(f"批次 {n} (size={len(batch)}): 导入 {len(imported)} 个")
+            size = min(ceiling, size + IMPORT_BATCH_MIN)
+        i += len(batch)
+    return count, left
+
+
+async def _add_urls(client, notebook_id: str, sources: list[dict]) -> int:
+    """并发逐个添加 URL (最多 IMPORT_CONCURRENCY 个同时进行)，返回成功数。
+
+    每个添加有 ADD_SOURCE_TIMEOUT_S 超时；网络错误、限流和服务端错误重试
+    IMPORT_RETRIES 次，退避等待 (限流优先用 retry_after) 时不占并发名额。
+    超时不重试：服务端可能已建好来源，再加一次会重复。
+    """
+    todo = [s for s in sources if s.get("pdf_url") or s.get("url")]
+    sem = asyncio.Semaphore(IMPORT_CONCURRENCY)
+    added = 0
+
+    async def add(s: dict) -> bool:
+        nonlocal added
         url = s.get("pdf_url") or s.get("url")
-        if not url:
-            continue
+        label = s.get("title", "")[:30]
+        for attempt in range(IMPORT_RETRIES + 1):
+            try:
+                async with sem:
+                    await asyncio.wait_for(
+                        client.sources.add_url(notebook_id, url=url),
+                        timeout=ADD_SOURCE_TIMEOUT_S,
+                    )
+            except asyncio.TimeoutError:
+                warn(f"添加超时 ({ADD_SOURCE_TIMEOUT_S}s) [{label}]")
+                return False
+            except (NetworkError, RateLimitError, ServerError) as e:
+                if attempt == IMPORT_RETRIES:
+                    warn(f"添加失败 [{label}]: {e}")
+                    return False
+                await asyncio.sleep(getattr(e, "retry_after", None) or 2 ** (attempt + 1))
+            except Exception as e:
+                warn(f"添加失败 [{label}]: {e}")
+                return False
+            else:
+                added += 1
+                progress(f"    已添加 {added}/{len(todo)}...")
+                return True
+        return False
+
+    t0 = time.time()
+    results = await asyncio.gather(*(add(s) for s in todo))
+    if added:
+        print()
+        info(f"逐个添加 {added}/{len(todo)} 个  ({time.time()-t0:.1f}s)")
+    return sum(results)
+
+
+async def wait_sources_ready(client, notebook_id: str, timeout: float = SOURCE_WAIT_MAX_S,
+                             skip: set = frozenset()) -> tuple[int, int]:
+    """等待来源处理完成，返回 (就绪数, 出错数)。
+
+    每次轮询只调用一次 sources.list (一个 GET_NOTEBOOK)，一次拿到全部来源状态。
+    `skip` 中的来源 (复用笔记本里原有的) 不计入，只等本次新导入的。
+    全部来源 READY/ERROR 即返回；达到 SOURCE_READY_QUORUM 后若 SOURCE_STALL_S
+    内没有新进展也返回，个别慢来源不阻塞视频生成。有进展时轮询间隔重置，
+    否则按 1.5 倍退避。
+    """
+    start = time.time()
+    interval = SOURCE_POLL_INITIAL_S
+    last_settled, last_progress = -1, start
+    ready = errors = 0
+    while True:
         try:
-            await asyncio.wait_for(
-                client.sources.add_url(notebook_id, url=url),
-                timeout=ADD_SOURCE_TIMEOUT_S,
-            )
-            count += 1
-            sys.stdout.write(f"\r    已添加 {count}/{total}...")
-            sys.stdout.flush()
-        except asyncio.TimeoutError:
-            warn(f"添加超时 ({ADD_SOURCE_TIMEOUT_S}s) [{s.get('title', '')[:30]}]")
-        except Exception as e:
-            warn(f"添加失败 [{s.get('title', '')[:30]}]: {e}")
-    if count:
+            sources = await client.sources.list(notebook_id)
+        except Exception:
+            sources = None  # 临时网络错误: 下次轮询再试
+        now = time.time()
+        if sources:
+            sources = [src for src in sources if src.id not in skip]
+            ready = sum(1 for src in sources if src.is_ready)
+            errors = sum(1 for src in sources if src.is_error)
+            total, settled = len(sources), ready + errors
+            progress(f"    就绪 {ready}/{total}  出错 {errors}  "
+                     f"处理中 {total - settled}  ({now - start:.0f}s)   ")
+            if settled != last_settled:
+                last_settled, last_progress = settled, now
+                interval = SOURCE_POLL_INITIAL_S
+            if settled >= total:
+                break
+            if settled >= total * SOURCE_READY_QUORUM and now - last_progress >= SOURCE_STALL_S:
+                break
+        remaining = timeout - (now - start)
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 1.5, SOURCE_POLL_MAX_S)
+    print()
+    return ready, errors
+
+
+async def watch_video(client, notebook_id: str, task_id: str, fpath: str,
+                      timeout: float, t0: float):
+    """等待视频任务结束并下载，返回 (最终状态, 文件路径)；超时返回 (None, None)。
+
+    后台 ArtifactWatcher 每轮只调用一次 LIST_ARTIFACTS，状态变化、可下载、
+    失败都以事件通知；看到 MP4 地址即直接下载，不再另外 poll_status 和
+    每隔几轮试探 download_video。下载失败时路径为 None，由调用方重试。
+    """
+    t1 = time.time()
+    async with client.artifacts.watch(notebook_id, task_id,
+                                      initial_interval=VIDEO_POLL_INITIAL_S,
+                                      max_interval=VIDEO_POLL_MAX_S) as watcher:
+        while not watcher.done:
+            remaining = timeout - (time.time() - t1)
+            if remaining <= 0:
+                print()
+                return None, None
+            status = await watcher.wait_changed(timeout=min(remaining, 30))
+            progress(f"    #{watcher.polls} 状态: {status.status}  ({time.time()-t0:.0f}s)   ")
         print()
-    return count
+        if watcher.failed.is_set():
+            return watcher.status, None
+        try:
+            return watcher.status, await watcher.download(fpath)
+        except Exception as e:
+            warn(f"下载异常: {e}")
+            return watcher.status, None
 
 
 # ══════════════════════════════════════════════════════════
 #  主流程
 # ══════════════════════════════════════════════════════════
 
-async def run(
-    topic: str,
-    source_mode: str = "research",
-    style: str = "whiteboard",
-    language: str = "zh-CN",
-    research_mode: str = "deep",
-    platforms: list[str] | None = None,
-    max_results: int = 10,
-    year: int | None = None,
-    output_dir: str = "./output",
-    timeout: float = 3600.0,
-    instructions: str | None = None,
-    no_confirm: bool = False,
-    file_paths: list[str] | None = None,
-):
-    total = 7
-    out = Path(output_dir).resolve()
-    out.mkdir(parents=True, exist_ok=True)
-    prompt = instructions or load_prompt()
-    vstyle = STYLE_MAP.get(style, VideoStyle.WHITEBOARD)
-
-    banner(topic, source_mode, style, language, out)
+async def open_client():
+    """创建 NotebookLM 客户端 (未进入 async with)；登录失败返回 None。
 
+    认证过期时自动调用 auto_login.py 刷新后重试一次。
+    """
     storage = os.environ.get(
         "NOTEBOOKLM_STORAGE_PATH",
         str(Path.home() / ".notebooklm" / "storage_state.json"),
     )
 
-    # 自动登录重试: 认证过期时自动调用 auto_login.py 刷新后重试
     for _login_attempt in range(2):
         try:
-            client_ctx = await NotebookLMClient.from_storage(storage)
-            break
+            return await NotebookLMClient.from_storage(storage)
         except (ValueError, Exception) as e:
             if _login_attempt == 0 and ("expired" in str(e).lower() or "authentication" in str(e).lower() or "redirect" in str(e).lower()):
                 warn(f"认证过期，尝试自动刷新...")
-                import subprocess
                 login_script = str(CLI_DIR / "tools" / "auto_login.py")
                 login_result = subprocess.run(
                     [sys.executable, login_script, "--refresh"],
@@ -588,179 +848,140 @@ async def run(
                 continue
             raise
 
-    async with client_ctx as client:
-
-        # ── Step 1: 创建笔记本 ────────────────────────────
-        step(1, total, "创建 NotebookLM 笔记本...")
-        t0 = time.time()
-        notebook = await client.notebooks.create(title=topic)
-        nid = notebook.id
-        ok(f"笔记本: {nid}  ({time.time()-t0:.1f}s)")
-        info(f"链接: https://notebooklm.google.com/notebook/{nid}")
 
-        # ── Step 2-3: 获取来源 ────────────────────────────
-        discovered = []
-        research_task_id = None
+async def run(
+    topic: str,
+    source_mode: str = "research",
+    style: str = "whiteboard",
+    language: str = "zh-CN",
+    research_mode: str = "deep",
+    platforms: list[str] | None = None,
+    max_results: int = 10,
+    year: int | None = None,
+    output_dir: str = "./output",
+    timeout: float = 3600.0,
+    instructions: str | None = None,
+    no_confirm: bool = False,
+    file_paths: list[str] | None = None,
+    client=None,
+    upload_concurrency: int = FILE_UPLOAD_CONCURRENCY,
+    reuse: bool = True,
+):
+    total = 7
+    out = Path(output_dir).resolve()
+    out.mkdir(parents=True, exist_ok=True)
+    prompt = instructions or load_prompt()
+    vstyle = STYLE_MAP.get(style, VideoStyle.WHITEBOARD)
 
-        if source_mode in ("research", "mixed"):
-            discovered = await source_deep_research(client, nid, topic, research_mode)
-            try:
-                task_info = await client.research.poll(nid)
-                research_task_id = task_info.get("task_id")
-            except Exception:
-                pass
+    banner(topic, source_mode, style, language, out)
 
-        if source_mode in ("search", "mixed"):
-            papers = await source_paper_search(topic, platforms or ["arxiv", "semantic_scholar"], max_results, year)
-            discovered.extend(papers)
+    if client is None:
+        client_ctx = await open_client()
+        if client_ctx is None:
+            return None
+    else:
+        client_ctx = contextlib.nullcontext(client)  # 批量模式: 共用调用方的客户端
+
+    # 断点续跑: 同一主题上次未完成的运行从最后完成的一步继续 (--fresh 时重新开始)
+    from src.utils.run_journal import RunJournal
+    journal = RunJournal(topic)
+    if reuse and journal.resume(source_mode):
+        journal.count_resume()
+        info(f"继续上次中断的运行 (已完成: {', '.join(journal.data['steps'])})")
+    else:
+        journal.start(source_mode)
 
-        if source_mode == "upload":
-            discovered = await source_upload(client, nid)
+    async with client_ctx as client:
 
-        if source_mode == "file":
-            if not file_paths:
-                err("--source file 需要 --files 参数指定文件路径")
-                return None
-            discovered = await source_local_files(client, nid, file_paths)
+        # ── Step 1: 创建 (或复用) 笔记本 ──────────────────
+        index = notebook_index()
+        if journal.has("notebook"):
+            nid, prior = journal.data["notebook_id"], journal.data.get("prior_sources", [])
+            step(1, total, f"沿用上次的笔记本: {nid}")
+        else:
+            reused = await reuse_notebook(client, index, topic, source_mode) if reuse else None
+            nid, prior = reused or (None, [])
+        if nid is None:
+            step(1, total, "创建 NotebookLM 笔记本...")
+            t0 = time.time()
+            notebook = await client.notebooks.create(title=topic)
+            nid = notebook.id
+            ok(f"笔记本: {nid}  ({time.time()-t0:.1f}s)")
+        index.record(nid, topic, source_mode)
+        journal.step("notebook", notebook_id=nid, prior_sources=prior)
+        info(f"链接: https://notebooklm.google.com/notebook/{nid}")
 
-        if source_mode == "paper":
-            discovered = await source_paper_title(
-                client, nid, topic,
-                platforms or ["arxiv", "semantic_scholar"],
-                max_results, no_confirm,
+        # ── Step 2-4: 获取并导入来源 ──────────────────────
+        # 复用的笔记本也照常获取来源 (Research 可命中缓存)，导入时去重只补增量
+        if journal.has("imported"):
+            discovered = journal.data.get("discovered", [])
+            imported_count = journal.data.get("imported", 0)
+            step(4, total, f"来源已在上次运行中导入 ({imported_count} 个)，跳过")
+        else:
+            discovered, imported_count = await collect_sources(
+                client, nid, topic, journal, index,
+                source_mode, research_mode, platforms, max_results, year,
+                file_paths, upload_concurrency, no_confirm, reuse,
             )
-
-        # ── 阶段确认 ─────────────────────────────────────
-        print_sources_table(discovered, "发现的来源")
-
-        if source_mode in ("upload", "file"):
-            # upload/file 模式下文件已导入，无需再调用 import_sources
-            if not confirm(f"笔记本中有 {len(discovered)} 个来源，继续生成视频?", no_confirm):
-                print(f"\n  {Y}已取消{X}\n")
+            if imported_count is None:
                 return None
-            imported_count = len(discovered)
-        else:
-            if not discovered:
-                warn("没有找到任何来源")
-                if not confirm("继续使用空笔记本生成视频?", no_confirm):
-                    print(f"\n  {Y}已取消{X}\n")
-                    return None
-                imported_count = 0
-            else:
-                if not confirm(f"将 {len(discovered)} 个来源导入笔记本并生成视频?", no_confirm):
-                    print(f"\n  {Y}已取消{X}\n")
-                    return None
-
-                step(4, total, "导入来源到笔记本...")
-                t0 = time.time()
-                imported_count = await import_sources(
-                    client, nid, discovered,
-                    task_id=research_task_id,
-                    source_mode=source_mode,
-                )
-                ok(f"已导入 {imported_count} 个来源  ({time.time()-t0:.1f}s)")
+            journal.step("imported", discovered=discovered, imported=imported_count)
 
         # ── Step 5: 等待来源处理 ──────────────────────────
-        step(5, total, "等待来源处理...")
-        if imported_count > 0:
-            # 动态等待: 基础30s + 每来源3s, 上限300s
-            wait_s = min(30 + imported_count * 3, 300)
-            for i in range(wait_s):
-                sys.stdout.write(f"\r    等待中... {i+1}/{wait_s}s")
-                sys.stdout.flush()
-                await asyncio.sleep(1)
-            print()
-            ok("来源处理完成")
+        if journal.has("ready"):
+            step(5, total, "来源已处理完成 (上次运行)")
         else:
-            ok("无需等待")
+            step(5, total, "等待来源处理...")
+            if imported_count > 0:
+                t0 = time.time()
+                ready, errors = await wait_sources_ready(client, nid, skip=set(prior))
+                ok(f"来源处理完成: {ready} 就绪" + (f", {errors} 出错" if errors else "")
+                   + f"  ({time.time()-t0:.1f}s)")
+            else:
+                ok("无需等待")
+            found = await record_sources(client, index, nid, discovered)
+            journal.step("ready", source_ids=sorted(set(found.values())))
 
         # ── Step 6: 生成视频 ──────────────────────────────
-        step(6, total, "提交视频生成...")
-        t0 = time.time()
-        gen = await client.artifacts.generate_video(
-            notebook_id=nid,
-            instructions=prompt or None,
-            video_style=vstyle,
-            language=language,
-        )
-        tid = gen.task_id
-        ok(f"视频任务: {tid}")
-
-        safe = "".join(c if c.isalnum() or c in "._- " else "_" for c in topic)[:50]
-        ts = time.strftime("%Y%m%d_%H%M%S")
-        fpath = str(out / f"{safe}_{ts}.mp4")
-
-        info(f"等待视频完成 (最长 {int(timeout)}s，完成即尝试下载)...")
-        t1 = time.time()
-        final = None
-        result_path = None
-        poll_count = 0
-        rapid_mode = False  # 接近完成时切换快速模式
-        while time.time() - t1 < timeout:
-            await asyncio.sleep(2.0 if rapid_mode else 3.0)
-            poll_count += 1
-            try:
-                status_obj = await client.artifacts.poll_status(nid, tid)
-                elapsed = time.time() - t0
-                tag = " ⚡" if rapid_mode else ""
-                sys.stdout.write(f"\r    #{poll_count} 状态: {status_obj.status}  ({elapsed:.0f}s){tag}   ")
-                sys.stdout.flush()
-
-                if status_obj.status in ("failed", "error"):
-                    print()
-                    final = status_obj
-                    break
-
-                if status_obj.status in ("completed", "done"):
-                    try:
-                        result_path = await client.artifacts.download_video(nid, fpath, artifact_id=tid)
-                        print()
-                        ok(f"视频生成完成并已下载!  ({time.time()-t0:.1f}s)")
-                        ok(f"已保存: {result_path}")
-                        break
-                    except ArtifactNotReadyError:
-                        rapid_mode = True
-                    except ArtifactParseError:
-                        rapid_mode = True
-                    except Exception as e:
-                        warn(f"下载异常: {e}，继续重试")
-                        rapid_mode = True
-                else:
-                    # 主动探测下载: 快速模式每次都试, 普通模式每3次试一次
-                    should_try = rapid_mode or (poll_count % 3 == 0 and poll_count >= 2)
-                    if should_try:
-                        try:
-                            result_path = await client.artifacts.download_video(nid, fpath, artifact_id=tid)
-                            print()
-                            ok(f"视频已可下载!  ({time.time()-t0:.1f}s)")
-                            ok(f"已保存: {result_path}")
-                            break
-                        except ArtifactNotReadyError:
-                            pass
-                        except ArtifactParseError:
-                            if not rapid_mode:
-                                rapid_mode = True
-                                info("检测到视频接近完成，切换快速轮询...")
-                        except Exception:
-                            pass
-            except Exception:
-                pass
+        if journal.has("generation"):
+            tid, fpath = journal.data["task_id"], journal.data["output"]
+            step(6, total, f"继续等待上次的视频任务: {tid}")
+            t0 = time.time()
         else:
-            if final is None:
-                print()
-                err(f"视频生成超时 ({int(timeout)}s)，但任务仍在后台运行")
-                print(f"\n  {Y}恢复命令:{X}")
-                print(f'  python quick_video.py "{topic}" --resume {nid} {tid}\n')
-                return None
+            step(6, total, "提交视频生成...")
+            t0 = time.time()
+            gen = await client.artifacts.generate_video(
+                notebook_id=nid,
+                instructions=prompt or None,
+                video_style=vstyle,
+                language=language,
+            )
+            tid = gen.task_id
+            ok(f"视频任务: {tid}")
+
+            safe = "".join(c if c.isalnum() or c in "._- " else "_" for c in topic)[:50]
+            ts = time.strftime("%Y%m%d_%H%M%S")
+            fpath = str(out / f"{safe}_{ts}.mp4")
+            journal.step("generation", task_id=tid, output=fpath)
+
+        info(f"等待视频完成 (最长 {int(timeout)}s，完成即下载)...")
+        final, result_path = await watch_video(client, nid, tid, fpath, timeout, t0)
+        if final is None:
+            err(f"视频生成超时 ({int(timeout)}s)，但任务仍在后台运行")
+            print(f"\n  {Y}恢复: 重新运行同一主题即可继续等待，或:{X}")
+            print(f'  python quick_video.py "{topic}" --resume {nid} {tid}\n')
+            return None
 
-        if final is not None and final.status in ("failed", "error"):
+        if final.is_failed:
             err(f"视频状态异常: {final.status}")
             if getattr(final, "error", None):
                 err(f"错误: {final.error}")
+            journal.undo("generation", "task_id", "output")  # 重跑时重新提交生成
             return None
 
-        if final is not None and final.status not in ("completed", "done"):
-            return None
+        if result_path is not None:
+            ok(f"视频生成完成并已下载!  ({time.time()-t0:.1f}s)")
+            ok(f"已保存: {result_path}")
 
         if result_path is None:
             step(7, total, "下载视频...")
@@ -771,6 +992,7 @@ async def run(
             except Exception as e:
                 err(f"下载失败: {e}")
                 return None
+        journal.step("done", output=result_path)
 
     # ── 完成 ──────────────────────────────────────────────
     print(f"\n{G}{'═'*60}{X}")
@@ -782,6 +1004,89 @@ async def run(
     return result_path
 
 
+async def collect_sources(
+    client, nid: str, topic: str, journal, index,
+    source_mode: str, research_mode: str, platforms: list[str] | None, max_results: int,
+    year: int | None, file_paths: list[str] | None, upload_concurrency: int,
+    no_confirm: bool, reuse: bool,
+) -> tuple[list[dict], int | None]:
+    """Step 2-4: 获取来源、阶段确认并导入，返回 (来源列表, 导入数)；取消或出错时导入数为 None。
+
+    Research 完成即写入 journal，导入前崩溃重跑时不再重复 Research。
+    """
+    total = 7
+    discovered = []
+    research_task_id = None
+
+    if journal.has("research"):
+        discovered = list(journal.data.get("research_sources", []))
+        research_task_id = journal.data.get("research_task_id")
+        step(2, total, f"Research 已在上次运行中完成 ({len(discovered)} 个来源)，跳过")
+    elif source_mode in ("research", "mixed"):
+        discovered = await source_deep_research(client, nid, topic, research_mode, use_cache=reuse,
+                                                no_confirm=no_confirm)
+        try:
+            task_info = await client.research.poll(nid)
+            research_task_id = task_info.get("task_id")
+        except Exception:
+            pass
+        if discovered:  # 空结果不记入日志，重跑时重新 Research
+            journal.step("research", research_sources=list(discovered), research_task_id=research_task_id)
+
+    if source_mode in ("search", "mixed"):
+        papers = await source_paper_search(topic, platforms or ["arxiv", "semantic_scholar"], max_results, year)
+        discovered.extend(papers)
+
+    if source_mode == "upload":
+        discovered = await source_upload(client, nid)
+
+    if source_mode == "file":
+        if not file_paths:
+            err("--source file 需要 --files 参数指定文件路径")
+            return discovered, None
+        discovered = await source_local_files(client, nid, file_paths, upload_concurrency,
+                                              known=index.sources(nid))
+
+    if source_mode == "paper":
+        discovered = await source_paper_title(
+            client, nid, topic,
+            platforms or ["arxiv", "semantic_scholar"],
+            max_results, no_confirm,
+        )
+
+    # ── 阶段确认 ─────────────────────────────────────
+    print_sources_table(discovered, "发现的来源")
+
+    if source_mode in ("upload", "file"):
+        # upload/file 模式来源已在笔记本中，无需再调用 import_sources
+        if not confirm(f"笔记本中有 {len(discovered)} 个来源，继续生成视频?", no_confirm):
+            print(f"\n  {Y}已取消{X}\n")
+            return discovered, None
+        imported_count = len(discovered)
+    else:
+        if not discovered:
+            warn("没有找到任何来源")
+            if not confirm("继续使用空笔记本生成视频?", no_confirm):
+                print(f"\n  {Y}已取消{X}\n")
+                return discovered, None
+            imported_count = 0
+        else:
+            if not confirm(f"将 {len(discovered)} 个来源导入笔记本并生成视频?", no_confirm):
+                print(f"\n  {Y}已取消{X}\n")
+                return discovered, None
+
+            step(4, total, "导入来源到笔记本...")
+            t0 = time.time()
+            imported_count = await import_sources(
+                client, nid, discovered,
+                task_id=research_task_id,
+                source_mode=source_mode,
+            )
+            ok(f"已导入 {imported_count} 个来源  ({time.time()-t0:.1f}s)")
+
+    return discovered, imported_count
+
+
 # ══════════════════════════════════════════════════════════
 #  恢复超时的视频生成
 # ══════════════════════════════════════════════════════════
@@ -799,37 +1104,9 @@ async def resume_video(
     print(f"  任务:   {task_id}")
     print(f"{'═'*60}\n", flush=True)
 
-    storage = os.environ.get(
-        "NOTEBOOKLM_STORAGE_PATH",
-        str(Path.home() / ".notebooklm" / "storage_state.json"),
-    )
-
-    # 自动登录重试
-    for _login_attempt in range(2):
-        try:
-            client_ctx = await NotebookLMClient.from_storage(storage)
-            break
-        except (ValueError, Exception) as e:
-            if _login_attempt == 0 and ("expired" in str(e).lower() or "authentication" in str(e).lower() or "redirect" in str(e).lower()):
-                warn(f"认证过期，尝试自动刷新...")
-                import subprocess
-                login_script = str(CLI_DIR / "tools" / "auto_login.py")
-                login_result = subprocess.run(
-                    [sys.executable, login_script, "--refresh"],
-                    timeout=120,
-                )
-                if login_result.returncode != 0:
-                    warn("无头刷新失败，尝试打开浏览器登录...")
-                    login_result = subprocess.run(
-                        [sys.executable, login_script],
-                        timeout=720,
-                    )
-                if login_result.returncode != 0:
-                    err("自动登录失败，请手动运行: python tools/auto_login.py")
-                    return None
-                ok("认证刷新成功，继续执行...")
-                continue
-            raise
+    client_ctx = await open_client()
+    if client_ctx is None:
+        return None
 
     async with client_ctx as client:
         step(1, 2, "检查视频状态 (完成即尝试下载)...")
@@ -837,68 +1114,19 @@ async def resume_video(
         safe = "".join(c if c.isalnum() or c in "._- " else "_" for c in topic)[:50]
         ts = time.strftime("%Y%m%d_%H%M%S")
         fpath = str(out / f"{safe}_{ts}.mp4")
-        result_path = None
-        poll_count = 0
-        rapid_mode = False
-        while time.time() - t0 < timeout:
-            await asyncio.sleep(2.0 if rapid_mode else 3.0)
-            poll_count += 1
-            try:
-                status_obj = await client.artifacts.poll_status(notebook_id, task_id)
-                elapsed = time.time() - t0
-                tag = " ⚡" if rapid_mode else ""
-                sys.stdout.write(f"\r    #{poll_count} 状态: {status_obj.status}  ({elapsed:.0f}s){tag}   ")
-                sys.stdout.flush()
-
-                if status_obj.status in ("failed", "error"):
-                    print()
-                    err(f"视频失败: {status_obj.error or status_obj.status}")
-                    return None
+        final, result_path = await watch_video(client, notebook_id, task_id, fpath, timeout, t0)
+        if final is None:
+            err(f"仍然超时 ({timeout}s)")
+            info(f"稍后再试: python quick_video.py \"{topic}\" --resume {notebook_id} {task_id}")
+            return None
 
-                if status_obj.status in ("completed", "done"):
-                    try:
-                        result_path = await client.artifacts.download_video(
-                            notebook_id, fpath, artifact_id=task_id
-                        )
-                        print()
-                        ok(f"视频已完成并已下载!  ({time.time()-t0:.1f}s)")
-                        ok(f"已保存: {result_path}")
-                        break
-                    except ArtifactNotReadyError:
-                        rapid_mode = True
-                    except ArtifactParseError:
-                        rapid_mode = True
-                    except Exception as e:
-                        warn(f"下载异常: {e}，继续重试")
-                        rapid_mode = True
-                else:
-                    should_try = rapid_mode or (poll_count % 3 == 0 and poll_count >= 2)
-                    if should_try:
-                        try:
-                            result_path = await client.artifacts.download_video(
-                                notebook_id, fpath, artifact_id=task_id
-                            )
-                            print()
-                            ok(f"视频已可下载!  ({time.time()-t0:.1f}s)")
-                            ok(f"已保存: {result_path}")
-                            break
-                        except ArtifactNotReadyError:
-                            pass
-                        except ArtifactParseError:
-                            if not rapid_mode:
-                                rapid_mode = True
-                                info("检测到视频接近完成，切换快速轮询...")
-                        except Exception:
-                            pass
-            except Exception as e:
-                sys.stdout.write(f"\r    轮询出错: {e}   ")
-                sys.stdout.flush()
-        else:
-            if result_path is None:
-                print()
-                err(f"仍然超时 ({timeout}s)")
-                info(f"稍后再试: python quick_video.py \"{topic}\" --resume {notebook_id} {task_id}")
-                return None
+        if final.is_failed:
+            err(f"视频失败: {final.error or final.status}")
+            return None
+
+        if result_path is not None:
+            ok(f"视频已完成并已下载!  ({time.time()-t0:.1f}s)")
+            ok(f"已保存: {result_path}")
 
         if result_path is None:
             step(2, 2, "下载视频...")
@@ -915,6 +1143,46 @@ async def resume_video(
     return result_path
 
 
+# ══════════════════════════════════════════════════════════
+#  批量: 多个主题并发生成
+# ══════════════════════════════════════════════════════════
+
+async def run_batch(jobs: list[dict], concurrency: int = BATCH_CONCURRENCY) -> list:
+    """并发执行多个 run()，返回与 jobs 顺序一致的视频路径列表 (失败为 None)。
+
+    jobs 中每项是 run() 的关键字参数 (至少含 topic)。所有主题共用一个
+    事件循环和一个已登录的客户端，同时最多 concurrency 个主题在跑；
+    视频生成大部分时间在等待，N 个主题的总耗时接近最慢的那一个。
+    批量模式不做交互确认。
+    """
+    concurrency = max(1, concurrency)
+    print(f"\n{B}批量生成: {len(jobs)} 个主题, 并发 {concurrency}{X}", flush=True)
+    client_ctx = await open_client()
+    if client_ctx is None:
+        return [None] * len(jobs)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(job: dict):
+        _PROGRESS_TAG.set(f"[{job['topic'][:16]}] ")  # 每个主题是独立任务，前缀互不影响
+        async with sem:
+            try:
+                return await run(**{**job, "no_confirm": True, "client": client})
+            except (Exception, SystemExit) as e:
+                err(f"[{job['topic']}] 失败: {type(e).__name__}: {e}")
+                return None
+
+    t0 = time.time()
+    async with client_ctx as client:
+        results = await asyncio.gather(*(one(job) for job in jobs))
+
+    print(f"\n{B}批量结果 ({time.time()-t0:.0f}s):{X}")
+    for job, path in zip(jobs, results):
+        mark = f"{G}✓{X}" if path else f"{R}✗{X}"
+        print(f"  {mark} {job['topic']}  {D}{path or ''}{X}")
+    return results
+
+
 # ══════════════════════════════════════════════════════════
 #  CLI
 # ══════════════════════════════════════════════════════════
@@ -931,14 +1199,17 @@ def main():
   python quick_video.py "LLM" --source mixed --style anime --no-confirm
   python quick_video.py "Attention" --source file --files paper.pdf ./more_papers/
   python quick_video.py "Transformer" --source paper --platforms arxiv
+  python quick_video.py "生物智能体" "蛋白质折叠" "量子计算" --concurrency 3
         """,
     )
-    p.add_argument("topic", help="视频主题")
+    p.add_argument("topic", nargs="+", help="视频主题 (多个主题时并发批量生成)")
     p.add_argument("--source", default="research",
                    choices=["research", "search", "upload", "mixed", "file", "paper"],
                    help="来源模式: research=NotebookLM检索, search=自主文献检索, file=本地文件 (默认: research)")
     p.add_argument("--files", nargs="+", default=None,
                    help="本地文件或目录路径 (用于 --source file)")
+    p.add_argument("--upload-concurrency", type=int, default=FILE_UPLOAD_CONCURRENCY,
+                   help=f"本地文件同时上传数 (默认: {FILE_UPLOAD_CONCURRENCY})")
     p.add_argument("--style", default="whiteboard", choices=list(STYLE_MAP.keys()),
                    help="视频风格 (默认: whiteboard)")
     p.add_argument("--lang", default="zh-CN", help="语言 (默认: zh-CN)")
@@ -957,6 +1228,10 @@ def main():
                    help="自定义视频指令 (覆盖 video.md)")
     p.add_argument("--no-confirm", action="store_true",
                    help="跳过阶段确认")
+    p.add_argument("--fresh", action="store_true",
+                   help="总是新建笔记本并重新 Research (默认复用 7 天内相近主题的笔记本、3 天内的 Research 结果)")
+    p.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY,
+                   help=f"多主题时同时生成的数量 (默认: {BATCH_CONCURRENCY})")
     p.add_argument("--check", action="store_true",
                    help="仅检查 NotebookLM 连通性，不生成视频")
     p.add_argument("--resume", nargs=2, metavar=("NOTEBOOK_ID", "TASK_ID"),
@@ -974,18 +1249,25 @@ def main():
     if a.resume:
         nid, tid = a.resume
         result = asyncio.run(resume_video(
-            notebook_id=nid, task_id=tid, topic=a.topic,
+            notebook_id=nid, task_id=tid, topic=a.topic[0],
             output_dir=a.output, timeout=a.timeout,
         ))
         sys.exit(0 if result else 1)
 
-    result = asyncio.run(run(
-        topic=a.topic, source_mode=a.source, style=a.style,
+    opts = dict(
+        source_mode=a.source, style=a.style,
         language=a.lang, research_mode=a.mode, platforms=a.platforms,
         max_results=a.max_results, year=a.year, output_dir=a.output,
         timeout=a.timeout, instructions=a.instructions, no_confirm=a.no_confirm,
-        file_paths=a.files,
-    ))
+        file_paths=a.files, upload_concurrency=a.upload_concurrency,
+        reuse=not a.fresh,
+    )
+    if len(a.topic) > 1:
+        results = asyncio.run(run_batch(
+            [{"topic": t, **opts} for t in a.topic], concurrency=a.concurrency))
+        result = any(results)
+    else:
+        result = asyncio.run(run(topic=a.topic[0], **opts))
 
     if not result:
         sys.exit(1)
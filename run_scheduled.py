@@ -3,12 +3,17 @@
 run_scheduled.py - Daily scheduled pipeline entry point
 ========================================================
 Reads schedule.txt (tab-separated), picks today's topic, runs Phase 1 (quick_video)
-and Phase 2 (publish.py) sequentially.
+and Phase 2 (publish.py) sequentially. With --batch N, Phase 1 generates up to N
+pending topics concurrently in one event loop, then Phase 2 publishes them once.
+Phase 1 keeps a per-topic run journal (see quick_video.py): after a crash or
+a generation timeout the topic stays pending and the next run resumes it from
+the last completed step.
 
 Usage:
     python run_scheduled.py                  # Run today's scheduled topic
     python run_scheduled.py --dry-run        # Show what would run without executing
     python run_scheduled.py --force "topic"  # Override with a specific topic
+    python run_scheduled.py --batch 3        # Generate up to 3 pending topics concurrently
 
 Designed for OpenClaw cron integration (see setup_cron.py).
 """
@@ -123,14 +128,20 @@ def pick_topic(entries: list[dict]) -> dict | None:
     """Select today's topic from schedule.
 
     Priority:
-    1. Date-matched pending topic (exact match on today's date)
-    2. First pending item from queue (FIFO)
+    1. Pending topic with an interrupted run to resume (any date, see resumable())
+    2. Date-matched pending topic (exact match on today's date)
+    3. First pending item from queue (FIFO)
 
     Returns:
         dict with topic entry or None if nothing scheduled
     """
     today = datetime.now().strftime("%Y-%m-%d")
 
+    # Resume interrupted runs first; their date may already be past
+    for entry in entries:
+        if entry["status"] == "pending" and resumable(entry):
+            return entry
+
     # Check date-specific topics
     for entry in entries:
         if entry["date"] == today and entry["status"] == "pending":
@@ -144,6 +155,17 @@ def pick_topic(entries: list[dict]) -> dict | None:
     return None
 
 
+def pick_topics(entries: list[dict], limit: int) -> list[dict]:
+    """Select up to `limit` pending topics in pick_topic() order: interrupted runs to
+    resume (any date), then today's date-matched ones, then the queue (FIFO)."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    pending = [e for e in entries if e["status"] == "pending"]
+    picked = [e for e in pending if resumable(e)]
+    picked += [e for e in pending if e["date"] == today and e not in picked]
+    picked += [e for e in pending if e["date"] == "queue" and e not in picked]
+    return picked[:limit]
+
+
 def mark_completed(entries: list[dict], topic_entry: dict, success: bool = True):
     """Mark topic as completed/failed in schedule and save."""
     for entry in entries:
@@ -167,6 +189,20 @@ def mark_completed(entries: list[dict], topic_entry: dict, success: bool = True)
         f.write(history_line)
 
 
+def resumable(entry: dict) -> bool:
+    """Phase 1 left a submitted video task behind (timeout): keep the entry pending to resume it.
+
+    False once the run journal is too old or out of resume attempts, so a
+    video task that never finishes ends up marked failed.
+    """
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from quick_video import has_resumable_run
+        return has_resumable_run(entry["topic"], entry["source_mode"])
+    except Exception:
+        return False
+
+
 def print_schedule_overview(entries: list[dict]):
     """Print schedule overview before picking topic."""
     today = datetime.now().strftime("%Y-%m-%d")
@@ -223,6 +259,33 @@ async def run_phase1(topic: str, source_mode: str, defaults: dict) -> bool:
         return False
 
 
+async def run_phase1_batch(topic_entries: list[dict], concurrency: int) -> list[bool]:
+    """Run Phase 1 for several topics concurrently (quick_video.run_batch, one client)."""
+    print(f"\n{'='*60}")
+    print(f"  {B}Phase 1: Generate Videos (batch){X}")
+    for e in topic_entries:
+        print(f"  Topic: {C}{e['topic']}{X}  ({e['source_mode']})")
+    print(f"{'='*60}\n")
+
+    try:
+        sys.path.insert(0, str(PROJECT_ROOT))
+        from quick_video import run_batch
+
+        results = await run_batch([
+            {
+                "topic": e["topic"],
+                "source_mode": e["source_mode"],
+                "max_results": e.get("max_results", 5),
+            }
+            for e in topic_entries
+        ], concurrency=concurrency)
+        return [bool(r) for r in results]
+
+    except Exception as e:
+        print(f"\n  {R}Phase 1 error: {e}{X}")
+        return [False] * len(topic_entries)
+
+
 def run_phase2(defaults: dict) -> bool:
     """Run Phase 2: publish.py (subprocess for GPU memory isolation)."""
     print(f"\n{'='*60}")
@@ -262,6 +325,83 @@ def run_phase2(defaults: dict) -> bool:
         return False
 
 
+def run_post_hook(args):
+    """Run --post-hook, if any (errors are reported, not raised)."""
+    if not args.post_hook:
+        return
+    print(f"  {C}Running post-hook:{X} {args.post_hook}")
+    hook_env = os.environ.copy()
+    hook_env["PYTHONIOENCODING"] = "utf-8"
+    hook_env["PYTHONUNBUFFERED"] = "1"
+    try:
+        subprocess.run(
+            [get_python(), "-u"] + shlex.split(args.post_hook),
+            cwd=str(PROJECT_ROOT),
+            env=hook_env,
+            timeout=300,
+        )
+    except Exception as e:
+        print(f"  {Y}Post-hook error: {e}{X}")
+
+
+async def run_batch_pipeline(args, entries: list[dict], batch: list[dict]):
+    """--batch: Phase 1 for all picked topics concurrently, then one Phase 2 run."""
+    platforms_list = args.publish_platforms or sorted({
+        p.strip() for e in batch for p in e.get("platforms", "bilibili").split(",") if p.strip()
+    })
+    print(f"  Batch: {len(batch)} topics, concurrency {args.concurrency}")
+    print(f"  Platforms: {platforms_list}")
+    print()
+
+    if args.dry_run:
+        for e in batch:
+            print(f"    {C}{e['topic']}{X}  ({e['source_mode']})")
+        print(f"  {Y}[DRY RUN] Would run the above pipeline. Exiting.{X}")
+        return
+
+    phase1 = await run_phase1_batch(batch, args.concurrency)
+    for entry, ok in zip(batch, phase1):
+        if not ok and resumable(entry):
+            print(f"  {Y}{entry['topic']}: video task still running, left pending to resume{X}")
+            continue
+        mark_completed(entries, entry, success=ok)
+
+    if not any(phase1):
+        print(f"\n{R}Pipeline aborted: every topic failed in Phase 1.{X}")
+        phase2_ok = False
+    elif not args.skip_phase2:
+        phase2_ok = run_phase2({"platforms": platforms_list})
+    else:
+        print(f"  {Y}Phase 2 skipped (--skip-phase2){X}")
+        phase2_ok = True
+
+    summary = {
+        "topics": [
+            {"topic": e["topic"], "source_mode": e["source_mode"], "phase1": "ok" if ok else "fail"}
+            for e, ok in zip(batch, phase1)
+        ],
+        "platforms": platforms_list,
+        "phase2": "ok" if phase2_ok else ("skip" if args.skip_phase2 else "fail"),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+
+    if args.json:
+        import json
+        print(json.dumps(summary, ensure_ascii=False))
+    else:
+        print(f"\n{'='*60}")
+        print(f"  {B}Pipeline Summary (batch){X}")
+        for e, ok in zip(batch, phase1):
+            print(f"  Phase 1: {'OK  ' if ok else 'FAIL'}  {e['topic']}")
+        print(f"  Phase 2: {'OK' if phase2_ok else 'FAIL'}")
+        print(f"{'='*60}\n")
+
+    run_post_hook(args)
+
+    if not all(phase1) or (not args.skip_phase2 and not phase2_ok):
+        sys.exit(1)
+
+
 async def main():
     parser = argparse.ArgumentParser(description="Run scheduled PaperTalker pipeline")
     parser.add_argument("--dry-run", action="store_true", help="Show what would run without executing")
@@ -272,6 +412,10 @@ async def main():
     parser.add_argument("--publish-platforms", nargs="+", help="Override publish platforms (default from schedule)")
     parser.add_argument("--pre-hook", type=str, help="Script to run before topic selection (e.g., 'auto_tracker.py --write-schedule')")
     parser.add_argument("--post-hook", type=str, help="Script to run after pipeline completion")
+    parser.add_argument("--batch", type=int, default=1, metavar="N",
+                        help="Generate up to N pending topics concurrently (default: 1)")
+    parser.add_argument("--concurrency", type=int, default=3,
+                        help="Max topics generating at once in --batch mode (default: 3)")
     args = parser.parse_args()
 
     print(f"\n{B}PaperTalker Scheduled Run{X}")
@@ -318,6 +462,14 @@ async def main():
             "notes": "",
         }
         print(f"  {Y}Forced topic: {args.force}{X}")
+    elif args.batch > 1:
+        batch = pick_topics(entries, args.batch)
+        if not batch:
+            print(f"  {Y}No pending topics scheduled for today.{X}")
+            print(f"  {D}Add topics to schedule.txt or use --force \"topic\"{X}")
+            return
+        await run_batch_pipeline(args, entries, batch)
+        return
     else:
         topic_entry = pick_topic(entries)
         if not topic_entry:
@@ -349,7 +501,10 @@ async def main():
     if not phase1_ok:
         print(f"\n{R}Pipeline aborted after Phase 1 failure.{X}")
         if topic_entry["date"] != "force":
-            mark_completed(entries, topic_entry, success=False)
+            if resumable(topic_entry):
+                print(f"  {Y}Video task still running; topic left pending, the next run resumes it{X}")
+            else:
+                mark_completed(entries, topic_entry, success=False)
         return
 
     # Phase 2: Subtitle + Upload (subprocess)
@@ -386,20 +541,7 @@ async def main():
         print(f"{'='*60}\n")
 
     # ── Post-hook ──
-    if args.post_hook:
-        print(f"  {C}Running post-hook:{X} {args.post_hook}")
-        hook_env = os.environ.copy()
-        hook_env["PYTHONIOENCODING"] = "utf-8"
-        hook_env["PYTHONUNBUFFERED"] = "1"
-        try:
-            subprocess.run(
-                [get_python(), "-u"] + shlex.split(args.post_hook),
-                cwd=str(PROJECT_ROOT),
-                env=hook_env,
-                timeout=300,
-            )
-        except Exception as e:
-            print(f"  {Y}Post-hook error: {e}{X}")
+    run_post_hook(args)
 
     # Exit code: 0 if both phases ok, 1 otherwise (for cron/OpenClaw)
     if not phase1_ok or (not args.skip_phase2 and not phase2_ok):
@@ -48,7 +48,8 @@ DEFAULT_OUTPUT = PROJECT_ROOT / "output_subtitled"
 COOKIE_FILE = PROJECT_ROOT / "cookies" / "bilibili" / "account.json"
 WEIXIN_STORAGE_STATE = PROJECT_ROOT / "cookies" / "weixin" / "storage_state.json"
 WEIXIN_MP_PROFILE_DIR = PROJECT_ROOT / "cookies" / "weixin_mp" / "browser_profile"
-RUN_HISTORY_FILE = PROJECT_ROOT / "skills" / "paper-talker" / "references" / "run_history.json"
+RUN_HISTORY_FILE = PROJECT_ROOT / "skills" / "paper-talker" / "references" / "run_history.json"  # legacy, imported once
+RUN_HISTORY_DB = RUN_HISTORY_FILE.with_suffix(".db")
 
 def _get_biliup_exe() -> Path:
     """Get platform-specific biliup binary path."""
@@ -1641,24 +1642,94 @@ def upload_bilibili(video_path, title: str, desc: str, tags: str,
 
 # ── Run history ─────────────────────────────────────────────
 
-def load_run_history() -> list:
-    """Load previous successful run records."""
+# Same database and schema as the root publish.py (run_history.db)
+_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id     INTEGER PRIMARY KEY,
+    date   TEXT NOT NULL,
+    topic  TEXT NOT NULL,
+    job    TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_topic ON runs(topic);
+CREATE INDEX IF NOT EXISTS runs_date ON runs(date);
+CREATE TABLE IF NOT EXISTS uploads (
+    run_id   INTEGER NOT NULL REFERENCES runs(id),
+    platform TEXT NOT NULL,
+    status   TEXT NOT NULL,
+    ok       INTEGER NOT NULL,
+    PRIMARY KEY (run_id, platform)
+);
+CREATE INDEX IF NOT EXISTS uploads_failed ON uploads(ok, platform);
+"""
+
+
+def _history_db():
+    """Open the run-history database; an empty one imports the legacy run_history.json."""
+    import sqlite3
+    RUN_HISTORY_DB.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(RUN_HISTORY_DB, timeout=30)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA busy_timeout=30000")
+    db.executescript(_HISTORY_SCHEMA)
     if RUN_HISTORY_FILE.exists():
-        try:
-            return json.loads(RUN_HISTORY_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return []
-    return []
+        imported = False
+        db.execute("BEGIN IMMEDIATE")
+        with db:
+            if RUN_HISTORY_FILE.exists() and not db.execute("SELECT 1 FROM runs LIMIT 1").fetchone():
+                try:
+                    legacy = json.loads(RUN_HISTORY_FILE.read_text(encoding="utf-8"))
+                except Exception:
+                    legacy = None
+                if isinstance(legacy, list):
+                    for rec in legacy:
+                        _insert_run(db, rec)
+                    imported = True
+        if imported:
+            try:
+                RUN_HISTORY_FILE.replace(RUN_HISTORY_FILE.with_suffix(".json.imported"))
+            except OSError:
+                pass
+    return db
+
+
+def _insert_run(db, record: dict):
+    cur = db.execute(
+        "INSERT INTO runs (date, topic, job, record) VALUES (?, ?, ?, ?)",
+        (record.get("date", ""), record.get("topic", ""), record.get("job"),
+         json.dumps(record, ensure_ascii=False)),
+    )
+    db.executemany(
+        "INSERT OR REPLACE INTO uploads (run_id, platform, status, ok) VALUES (?, ?, ?, ?)",
+        [(cur.lastrowid, plat, status, int(status.startswith("ok")))
+         for plat, status in record.get("uploads", {}).items() if isinstance(status, str)],
+    )
+
+
+def load_run_history(limit: int = None) -> list:
+    """Load run records, oldest first (only the last `limit` when given)."""
+    try:
+        db = _history_db()
+    except Exception:
+        return []
+    try:
+        if limit:
+            rows = db.execute("SELECT record FROM runs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()[::-1]
+        else:
+            rows = db.execute("SELECT record FROM runs ORDER BY id").fetchall()
+        return [json.loads(r[0]) for r in rows]
+    finally:
+        db.close()
 
 
 def save_run_record(record: dict):
-    """Append a successful run record to history."""
-    history = load_run_history()
-    history.append(record)
-    # Keep last 50 records
-    history = history[-50:]
-    RUN_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    RUN_HISTORY_FILE.write_text(json.dumps(history, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Append a run record to history."""
+    db = _history_db()
+    try:
+        with db:
+            _insert_run(db, record)
+    finally:
+        db.close()
 
 
 def _run_weixin_channels_subprocess(video_path: Path, title: str, desc: str, tags: str, cover_path: Path = None) -> dict:
@@ -2044,7 +2115,7 @@ def main():
         sys.exit(1)
 
     # Show run history summary
-    history = load_run_history()
+    history = load_run_history(limit=1)
     if history:
         last = history[-1]
         print(f"Last run: {D}{last.get('date','?')[:10]} | {last.get('topic','?')} | {last.get('uploads',{})}{X}")
@@ -40,6 +40,7 @@ if sys.platform == "win32":
 MAX_CHARS_PER_LINE = 18  # Max Chinese chars per subtitle line
 MAX_DURATION_PER_SUB = 6.0  # Max seconds a single subtitle can display
 OVERLAP_SECONDS = 3.0  # Overlap between chunks to avoid cutting mid-sentence
+SAMPLE_RATE = 16000  # Whisper input rate (16kHz mono)
 
 G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; C = "\033[96m"; D = "\033[2m"; X = "\033[0m"
 
@@ -79,20 +80,247 @@ def extract_audio(ffmpeg: str, video_path: Path, wav_path: Path) -> bool:
     return result.returncode == 0
 
 
-def split_audio(ffmpeg: str, wav_path: Path, num_chunks: int, tmpdir: str) -> list:
-    """Split WAV into overlapping chunks for parallel transcription.
+def probe_duration(ffmpeg: str, media_path: Path) -> float:
+    """Get media duration from the container header (no decode).
 
-    Returns list of (chunk_path, start_time, end_time, clean_start, clean_end).
-    - start_time/end_time: actual audio range of the chunk (includes overlap)
-    - clean_start/clean_end: the "owned" range for this chunk (no overlap)
+    `ffmpeg -i` without an output exits non-zero but prints the input info,
+    which is much cheaper than get_audio_duration()'s full decode.
     """
-    duration = get_audio_duration(ffmpeg, wav_path)
+    result = subprocess.run(
+        [ffmpeg, "-i", str(media_path)],
+        capture_output=True, text=True, encoding="utf-8", errors="replace",
+    )
+    m = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", result.stderr or "")
+    if not m:
+        return 0.0
+    return int(m.group(1)) * 3600 + int(m.group(2)) * 60 + float(m.group(3))
+
+
+class SharedPCM:
+    """16kHz mono s16le PCM held in a named shared-memory block.
+
+    Transcription workers attach by name and slice their own chunk, so the
+    audio is decoded once and never written to disk as WAV (nor as chunk
+    WAVs). Call close() when done; it also unlinks the block.
+    """
+
+    def __init__(self, shm, n_samples: int):
+        self.shm = shm
+        self.n_samples = n_samples
+
+    @property
+    def duration(self) -> float:
+        return self.n_samples / SAMPLE_RATE
+
+    def array(self):
+        """NumPy int16 view of the samples (no copy)."""
+        import numpy as np
+        return np.ndarray((self.n_samples,), dtype=np.int16, buffer=self.shm.buf)
+
+    def spec(self, start: float = 0.0, end: float = None) -> str:
+        """Worker audio argument for the [start, end) seconds slice."""
+        s0 = max(0, int(start * SAMPLE_RATE))
+        s1 = self.n_samples if end is None else min(self.n_samples, int(end * SAMPLE_RATE))
+        return self.spec_ranges([(s0, s1)])
+
+    def spec_ranges(self, sample_ranges: list) -> str:
+        """Worker audio argument for several sample ranges, concatenated in order."""
+        return f"shm:{self.shm.name}:" + ",".join(f"{a}-{b}" for a, b in sample_ranges)
+
+    def close(self):
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # A NumPy view is still alive; the block is unlinked anyway
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def extract_audio_shared(ffmpeg: str, video_path: Path) -> SharedPCM:
+    """Decode audio as raw s16le straight into a preallocated shared-memory buffer.
+
+    The buffer is sized from the container duration (+2% / 2s headroom) and
+    filled with readinto() from FFmpeg's stdout, so no WAV touches the disk.
+
+    Returns:
+        SharedPCM, or None if the duration is unknown, FFmpeg fails, or the
+        stream overflows the buffer (caller should fall back to extract_audio()).
+    """
+    from multiprocessing import shared_memory
+
+    duration = probe_duration(ffmpeg, video_path)
     if duration <= 0:
-        raise RuntimeError("Could not determine audio duration")
+        return None
+    capacity = int((duration * 1.02 + 2) * SAMPLE_RATE) * 2  # bytes
+    shm = shared_memory.SharedMemory(create=True, size=capacity)
 
-    chunk_len = duration / num_chunks
-    chunks = []
+    filled = 0
+    overflow = False
+    try:
+        proc = subprocess.Popen(
+            [ffmpeg, "-loglevel", "error", "-i", str(video_path), "-vn",
+             "-f", "s16le", "-acodec", "pcm_s16le",
+             "-ar", str(SAMPLE_RATE), "-ac", "1", "pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        view = shm.buf
+        while filled < capacity:
+            n = proc.stdout.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+        del view
+        if filled >= capacity and proc.stdout.read(1):
+            overflow = True
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+        ok = proc.returncode == 0 and not overflow and filled > 0
+    except OSError:
+        ok = False
+
+    if not ok:
+        shm.close()
+        shm.unlink()
+        return None
+    return SharedPCM(shm, filled // 2)
+
+
+# ── Speech map (dead-air trimming before ASR) ─────────────────
+
+SPEECH_FRAME_MS = 50        # RMS envelope frame length
+SILENCE_FLOOR_DB = -45.0    # Frames below this (dBFS) are never speech
+MIN_SILENCE_S = 1.0         # Only gaps at least this long are trimmed
+MIN_SPEECH_S = 0.15         # Drop isolated blips shorter than this
+SPEECH_PAD_S = 0.25         # Keep this much context around each region
+
+
+class SpeechMap:
+    """Speech regions of a recording and their silence-trimmed timeline.
+
+    The trimmed timeline is the regions laid end to end; chunking and
+    transcription happen on it, then to_original()/remap() translate
+    timestamps back so the SRT keeps the original timing.
+    """
 
+    def __init__(self, regions: list, duration: float):
+        self.regions = regions  # [(start, end)] seconds in the original audio
+        self.duration = duration
+        self.offsets = []       # start of each region on the trimmed timeline
+        t = 0.0
+        for start, end in regions:
+            self.offsets.append(t)
+            t += end - start
+        self.speech = t
+
+    def to_original(self, t: float) -> float:
+        """Map a trimmed-timeline time to the original recording."""
+        import bisect
+        if not self.regions:
+            return t
+        i = max(0, bisect.bisect_right(self.offsets, t) - 1)
+        start, end = self.regions[i]
+        return min(start + (t - self.offsets[i]), end)
+
+    def sample_ranges(self, start: float, end: float) -> list:
+        """Original-audio sample ranges covering trimmed-timeline [start, end)."""
+        out = []
+        for (r_start, r_end), off in zip(self.regions, self.offsets):
+            lo = max(start, off)
+            hi = min(end, off + (r_end - r_start))
+            if hi > lo:
+                a = int((r_start + lo - off) * SAMPLE_RATE)
+                b = int((r_start + hi - off) * SAMPLE_RATE)
+                if b > a:
+                    out.append((a, b))
+        return out
+
+    def remap(self, data: list) -> list:
+        """Translate segment/word timestamps (dicts) back to the original timeline."""
+        for d in data:
+            d["start"] = self.to_original(d["start"])
+            d["end"] = self.to_original(d["end"])
+            for w in d.get("words", []):
+                w["start"] = self.to_original(w["start"])
+                w["end"] = self.to_original(w["end"])
+        return data
+
+
+def build_speech_map(samples) -> SpeechMap:
+    """Build a SpeechMap from 16kHz mono int16 samples with an RMS envelope.
+
+    Threshold is adaptive: 6 dB above the noise floor (10th percentile of
+    frame loudness) but at most 20 dB below typical speech (90th
+    percentile), and never below SILENCE_FLOOR_DB. Energy-only, so steady
+    background music is kept as "speech" — this trims dead air, not music.
+    """
+    import numpy as np
+
+    frame = SAMPLE_RATE * SPEECH_FRAME_MS // 1000
+    duration = len(samples) / SAMPLE_RATE
+    n = len(samples) // frame
+    if n == 0:
+        return SpeechMap([(0.0, duration)], duration)
+
+    x = samples[:n * frame].astype(np.float32).reshape(n, frame) / 32768.0
+    db = 20 * np.log10(np.maximum(np.sqrt((x * x).mean(axis=1)), 1e-6))
+    thresh = max(SILENCE_FLOOR_DB, min(np.percentile(db, 10) + 6, np.percentile(db, 90) - 20))
+    active = (db > thresh).astype(np.int8)
+    edges = np.diff(np.concatenate(([0], active, [0])))
+    frame_s = SPEECH_FRAME_MS / 1000
+    starts = np.flatnonzero(edges == 1) * frame_s
+    ends = np.flatnonzero(edges == -1) * frame_s
+
+    # Close short gaps, drop blips, then pad and merge
+    regions = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if regions and start - regions[-1][1] < MIN_SILENCE_S:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+    padded = []
+    for start, end in regions:
+        if end - start < MIN_SPEECH_S:
+            continue
+        start, end = max(0.0, start - SPEECH_PAD_S), min(duration, end + SPEECH_PAD_S)
+        if padded and start <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end)
+        else:
+            padded.append((start, end))
+    return SpeechMap(padded, duration)
+
+
+def _load_wav_samples(wav_path: Path):
+    """Read a 16-bit mono WAV into an int16 NumPy array."""
+    import wave
+    import numpy as np
+    with wave.open(str(wav_path), "rb") as w:
+        if w.getsampwidth() != 2 or w.getnchannels() != 1:
+            raise ValueError("expected 16-bit mono WAV")
+        return np.frombuffer(w.readframes(w.getnframes()), dtype=np.int16)
+
+
+def _write_wav(path: Path, samples):
+    """Write int16 samples as a 16kHz mono WAV."""
+    import wave
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(SAMPLE_RATE)
+        w.writeframes(samples.tobytes())
+
+
+def _chunk_ranges(duration: float, num_chunks: int) -> list:
+    """Split [0, duration] into overlapping ranges for parallel transcription.
+
+    Returns list of (start_time, end_time, clean_start, clean_end).
+    - start_time/end_time: actual audio range of the chunk (includes overlap)
+    - clean_start/clean_end: the "owned" range for this chunk (no overlap)
+    """
+    chunk_len = duration / num_chunks
+    ranges = []
     for i in range(num_chunks):
         clean_start = i * chunk_len
         clean_end = min((i + 1) * chunk_len, duration)
@@ -100,7 +328,25 @@ def split_audio(ffmpeg: str, wav_path: Path, num_chunks: int, tmpdir: str) -> li
         actual_start = max(0, clean_start - OVERLAP_SECONDS) if i > 0 else 0
         # Add overlap: extend end forward (except last chunk)
         actual_end = min(duration, clean_end + OVERLAP_SECONDS) if i < num_chunks - 1 else duration
+        ranges.append((actual_start, actual_end, clean_start, clean_end))
+    return ranges
+
 
+def split_audio(ffmpeg: str, wav_path: Path, num_chunks: int, tmpdir: str) -> list:
+    """Split WAV into overlapping chunks for parallel transcription.
+
+    Returns list of (chunk_path, start_time, end_time, clean_start, clean_end).
+    - start_time/end_time: actual audio range of the chunk (includes overlap)
+    - clean_start/clean_end: the "owned" range for this chunk (no overlap)
+    """
+    duration = get_audio_duration(ffmpeg, wav_path)
+    if duration <= 0:
+        raise RuntimeError("Could not determine audio duration")
+
+    chunks = []
+
+    for i, (actual_start, actual_end, clean_start, clean_end) in enumerate(
+            _chunk_ranges(duration, num_chunks)):
         chunk_path = Path(tmpdir) / f"chunk_{i:03d}.wav"
         result = subprocess.run(
             [ffmpeg, "-i", str(wav_path),
@@ -122,6 +368,7 @@ def _transcribe_chunk(args):
     """Worker function to transcribe a single chunk in a subprocess.
 
     Args: tuple of (wav_path, model, device, chunk_index)
+        wav_path may also be a SharedPCM.spec() string ("shm:<name>:<s0>-<s1>[,...]")
     Returns: (chunk_index, data_list, info_line) or raises
     """
     wav_path, model, device, chunk_idx = args
@@ -189,10 +436,31 @@ if _is_mac_arm:
 _platform_tag = "Apple Silicon" if _is_mac_arm else ("CUDA" if _has_cuda else "CPU")
 print(f"  whisper[{sys.argv[5]}]: {_model} on {_device} ({_ctype}) [{_platform_tag}]", flush=True)
 
+# Audio source: WAV path, or shared-memory PCM sample ranges "shm:<name>:<s0>-<s1>[,...]"
+_audio = sys.argv[1]
+if _audio.startswith("shm:"):
+    import numpy as np
+    from multiprocessing import shared_memory
+    _name, _ranges = _audio[4:].rsplit(":", 1)
+    try:
+        _shm = shared_memory.SharedMemory(name=_name, track=False)
+    except TypeError:
+        # Python < 3.13: attach, then detach from this process's resource
+        # tracker so our exit does not unlink the parent's block
+        _shm = shared_memory.SharedMemory(name=_name)
+        if os.name == "posix":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(_shm._name, "shared_memory")
+    _pcm = np.ndarray((_shm.size // 2,), dtype=np.int16, buffer=_shm.buf)
+    _parts = [_pcm[int(a):int(b)] for a, b in (r.split("-") for r in _ranges.split(","))]
+    _audio = np.concatenate(_parts).astype(np.float32) / 32768.0
+    del _pcm, _parts
+    _shm.close()
+
 model = WhisperModel(_model, device=_device, compute_type=_ctype,
                      cpu_threads=_num_threads if _is_mac_arm else 0)
 segments, info = model.transcribe(
-    sys.argv[1], language="zh", beam_size=5,
+    _audio, language="zh", beam_size=5,
     vad_filter=True, vad_parameters=dict(min_silence_duration_ms=500),
     word_timestamps=True,
     initial_prompt="以下是普通话的句子，使用简体中文。",
@@ -316,26 +584,49 @@ def transcribe(wav_path: Path, model: str = None, device: str = None) -> list:
 
 
 def transcribe_parallel(wav_path: Path, model: str = None, device: str = None,
-                         workers: int = 3) -> list:
+                         workers: int = 3, pcm: SharedPCM = None,
+                         trim_silence: bool = False) -> list:
     """Transcribe audio using faster-whisper with parallel chunk processing.
 
     Splits audio into `workers` overlapping chunks, transcribes each in a
     separate subprocess, then merges results with correct timestamps.
 
     Args:
-        wav_path: Path to 16kHz mono WAV file
+        wav_path: Path to 16kHz mono WAV file (ignored when `pcm` is given)
         model: Model name or None for auto
         device: Device or None for auto-detect
         workers: Number of parallel workers (1 = no splitting)
+        pcm: Shared-memory audio from extract_audio_shared(); workers slice
+             it directly instead of reading WAV / chunk WAV files
+        trim_silence: Pre-analyse loudness (build_speech_map) and send only
+             speech regions to the workers; timestamps are mapped back to
+             the original timeline
 
     Returns:
         List of segment objects with .start, .end, .text, .words attributes
     """
-    import pickle
-
-    if workers <= 1:
+    smap = None
+    samples = None
+    if trim_silence:
+        try:
+            samples = pcm.array() if pcm is not None else _load_wav_samples(wav_path)
+            smap = build_speech_map(samples)
+        except (ImportError, ValueError, OSError, EOFError) as e:
+            print(f"\n{Y}  speech map unavailable ({e}), transcribing full audio{X}", flush=True)
+        if smap is not None and (not smap.regions or smap.speech < 1.0
+                                 or smap.speech > smap.duration * 0.97):
+            smap = None  # All silence or nothing worth trimming: use the untrimmed audio
+        if smap is not None:
+            print(f"\n{D}  speech map: {len(smap.regions)} regions, {smap.speech:.0f}s of "
+                  f"{smap.duration:.0f}s ({smap.duration - smap.speech:.0f}s dead air skipped){X}",
+                  flush=True)
+        if pcm is not None:
+            samples = None  # Release the view on the shared block
+
+    if workers <= 1 and smap is None:
         # Single-process: use original behavior (no splitting)
-        result = _transcribe_chunk((str(wav_path), model, device, 0))
+        audio_arg = pcm.spec() if pcm is not None else str(wav_path)
+        result = _transcribe_chunk((audio_arg, model, device, 0))
         _, data, info_line = result
         if info_line:
             print(f"\n{D}{info_line}{X}", flush=True)
@@ -351,10 +642,36 @@ def transcribe_parallel(wav_path: Path, model: str = None, device: str = None,
         return [Seg(d) for d in data]
 
     # Multi-process: split audio into chunks
-    ffmpeg = get_ffmpeg()
+    workers = max(1, workers)
     with tempfile.TemporaryDirectory(prefix="transcribe_") as tmpdir:
-        print(f"\n{D}  splitting audio into {workers} chunks...{X}", flush=True)
-        chunks = split_audio(ffmpeg, wav_path, workers, tmpdir)
+        chunks = None
+        if smap is not None:
+            # Chunk the trimmed (speech-only) timeline; each chunk is one or
+            # more original sample ranges concatenated
+            plan = [(smap.sample_ranges(start, end), start, end, clean_start, clean_end)
+                    for start, end, clean_start, clean_end in _chunk_ranges(smap.speech, workers)]
+            if all(ranges for ranges, *_ in plan):
+                chunks = []
+                for i, (ranges, start, end, clean_start, clean_end) in enumerate(plan):
+                    if pcm is not None:
+                        audio_arg = pcm.spec_ranges(ranges)
+                    else:
+                        import numpy as np
+                        audio_arg = str(Path(tmpdir) / f"chunk_{i:03d}.wav")
+                        _write_wav(audio_arg, np.concatenate([samples[a:b] for a, b in ranges]))
+                    chunks.append((audio_arg, start, end, clean_start, clean_end))
+            else:
+                # A chunk maps to no speech samples: an empty concat would fail
+                print(f"\n{Y}  speech map left an empty chunk, transcribing full audio{X}", flush=True)
+                smap = None
+        if chunks is None and pcm is not None:
+            print(f"\n{D}  slicing shared audio into {workers} chunks...{X}", flush=True)
+            chunks = [(pcm.spec(start, end), start, end, clean_start, clean_end)
+                      for start, end, clean_start, clean_end in _chunk_ranges(pcm.duration, workers)]
+        elif chunks is None:
+            print(f"\n{D}  splitting audio into {workers} chunks...{X}", flush=True)
+            chunks = split_audio(get_ffmpeg(), wav_path, workers, tmpdir)
+        samples = None
 
         # Launch parallel transcription
         print(f"{D}  launching {workers} parallel workers...{X}", flush=True)
@@ -386,6 +703,8 @@ def transcribe_parallel(wav_path: Path, model: str = None, device: str = None,
         # Merge all chunks
         print(f"{D}  merging {workers} chunks...{X}", flush=True)
         merged_data = _merge_chunk_segments(chunks_data)
+        if smap is not None:
+            smap.remap(merged_data)
 
     class Seg:
         def __init__(self, d):
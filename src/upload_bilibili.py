@@ -17,6 +17,8 @@ import argparse
 import json
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Windows GBK fix
@@ -43,6 +45,18 @@ BILIUP_EXE = _get_biliup_exe()
 
 G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; C = "\033[96m"; D = "\033[2m"; X = "\033[0m"
 
+# Resumable chunked upload (UPOS). Sessions live next to the cookies since
+# they carry the upload auth token.
+UPLOAD_SESSION_DIR = PROJECT_ROOT / "cookies" / "bilibili" / "upload_sessions"
+UPLOAD_SESSION_TTL = 24 * 3600     # Don't resume sessions older than this
+CHUNK_TASKS_DEFAULT = 3            # Starting concurrency (until tuned)
+CHUNK_TASKS_MAX = 8
+CHUNK_TUNE_EVERY = 4               # Re-evaluate concurrency every N chunks
+CHUNK_RETRIES = 3
+PREUPLOAD_URL = "https://member.bilibili.com/preupload"
+PREUPLOAD_QUERY = {"r": "upos", "profile": "ugcupos/bup", "ssl": 0, "version": "2.14.0",
+                   "build": 2140000, "upcdn": "bda2", "probe_version": 20221109}
+
 
 def ensure_bilibili_login() -> bool:
     """Ensure Bilibili login via biliup CLI QR code scan.
@@ -79,7 +93,285 @@ def ensure_bilibili_login() -> bool:
         return False
 
 
-def upload_bilibili(video_path: Path, title: str, tags: str, desc: str, cover_path: Path = None) -> dict:
+class ResumableUnavailable(Exception):
+    """The UPOS endpoints could not be negotiated; use biliup's own uploader."""
+
+
+def _cookie_session(cookie_data: dict):
+    """requests.Session authenticated with biliup's account.json cookies."""
+    import requests
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                      "(KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+        "Referer": "https://member.bilibili.com/",
+    })
+    for c in cookie_data.get("cookie_info", {}).get("cookies", []):
+        session.cookies.set(c["name"], c["value"], domain=".bilibili.com")
+    return session
+
+
+def _session_file(video_path: Path) -> Path:
+    """Session state path keyed by file name, size and mtime."""
+    import hashlib
+    st = video_path.stat()
+    key = hashlib.sha1(f"{video_path.resolve()}|{st.st_size}|{int(st.st_mtime)}".encode()).hexdigest()[:16]
+    return UPLOAD_SESSION_DIR / f"{key}.json"
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    tmp.replace(path)
+
+
+class _ChunkTuner:
+    """Hill-climbing concurrency limit driven by measured throughput.
+
+    Every CHUNK_TUNE_EVERY finished chunks the window throughput is
+    compared with the previous window: keep moving in the same direction
+    unless it dropped by more than 10%, then reverse (also at the bounds).
+    A `fixed` tuner keeps `start` as is.
+    """
+
+    def __init__(self, start: int, max_tasks: int = CHUNK_TASKS_MAX, fixed: bool = False):
+        self.limit = max(1, start if fixed else min(start, max_tasks))
+        self.max_tasks = max_tasks
+        self.fixed = fixed
+        self.step = 1
+        self.prev = 0.0
+        self._bytes = 0
+        self._count = 0
+        self._t0 = time.monotonic()
+        self.active = 0
+        self.cond = threading.Condition()
+
+    def acquire(self):
+        with self.cond:
+            while self.active >= self.limit:
+                self.cond.wait()
+            self.active += 1
+
+    def abandon(self):
+        """Give back a slot without sending (no throughput sample)."""
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+
+    def release(self, nbytes: int):
+        with self.cond:
+            self.active -= 1
+            self._bytes += nbytes
+            self._count += 1
+            if self._count >= CHUNK_TUNE_EVERY and not self.fixed:
+                rate = self._bytes / max(time.monotonic() - self._t0, 1e-6)
+                if rate < self.prev * 0.9 or not 1 <= self.limit + self.step <= self.max_tasks:
+                    self.step = -self.step
+                self.prev = rate
+                self.limit = max(1, min(self.max_tasks, self.limit + self.step))
+                self._bytes, self._count, self._t0 = 0, 0, time.monotonic()
+            self.cond.notify_all()
+
+
+class RateLimit:
+    """Pace chunk sends to `rate` bytes/s across all upload threads (0 = unlimited).
+
+    `rate` may be changed while an upload runs, e.g. when a concurrent
+    upload sharing the uplink finishes.
+    """
+
+    def __init__(self, rate: float = 0):
+        self.rate = rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + nbytes / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+
+def upload_video_chunked(cookie_data: dict, video_path: Path, tasks: int = None,
+                         on_progress=None, rate_limit: RateLimit = None, trace: dict = None) -> dict:
+    """Upload a video via UPOS with persisted, resumable chunk state.
+
+    The session (upload id, auth, chunk size, finished parts) is written to
+    UPLOAD_SESSION_DIR after every chunk, so a later call for the same file
+    only sends the missing chunks. Chunk concurrency is fixed at `tasks`;
+    without it, it starts at the last tuned value and is adapted to measured
+    throughput. With an active `rate_limit`, chunks are paced to its byte
+    rate and concurrency is not tuned (a throttled throughput says nothing
+    about the link), so the saved value is left alone. Bytes sent by this call
+    and the transfer time are stored in trace["bytes"] / trace["seconds"].
+
+    Returns the biliup video part dict ({"title", "filename", "desc"}) for
+    Data.append(). Raises ResumableUnavailable when UPOS negotiation fails.
+    """
+    from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+    video_path = Path(video_path)
+    total = video_path.stat().st_size
+    http = _cookie_session(cookie_data)
+    state_file = _session_file(video_path)
+    tuning_file = UPLOAD_SESSION_DIR / "tuning.json"
+
+    state = _load_json(state_file)
+    if state and time.time() - state.get("created", 0) > UPLOAD_SESSION_TTL:
+        state = {}
+    if state:
+        print(f"{D}  resuming upload session: {len(state['parts'])}/{state['chunks']} chunks done{X}",
+              flush=True)
+    else:
+        try:
+            pre = http.get(PREUPLOAD_URL, params={**PREUPLOAD_QUERY, "name": video_path.name, "size": total},
+                           timeout=15).json()
+            url = f"https:{pre['endpoint']}/{pre['upos_uri'].replace('upos://', '')}"
+            upload_id = http.post(f"{url}?uploads&output=json", headers={"X-Upos-Auth": pre["auth"]},
+                                  timeout=15).json()["upload_id"]
+        except Exception as e:
+            raise ResumableUnavailable(str(e))
+        chunk_size = int(pre["chunk_size"])
+        state = {
+            "created": time.time(), "url": url, "auth": pre["auth"], "biz_id": pre["biz_id"],
+            "upos_uri": pre["upos_uri"], "upload_id": upload_id, "chunk_size": chunk_size,
+            "chunks": -(-total // chunk_size), "total": total, "parts": {},
+        }
+        _save_json(state_file, state)
+
+    headers = {"X-Upos-Auth": state["auth"]}
+    chunk_size, chunks = state["chunk_size"], state["chunks"]
+    todo = [i for i in range(chunks) if str(i) not in state["parts"]]
+
+    def throttled() -> bool:
+        return rate_limit is not None and rate_limit.rate > 0
+
+    pinned = bool(tasks) or throttled()
+    tuner = _ChunkTuner(tasks or _load_json(tuning_file).get("tasks", CHUNK_TASKS_DEFAULT), fixed=pinned)
+    lock = threading.Lock()
+    abort = threading.Event()  # Set once a chunk has failed for good
+    rejected = []
+    sent = [sum(min(chunk_size, total - int(i) * chunk_size) for i in state["parts"])]
+    resumed_bytes = sent[0]
+    t_start = time.monotonic()
+
+    def _put(i: int):
+        start = i * chunk_size
+        with open(video_path, "rb") as f:
+            f.seek(start)
+            data = f.read(chunk_size)
+        params = {"partNumber": i + 1, "uploadId": state["upload_id"], "chunk": i, "chunks": chunks,
+                  "size": len(data), "start": start, "end": start + len(data), "total": total}
+        for attempt in range(CHUNK_RETRIES):
+            if abort.is_set():
+                return  # Another chunk failed; the upload is abandoned
+            if rate_limit:
+                rate_limit.consume(len(data))  # Before acquire: pacing must not hold a slot
+            tuner.acquire()
+            if abort.is_set():
+                tuner.abandon()
+                return
+            ok = False
+            try:
+                r = http.put(state["url"], params=params, data=data, headers=headers, timeout=120)
+                ok = r.status_code == 200
+            except Exception:
+                r = None
+            finally:
+                tuner.release(len(data) if ok else 0)
+            if ok:
+                with lock:
+                    state["parts"][str(i)] = r.headers.get("ETag", "etag")
+                    sent[0] += len(data)
+                    _save_json(state_file, state)
+                    if on_progress:
+                        on_progress(sent[0], total, tuner.limit)
+                return
+            if r is not None and 400 <= r.status_code < 500:
+                rejected.append(r.status_code)
+                break  # Session rejected; retrying the same chunk won't help
+            time.sleep(2 ** attempt)
+        raise RuntimeError(f"chunk {i + 1}/{chunks} failed"
+                           + (f" (HTTP {r.status_code})" if r is not None else ""))
+
+    pool = ThreadPoolExecutor(max_workers=max(CHUNK_TASKS_MAX, tuner.limit))
+    futures = [pool.submit(_put, i) for i in todo]
+    try:
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for fut in futures:
+            if fut.done() and fut.exception():
+                raise fut.exception()
+    except BaseException:
+        # Stop the remaining chunks: queued ones are cancelled, started ones
+        # return at their next attempt; only in-flight PUTs are waited for
+        abort.set()
+        for fut in futures:
+            fut.cancel()
+        if rejected:
+            state_file.unlink(missing_ok=True)  # Expired session; next attempt starts fresh
+        raise
+    finally:
+        pool.shutdown(wait=True)
+        if not pinned and not throttled():
+            _save_json(tuning_file, {"tasks": tuner.limit})
+        if trace is not None:
+            trace["bytes"] = sent[0] - resumed_bytes
+            trace["seconds"] = round(time.monotonic() - t_start, 2)
+
+    parts = [{"partNumber": int(i) + 1, "eTag": tag} for i, tag in sorted(state["parts"].items(), key=lambda kv: int(kv[0]))]
+    ret = http.post(state["url"], params={
+        "output": "json", "name": video_path.name, "profile": "ugcupos/bup",
+        "uploadId": state["upload_id"], "biz_id": state["biz_id"],
+    }, json={"parts": parts}, headers=headers, timeout=30).json()
+    if ret.get("OK") != 1:
+        state_file.unlink(missing_ok=True)  # Server won't complete this session; start over next time
+        raise RuntimeError(f"UPOS complete failed: {ret}")
+    state_file.unlink(missing_ok=True)
+    filename = Path(state["upos_uri"].replace("upos://", "")).stem
+    return {"title": video_path.stem, "filename": filename, "desc": ""}
+
+
+def upload_part(bili, cookie_data: dict, video_path: Path, tasks: int = None,
+                rate_limit: RateLimit = None, trace: dict = None) -> dict:
+    """Upload the video file and return the part dict for Data.append().
+
+    Uses the resumable chunked uploader; falls back to biliup's
+    upload_file() if UPOS negotiation fails (unpaced, whole-file timing
+    in `trace`).
+    """
+    def _progress(done: int, total: int, limit: int):
+        print(f"\r{D}  B站上传 {done * 100 // total}% ({done / 1e6:.0f}/{total / 1e6:.0f} MB, "
+              f"{limit} 并发){X}", end="", flush=True)
+
+    try:
+        part = upload_video_chunked(cookie_data, video_path, tasks, on_progress=_progress,
+                                    rate_limit=rate_limit, trace=trace)
+        print(flush=True)
+        return part
+    except ResumableUnavailable as e:
+        print(f"{Y}  resumable upload unavailable ({e}), using biliup uploader{X}", flush=True)
+        t0 = time.monotonic()
+        part = bili.upload_file(str(video_path), lines="AUTO", tasks=tasks or CHUNK_TASKS_DEFAULT)
+        if trace is not None:
+            trace["bytes"] = Path(video_path).stat().st_size
+            trace["seconds"] = round(time.monotonic() - t0, 2)
+        return part
+
+
+def upload_bilibili(video_path: Path, title: str, tags: str, desc: str, cover_path: Path = None,
+                    tasks: int = None) -> dict:
     """Upload video to Bilibili using biliup library.
 
     Args:
@@ -88,6 +380,7 @@ def upload_bilibili(video_path: Path, title: str, tags: str, desc: str, cover_pa
         tags: Comma-separated tags
         desc: Video description
         cover_path: Optional cover image path
+        tasks: Chunk upload concurrency (None = auto-tuned)
 
     Returns:
         dict with {"ok": bool, "bvid": str} or {"ok": bool, "error": str}
@@ -129,7 +422,7 @@ def upload_bilibili(video_path: Path, title: str, tags: str, desc: str, cover_pa
                 except Exception as e:
                     print(f"  Cover upload failed ({e}), using auto-generated cover")
 
-            video_part = bili.upload_file(str(video_path), lines="AUTO", tasks=3)
+            video_part = upload_part(bili, cookie_data, video_path, tasks)
             video_part["title"] = title[:80]
             data.append(video_part)
             ret = bili.submit()
@@ -151,6 +444,7 @@ def main():
     parser.add_argument("--desc", default="", help="Video description")
     parser.add_argument("--cover", type=Path, help="Cover image (optional)")
     parser.add_argument("--auto-login", action="store_true", help="Auto-login if no cookies")
+    parser.add_argument("--tasks", type=int, help="Chunk upload concurrency (default: auto-tuned)")
 
     args = parser.parse_args()
 
@@ -176,7 +470,7 @@ def main():
         print(f"  Cover: {args.cover.name}")
 
     print(f"\nUploading...", flush=True)
-    result = upload_bilibili(args.video, args.title, args.tags, args.desc, args.cover)
+    result = upload_bilibili(args.video, args.title, args.tags, args.desc, args.cover, args.tasks)
 
     if result["ok"]:
         bvid = result.get("bvid", "")
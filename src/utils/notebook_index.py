@@ -0,0 +1,102 @@
+"""
+notebook_index.py — 本地笔记本/来源索引
+记录每次运行创建的 NotebookLM 笔记本 (主题 + 来源模式 → notebook_id) 以及其中
+已导入的来源 (URL 规范键 / 文件哈希 → source_id)。相同或相近主题以同一来源模式
+再次运行时复用已有笔记本；来源照常获取 (Research 可命中缓存)，导入时去重，
+只发送新增的来源。
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+NOTEBOOK_INDEX_FILE = Path.home() / ".notebooklm" / "papertalker_notebooks.json"
+NOTEBOOK_REUSE_MAX_AGE = 7 * 86400   # 超过该时长未使用的笔记本不再复用
+TOPIC_SIMILARITY = 0.8               # 主题相似度 (字符二元组 Jaccard) 阈值
+
+
+def normalize_topic(topic: str) -> str:
+    """小写、去标点、合并空白，用于主题比较。"""
+    topic = re.sub(r"\W+", " ", topic.casefold())
+    return " ".join(topic.split())
+
+
+def topic_similarity(a: str, b: str) -> float:
+    """两个已规范化主题的字符二元组 Jaccard 相似度 (中英文都适用，忽略空格)。"""
+    a, b = a.replace(" ", ""), b.replace(" ", "")
+    if a == b:
+        return 1.0
+    grams_a = {a[i:i + 2] for i in range(len(a) - 1)} or {a}
+    grams_b = {b[i:i + 2] for i in range(len(b) - 1)} or {b}
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+class NotebookIndex:
+    """主题 → 笔记本、来源键 → source_id 的本地索引 (JSON 文件)。
+
+    结构: {notebook_id: {"topic", "key", "source_mode", "created", "used", "sources": {键: source_id}}}
+    来源键即 source_dedup 的规范键 ("arxiv:…", "doi:…", "url:…") 或 "sha256:<文件哈希>"。
+    """
+
+    def __init__(self, path: Path = NOTEBOOK_INDEX_FILE, max_age: float = NOTEBOOK_REUSE_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._entries = None
+        self.claimed = set()  # 本进程已在使用的笔记本，批量模式下不分给第二个主题
+
+    @property
+    def entries(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def find(self, topic: str, source_mode: str) -> Optional[str]:
+        """最近使用过的、来源模式相同的相同/相近主题笔记本 ID；没有返回 None。"""
+        key = normalize_topic(topic)
+        now = time.time()
+        candidates = []
+        for nid, e in self.entries.items():
+            if (nid in self.claimed or e.get("source_mode") != source_mode
+                    or now - e.get("used", 0) > self.max_age):
+                continue
+            score = topic_similarity(key, e.get("key", ""))
+            if score >= TOPIC_SIMILARITY:
+                candidates.append((score, e.get("used", 0), nid))
+        return max(candidates)[2] if candidates else None
+
+    def record(self, notebook_id: str, topic: str, source_mode: str):
+        """登记/刷新一个笔记本的使用时间，并标记为本进程使用中。"""
+        now = time.time()
+        self.claimed.add(notebook_id)
+        e = self.entries.setdefault(notebook_id, {"created": now, "sources": {}})
+        e.update(topic=topic, key=normalize_topic(topic), source_mode=source_mode, used=now)
+        self.save()
+
+    def sources(self, notebook_id: str) -> Dict[str, str]:
+        """笔记本中已登记的来源 {键: source_id}。"""
+        return self.entries.get(notebook_id, {}).get("sources", {})
+
+    def add_sources(self, notebook_id: str, sources: Dict[str, str]):
+        """登记导入的来源 {键: source_id}。"""
+        if notebook_id in self.entries and sources:
+            self.entries[notebook_id].setdefault("sources", {}).update(sources)
+            self.save()
+
+    def forget(self, notebook_id: str):
+        """笔记本已被删除或无法访问时移除。"""
+        if self.entries.pop(notebook_id, None) is not None:
+            self.save()
@@ -0,0 +1,65 @@
+"""
+research_cache.py — Deep Research 结果缓存
+Deep Research 每次要轮询最长 40 分钟且容易被限流。完成的结果 (来源列表、摘要、
+task_id) 按规范化主题 + 模式缓存在本地，TTL 内重跑同一主题或崩溃后重跑时
+直接复用来源列表，跳到导入阶段。
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .notebook_index import normalize_topic
+
+RESEARCH_CACHE_FILE = Path.home() / ".notebooklm" / "papertalker_research.json"
+RESEARCH_CACHE_TTL = 3 * 86400
+
+
+class ResearchCache:
+    """{"<mode>:<规范化主题>": {"topic", "mode", "sources", "summary", "task_id", "notebook_id", "time"}}"""
+
+    def __init__(self, path: Path = RESEARCH_CACHE_FILE, ttl: float = RESEARCH_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._entries = None
+
+    @property
+    def entries(self) -> dict:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.entries, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass
+
+    def get(self, topic: str, mode: str) -> Optional[Dict]:
+        """TTL 内的缓存结果；fast 模式也接受 deep 的结果 (取较新的)。没有返回 None。"""
+        key = normalize_topic(topic)
+        now = time.time()
+        hits = [
+            e for m in (("deep",) if mode == "deep" else (mode, "deep"))
+            if (e := self.entries.get(f"{m}:{key}")) and now - e.get("time", 0) <= self.ttl
+        ]
+        return max(hits, key=lambda e: e["time"]) if hits else None
+
+    def put(self, topic: str, mode: str, sources: List[Dict], summary: str = "",
+            task_id: Optional[str] = None, notebook_id: Optional[str] = None):
+        """缓存一次完成的 Research，同时清理过期条目。"""
+        now = time.time()
+        for k in [k for k, e in self.entries.items() if now - e.get("time", 0) > self.ttl]:
+            del self.entries[k]
+        self.entries[f"{mode}:{normalize_topic(topic)}"] = {
+            "topic": topic, "mode": mode, "sources": sources, "summary": summary,
+            "task_id": task_id, "notebook_id": notebook_id, "time": now,
+        }
+        self.save()
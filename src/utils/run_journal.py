@@ -0,0 +1,87 @@
+"""
+run_journal.py — quick_video.run() 的断点续跑日志
+每完成一步就把结果 (笔记本 ID、Research task_id、发现/导入的来源、视频
+task_id、输出路径) 原子写入 ~/.notebooklm/papertalker_runs/<主题哈希>.json。
+进程崩溃或超时后，以相同主题重跑 (包括 run_scheduled.py) 会从最后完成的
+一步继续，不再重复 Research 和视频生成。
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict
+
+from .notebook_index import normalize_topic
+
+RUN_JOURNAL_DIR = Path.home() / ".notebooklm" / "papertalker_runs"
+RUN_JOURNAL_MAX_AGE = 2 * 86400   # 开始得更早的运行不再续跑
+RUN_JOURNAL_MAX_RESUMES = 3       # 续跑次数上限 (如视频任务一直不结束)
+
+
+class RunJournal:
+    """一个主题的运行日志。data["steps"] 记录各步骤完成时间，步骤依次为
+    notebook → research → imported → ready → generation → done。"""
+
+    def __init__(self, topic: str, root: Path = RUN_JOURNAL_DIR, max_age: float = RUN_JOURNAL_MAX_AGE,
+                 max_resumes: int = RUN_JOURNAL_MAX_RESUMES):
+        key = hashlib.sha1(normalize_topic(topic).encode("utf-8")).hexdigest()[:16]
+        self.path = root / f"{key}.json"
+        self.topic = topic
+        self.max_age = max_age
+        self.max_resumes = max_resumes
+        self.data: Dict = {}
+
+    def resume(self, source_mode: str) -> Dict:
+        """读取未完成的上次运行 (同一来源模式、未过期、续跑次数未用完)；没有则返回 {}。
+
+        过期按开始时间算：updated 每次续跑都会刷新，不能用来判断。
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (data.get("source_mode") != source_mode or "done" in data.get("steps", {})
+                or time.time() - data.get("started", data.get("updated", 0)) > self.max_age
+                or data.get("resumes", 0) >= self.max_resumes):
+            return {}
+        self.data = data
+        return data
+
+    def count_resume(self):
+        """记一次续跑 (resume() 只是查看，调用方真正续跑时调用)。"""
+        self.data["resumes"] = self.data.get("resumes", 0) + 1
+        self.save()
+
+    def start(self, source_mode: str):
+        """开始新的运行 (覆盖旧日志)。"""
+        now = time.time()
+        self.data = {"topic": self.topic, "source_mode": source_mode,
+                     "started": now, "updated": now, "steps": {}}
+        self.save()
+
+    def has(self, step: str) -> bool:
+        return step in self.data.get("steps", {})
+
+    def step(self, step: str, **fields):
+        """记录一步完成及其结果。"""
+        self.data.update(fields)
+        self.data.setdefault("steps", {})[step] = time.time()
+        self.save()
+
+    def undo(self, step: str, *fields: str):
+        """撤销一步 (如视频生成失败后需要重新提交)。"""
+        self.data.get("steps", {}).pop(step, None)
+        for f in fields:
+            self.data.pop(f, None)
+        self.save()
+
+    def save(self):
+        self.data["updated"] = time.time()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError:
+            pass
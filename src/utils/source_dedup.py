@@ -0,0 +1,144 @@
+"""
+source_dedup.py — 导入前的来源去重
+同一篇论文可能同时来自 arXiv 和 Semantic Scholar (abs / pdf / DOI 各种写法)，
+同一个 PDF 也可能有多份拷贝。导入 NotebookLM 前先按规范化 URL 和文件内容
+哈希去重，并排除笔记本中已有的来源，只把真正的新材料发出去。
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# arXiv 新 (2401.01234) / 旧 (hep-th/9901001) 编号，可带版本后缀 v2
+_ARXIV_ID = r"(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?"
+_ARXIV_URL = re.compile(
+    r"^(?:export\.)?arxiv\.org/(?:abs|pdf|html|format)/" + _ARXIV_ID + r"(?:\.pdf)?/?$",
+    re.IGNORECASE,
+)
+_ARXIV_DOI = re.compile(r"^10\.48550/arxiv\." + _ARXIV_ID + "$", re.IGNORECASE)
+_DOI = re.compile(r"^(10\.\d{4,9}/\S+)$")
+_DOI_HOSTS = ("doi.org", "dx.doi.org")
+# 跟踪参数不影响内容
+_TRACKING_PARAMS = {"fbclid", "gclid", "ref"}
+
+_HASH_CHUNK = 1 << 20
+
+
+def normalize_doi(doi: str) -> Optional[str]:
+    """DOI → "doi:10.xxx/..." (小写)；arXiv DOI → "arxiv:ID"；无法识别返回 None。"""
+    doi = unquote(doi.strip())
+    doi = re.sub(r"^(?:https?://)?(?:dx\.)?doi\.org/", "", doi, flags=re.IGNORECASE)
+    doi = re.sub(r"^doi:\s*", "", doi, flags=re.IGNORECASE)
+    m = _ARXIV_DOI.match(doi)
+    if m:
+        return f"arxiv:{m.group(1).lower()}"
+    if _DOI.match(doi):
+        return f"doi:{doi.lower().rstrip('.')}"
+    return None
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """URL → 去重用的规范键。
+
+    - arxiv.org/abs|pdf/ID[vN][.pdf] → "arxiv:ID" (忽略版本)
+    - doi.org / dx.doi.org 解析器 → "doi:..."
+    - 其他: 小写主机、去掉 www./默认端口/片段/跟踪参数/末尾斜杠，http 与 https 视为相同
+    """
+    url = (url or "").strip()
+    if not url:
+        return None
+    if url.lower().startswith("doi:"):
+        return normalize_doi(url)
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+
+    if host in _DOI_HOSTS:
+        return normalize_doi(path.lstrip("/")) or f"url:{host}{path}"
+    m = _ARXIV_URL.match(f"{host}{path}")
+    if m:
+        return f"arxiv:{m.group(1).lower()}"
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower().startswith("utm_") or k.lower() in _TRACKING_PARAMS)
+    ))
+    port = f":{parts.port}" if parts.port and parts.port not in (80, 443) else ""
+    return "url:" + urlunsplit(("", host + port, path, query, "")).lstrip("/")
+
+
+def source_keys(src: Dict) -> Set[str]:
+    """一个来源 dict 的所有去重键 (doi / url / pdf_url)；任一键相同即视为重复。"""
+    keys = set()
+    if src.get("doi"):
+        key = normalize_doi(src["doi"])
+        if key:
+            keys.add(key)
+    for field in ("url", "pdf_url"):
+        key = normalize_url(src.get(field) or "")
+        if key:
+            keys.add(key)
+    return keys
+
+
+def dedup_sources(sources: List[Dict], existing: Iterable[str] = ()) -> Tuple[List[Dict], int]:
+    """去掉重复来源和 existing (规范键) 中已有的来源，返回 (保留的来源, 去掉的个数)。
+
+    先出现的来源保留；没有任何 URL 的来源原样保留。
+    """
+    seen = set(existing)
+    kept = []
+    for src in sources:
+        keys = source_keys(src)
+        if keys and keys & seen:
+            continue
+        seen |= keys
+        kept.append(src)
+    return kept, len(sources) - len(kept)
+
+
+def file_digest(path: Path) -> str:
+    """文件内容的 SHA-256 (分块读取，不整个载入内存)。"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dedup_files(files: List[Path], existing: Iterable[str] = (),
+                digests: Optional[Dict[Path, str]] = None) -> Tuple[List[Path], List[Path]]:
+    """按内容去掉重复文件，并跳过 existing ("sha256:<哈希>" 键) 中已导入的文件。
+
+    返回 (待上传文件, 跳过的文件)。只按内容判断，同名但内容不同的文件都会保留。
+    大小不同的文件不会相同，只对大小冲突且不在 digests (已算好的哈希) 中的
+    文件计算哈希。
+    """
+    existing = set(existing)
+    by_size: Dict[int, List[Path]] = {}
+    for f in files:
+        by_size.setdefault(f.stat().st_size, []).append(f)
+
+    digests = dict(digests or {})
+    for group in by_size.values():
+        if len(group) > 1:
+            for f in group:
+                if f not in digests:
+                    digests[f] = file_digest(f)
+
+    kept, skipped, seen = [], [], set()
+    for f in files:
+        digest = digests.get(f)
+        key = f"sha256:{digest}" if digest else f"size:{f.stat().st_size}"  # 大小唯一即内容唯一
+        if key in seen or key in existing:
+            skipped.append(f)
+            continue
+        seen.add(key)
+        kept.append(f)
+    return kept, skipped
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Warm Playwright browser service for WeChat logins and uploads.
+
+Keeps one persistent Chromium context per WeChat profile open and accepts
+jobs over a local TCP socket, so a batch reuses one logged-in browser
+instead of cold-starting Chromium for every login check and every video.
+publish.py starts it on demand; it exits after BROWSER_SERVICE_IDLE
+seconds without jobs.
+
+Protocol: one JSON request line, one JSON response line. A client that
+closes the connection before the response cancels its job, unless the job
+has already clicked publish: that one runs to the end and its result is
+only logged.
+    {"token": ..., "op": "ping"}
+    {"token": ..., "op": "login", "profile": "weixin" | "weixin_mp"}
+    {"token": ..., "op": "upload_weixin_channels", "args": {...}}
+    {"token": ..., "op": "shutdown"}
+
+Port, pid and token are written to cookies/browser_service.json (only
+readable by the current user); job output goes to cookies/browser_service.log.
+
+Usage:
+    python src/workers/browser_service.py
+"""
+import asyncio
+import json
+import os
+import secrets
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from weixin_upload_worker import launch_profile_context, upload_weixin_channels_async  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SERVICE_FILE = PROJECT_ROOT / "cookies" / "browser_service.json"
+BROWSER_SERVICE_IDLE = 15 * 60
+LOGIN_TIMEOUT = 600
+
+# profile name -> (user data dir, entry URL, "logged in" URL predicate)
+PROFILES = {
+    "weixin": (
+        PROJECT_ROOT / "cookies" / "weixin" / "browser_profile",
+        "https://channels.weixin.qq.com/platform/post/create",
+        lambda url: "post/create" in url or ("channels.weixin.qq.com" in url and "login" not in url.lower()),
+    ),
+    "weixin_mp": (
+        PROJECT_ROOT / "cookies" / "weixin_mp" / "browser_profile",
+        "https://mp.weixin.qq.com/",
+        lambda url: "cgi-bin" in url,
+    ),
+}
+
+
+class BrowserService:
+    def __init__(self):
+        self.token = secrets.token_hex(16)
+        self.playwright = None
+        self.contexts = {}
+        self.locks = {name: asyncio.Lock() for name in PROFILES}
+        self.active = 0
+        self.last_used = time.monotonic()
+        self.stopped = asyncio.Event()
+
+    async def context(self, profile: str):
+        """Warm context for `profile`, (re)launched if missing or closed."""
+        from playwright.async_api import async_playwright
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        ctx = self.contexts.get(profile)
+        if ctx is None:
+            ctx = await launch_profile_context(self.playwright, PROFILES[profile][0])
+            ctx.on("close", lambda _: self.contexts.pop(profile, None))
+            self.contexts[profile] = ctx
+        return ctx
+
+    async def save_state(self, profile: str, ctx):
+        """Snapshot Channels cookies for publish.py's login health probe."""
+        if profile == "weixin":
+            state = PROFILES[profile][0].parent / "storage_state.json"
+            await ctx.storage_state(path=str(state))
+
+    async def login(self, profile: str) -> dict:
+        """Open the profile's entry page and wait for the user to scan if needed."""
+        _, url, logged_in = PROFILES[profile]
+        ctx = await self.context(profile)
+        page = await ctx.new_page()
+        try:
+            try:
+                await page.goto(url, timeout=60000)
+            except Exception as e:
+                print(f"  navigation error: {e}", flush=True)
+            await asyncio.sleep(1)
+            if logged_in(page.url):
+                await self.save_state(profile, ctx)
+                return {"ok": True, "cached": True}
+            print(f"  [{profile}] waiting for QR scan (max {LOGIN_TIMEOUT // 60} min)", flush=True)
+            start = time.monotonic()
+            while time.monotonic() - start < LOGIN_TIMEOUT:
+                if logged_in(page.url):
+                    await asyncio.sleep(0.5)  # Re-verify: the URL can flip back briefly
+                    if logged_in(page.url):
+                        await self.save_state(profile, ctx)
+                        return {"ok": True, "cached": False}
+                await asyncio.sleep(0.2)
+            return {"ok": False, "error": "Login timeout"}
+        finally:
+            await page.close()
+
+    async def handle(self, req: dict, state: dict) -> dict:
+        op = req.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "profiles": sorted(self.contexts)}
+        if op == "shutdown":
+            self.stopped.set()
+            return {"ok": True}
+        if op == "login":
+            profile = req.get("profile")
+            if profile not in PROFILES:
+                return {"ok": False, "error": f"unknown profile: {profile}"}
+            async with self.locks[profile]:
+                return await self.login(profile)
+        if op == "upload_weixin_channels":
+            a = req.get("args", {})
+            async with self.locks["weixin"]:
+                ctx = await self.context("weixin")
+                return await upload_weixin_channels_async(
+                    a["video_path"], a["title"], a["desc"], a["tags"], a.get("cover_path"), context=ctx,
+                    upload_limit=a.get("upload_limit", 0), state=state)
+        return {"ok": False, "error": f"unknown op: {op}"}
+
+    async def serve_client(self, reader, writer):
+        self.active += 1
+        try:
+            line = await reader.readline()
+            try:
+                req = json.loads(line)
+            except json.JSONDecodeError:
+                req = {}
+            if not secrets.compare_digest(str(req.get("token", "")), self.token):
+                resp = {"ok": False, "error": "bad token"}
+            else:
+                if req.get("op") != "ping":
+                    print(f"[{time.strftime('%H:%M:%S')}] {req.get('op')}", flush=True)
+                state = {}
+                job = asyncio.ensure_future(self.handle(req, state))
+                hangup = asyncio.ensure_future(reader.read(1))  # Clients send nothing more: EOF = gone
+                await asyncio.wait({job, hangup}, return_when=asyncio.FIRST_COMPLETED)
+                hangup.cancel()
+                if not job.done():
+                    if not state.get("publish_clicked"):
+                        job.cancel()
+                        print(f"[{time.strftime('%H:%M:%S')}] {req.get('op')} cancelled (client gone)", flush=True)
+                        return
+                    # Cancelling now could cut the publish off half way; finish it for the log
+                    print(f"[{time.strftime('%H:%M:%S')}] {req.get('op')} client gone after publish, finishing",
+                          flush=True)
+                    try:
+                        resp = await job
+                    except Exception as e:
+                        resp = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                    print(f"[{time.strftime('%H:%M:%S')}] {req.get('op')} finished without client: "
+                          f"{json.dumps(resp, ensure_ascii=False)}", flush=True)
+                    return
+                try:
+                    resp = job.result()
+                except Exception as e:
+                    resp = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            writer.write((json.dumps(resp, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+        finally:
+            self.active -= 1
+            self.last_used = time.monotonic()
+            writer.close()
+
+    async def idle_watch(self):
+        while not self.stopped.is_set():
+            await asyncio.sleep(10)
+            if self.active == 0 and time.monotonic() - self.last_used > BROWSER_SERVICE_IDLE:
+                print("idle, shutting down", flush=True)
+                self.stopped.set()
+
+    async def run(self):
+        server = await asyncio.start_server(self.serve_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        SERVICE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = SERVICE_FILE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"port": port, "pid": os.getpid(), "token": self.token}), encoding="utf-8")
+        os.chmod(tmp, 0o600)
+        tmp.replace(SERVICE_FILE)
+        print(f"browser service listening on 127.0.0.1:{port} (pid {os.getpid()})", flush=True)
+
+        watcher = asyncio.create_task(self.idle_watch())
+        try:
+            await self.stopped.wait()
+        finally:
+            watcher.cancel()
+            server.close()
+            try:
+                if json.loads(SERVICE_FILE.read_text(encoding="utf-8")).get("pid") == os.getpid():
+                    SERVICE_FILE.unlink()
+            except (OSError, json.JSONDecodeError):
+                pass
+            for ctx in list(self.contexts.values()):
+                try:
+                    await ctx.close()
+                except Exception:
+                    pass
+            if self.playwright is not None:
+                await self.playwright.stop()
+
+
+def main():
+    asyncio.run(BrowserService().run())
+
+
+if __name__ == "__main__":
+    main()
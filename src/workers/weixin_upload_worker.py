@@ -3,10 +3,11 @@
 WeChat Channels upload worker - runs in isolated subprocess.
 
 Uses Playwright ASYNC API to avoid sync_playwright()'s event loop conflicts.
-Called by publish.py via subprocess with JSON args.
+Called by publish.py via subprocess with JSON args, or imported by
+browser_service.py, which passes in its warm browser context.
 
 Usage:
-    python _weixin_upload_worker.py '<json_args>' '<result_file>'
+    python src/workers/weixin_upload_worker.py '<json_args>' '<result_file>'
 """
 import asyncio
 import json
@@ -21,20 +22,124 @@ try:
 except ImportError:
     pass
 
-PROJECT_ROOT = Path(__file__).resolve().parent
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 WEIXIN_STORAGE_STATE = PROJECT_ROOT / "cookies" / "weixin" / "storage_state.json"
 
 G = "\033[92m"; Y = "\033[93m"; R = "\033[91m"; X = "\033[0m"
 
+# Channels XHRs watched instead of sleeping: the video is sent in DFS parts
+# (uploadpartdfs ... completepartuploaddfs) and 发表 submits post_create.
+UPLOAD_PART_API = "uploadpartdfs"
+UPLOAD_DONE_API = "completepartuploaddfs"
+POST_CREATE_API = "post/post_create"
+
+# Any of these in the DOM means the video finished uploading
+UPLOAD_READY_SELECTOR = 'video, button:has-text("删除"), input[placeholder*="概括视频主要内容"]:enabled'
+SHORT_TITLE_READY_SELECTOR = 'input[placeholder*="概括视频主要内容"]:enabled'
+PUBLISH_ENABLED_JS = """() => {
+    const b = [...document.querySelectorAll('button')].find(b => b.textContent.includes('发表'));
+    return !!b && !b.disabled && !b.className.includes('disabled');
+}"""
+
+
+async def _first_of(waits: dict, timeout: float, on_tick=None, tick: float = 10):
+    """Run labelled awaitables concurrently; return the label of the first to succeed.
+
+    Failed waits (detached frame, selector timeout) are ignored. Returns None
+    if nothing succeeded within `timeout` seconds. `on_tick(elapsed)` is
+    called every `tick` seconds while waiting.
+    """
+    tasks = {asyncio.ensure_future(aw): label for label, aw in waits.items()}
+    pending = set(tasks)
+    start = time.monotonic()
+    winner = None
+    try:
+        while pending and winner is None:
+            left = timeout - (time.monotonic() - start)
+            if left <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=min(tick, left),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                if not t.cancelled() and t.exception() is None:
+                    winner = tasks[t]
+                    break
+            if not done and on_tick:
+                on_tick(int(time.monotonic() - start))
+    finally:
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return winner
+
 
-async def upload_weixin_channels_async(video_path: str, title: str, desc: str, tags: str, cover_path: str = None) -> dict:
-    """Upload video to WeChat Channels using async Playwright API."""
+async def launch_profile_context(p, profile_dir: Path):
+    """Launch the persistent Chromium context used for WeChat logins/uploads."""
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return await p.chromium.launch_persistent_context(
+        user_data_dir=str(profile_dir),
+        headless=False,
+        args=[
+            "--disable-blink-features=AutomationControlled",
+            "--no-proxy-server",
+        ],
+        viewport={"width": 1920, "height": 1080},
+        locale="zh-CN",
+        ignore_https_errors=True,
+    )
+
+
+async def upload_weixin_channels_async(video_path: str, title: str, desc: str, tags: str, cover_path: str = None,
+                                       context=None, upload_limit: int = 0, state: dict = None) -> dict:
+    """Upload video to WeChat Channels using async Playwright API.
+
+    With `context` (a warm persistent context owned by browser_service.py)
+    the upload runs in a new tab, which is closed afterwards; otherwise a
+    browser is launched for this upload and shut down at the end.
+
+    Progress is taken from the page's upload/publish XHRs and DOM state
+    rather than fixed sleeps; the result carries per-phase timings (seconds
+    since start) under "phases", plus "bytes" / "transfer_s" for the video
+    transfer. `upload_limit` (bytes/s) throttles the tab's uplink via CDP.
+
+    The tab (or browser) is closed on every exit, cancellation included.
+    `state["publish_clicked"]` is set just before 发表 is clicked, so the
+    caller can tell whether cancelling could cut a publish off.
+    """
     from playwright.async_api import async_playwright
 
     publish_clicked = False  # Track if publish was clicked (for error handling)
+    t0 = time.monotonic()
+    phases = {}
+
+    def mark(phase: str):
+        phases[phase] = round(time.monotonic() - t0, 1)
+
+    def _done(ret: dict) -> dict:
+        ret["phases"] = phases
+        if "file_selected" in phases and "upload_done" in phases:
+            ret["bytes"] = Path(video_path).stat().st_size
+            ret["transfer_s"] = round(phases["upload_done"] - phases["file_selected"], 1)
+        return ret
 
     profile_dir = WEIXIN_STORAGE_STATE.parent / "browser_profile"
-    profile_dir.mkdir(parents=True, exist_ok=True)
+    owned = context is None
+    p = None
+    page = None
+
+    async def _cleanup():
+        """Close what this upload opened: the whole browser, or just its tab."""
+        try:
+            if not owned:
+                if page is not None:
+                    await page.close()
+                return
+            if context is not None:
+                await context.close()
+            if p is not None:
+                await p.stop()
+        except Exception:
+            pass
 
     # Short title: 6-16 chars (视频号 requires minimum 6)
     title_short = title[:16] if len(title) > 16 else title
@@ -48,26 +153,48 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
         tag_suffix = " " + " ".join(f"#{t}" for t in tag_list[:5])
     full_desc = desc + tag_suffix
 
-    p = await async_playwright().start()
     try:
-        context = await p.chromium.launch_persistent_context(
-            user_data_dir=str(profile_dir),
-            headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-proxy-server",
-            ],
-            viewport={"width": 1920, "height": 1080},
-            locale="zh-CN",
-            ignore_https_errors=True,
-        )
-        page = context.pages[0] if context.pages else await context.new_page()
+        if owned:
+            p = await async_playwright().start()
+            context = await launch_profile_context(p, profile_dir)
+            page = context.pages[0] if context.pages else await context.new_page()
+        else:
+            page = await context.new_page()
+
+        # Network events for the upload/publish phases
+        net = {"parts": 0}
+        upload_xhr_done = asyncio.Event()
+
+        def _on_response(resp):
+            url = resp.url
+            if UPLOAD_PART_API in url:
+                net["parts"] += 1
+            elif UPLOAD_DONE_API in url and resp.ok:
+                upload_xhr_done.set()
+
+        page.on("response", _on_response)
+
+        if upload_limit:
+            # Share of the caller's bandwidth budget (publish.py --upload-bandwidth)
+            try:
+                cdp = await page.context.new_cdp_session(page)
+                await cdp.send("Network.emulateNetworkConditions", {
+                    "offline": False, "latency": 0,
+                    "downloadThroughput": -1, "uploadThroughput": upload_limit,
+                })
+                print(f"  上传限速: {upload_limit * 8 / 1e6:.1f} Mbit/s", flush=True)
+            except Exception as e:
+                print(f"  {Y}上传限速设置失败: {e}{X}", flush=True)
 
         # Navigate to upload page (will redirect to login if not authenticated)
         print(f"  {Y}正在打开发布页面 https://channels.weixin.qq.com/platform/post/create{X}", flush=True)
         try:
             await page.goto("https://channels.weixin.qq.com/platform/post/create", timeout=60000)
-            await asyncio.sleep(2)
+            # The login redirect happens client-side after load
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except Exception:
+                pass
         except Exception as e:
             print(f"  {Y}导航异常: {e}，继续...{X}", flush=True)
 
@@ -107,9 +234,7 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
 
             if not logged_in:
                 print(f"  {R}登录超时 (10分钟){X}", flush=True)
-                await context.close()
-                await p.stop()
-                return {"ok": False, "error": "Login timeout"}
+                return _done({"ok": False, "error": "Login timeout"})
 
             print(f"  {G}✓ 微信视频号登录成功!{X}", flush=True)
             WEIXIN_STORAGE_STATE.parent.mkdir(parents=True, exist_ok=True)
@@ -122,37 +247,31 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
                 # Navigate to create page
                 print(f"  {Y}正在跳转到发布页面...{X}", flush=True)
                 await page.goto("https://channels.weixin.qq.com/platform/post/create", timeout=60000)
-                await asyncio.sleep(1)
                 current_url = page.url
                 if "post/create" in current_url:
                     print(f"  {G}✓ 已到达发布页面{X}", flush=True)
                 else:
                     print(f"  {R}无法到达发布页面，当前URL: {current_url}{X}", flush=True)
-                    await context.close()
-                    await p.stop()
-                    return {"ok": False, "error": f"Cannot reach create page: {current_url}"}
+                    return _done({"ok": False, "error": f"Cannot reach create page: {current_url}"})
 
         # Final verification
         final_url = page.url
         print(f"  最终URL检查: {final_url}", flush=True)
         if "post/create" not in final_url:
             print(f"  {R}✗ 未在发布页面{X}", flush=True)
-            await context.close()
-            await p.stop()
-            return {"ok": False, "error": f"Not on create page: {final_url}"}
+            return _done({"ok": False, "error": f"Not on create page: {final_url}"})
 
         print(f"  {G}✓✓ 已确认到达发布页面{X}", flush=True)
+        mark("page_ready")
 
-        # Find wujie iframe
-        upload_frame = None
-        for attempt in range(15):
-            for frame in page.frames:
-                if "/micro/" in frame.url:
-                    upload_frame = frame
-                    break
-            if upload_frame:
-                break
-            await asyncio.sleep(2)
+        # Find wujie iframe (wait for it to navigate if not there yet)
+        upload_frame = next((f for f in page.frames if "/micro/" in f.url), None)
+        if not upload_frame:
+            try:
+                upload_frame = await page.wait_for_event(
+                    "framenavigated", predicate=lambda f: "/micro/" in f.url, timeout=30000)
+            except Exception:
+                pass
 
         if not upload_frame:
             print(f"    未找到iframe，使用主页面", flush=True)
@@ -201,7 +320,6 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
                     if await elem.count() > 0 and await elem.first.is_visible():
                         print(f"    找到上传区域: {sel}", flush=True)
                         await elem.first.click()
-                        await asyncio.sleep(2)
                         break
                 except Exception:
                     pass
@@ -212,8 +330,6 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
             except Exception:
                 pass
 
-        await asyncio.sleep(2)
-
         # Step 1: Upload video via file chooser
         try:
             async with page.expect_file_chooser(timeout=20000) as fc_info:
@@ -240,57 +356,38 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
                         except Exception:
                             continue
                 if not clicked:
-                    await context.close()
-                    await p.stop()
-                    return {"ok": False, "error": "Cannot find file input or upload button"}
+                    return _done({"ok": False, "error": "Cannot find file input or upload button"})
         except Exception as e:
-            await context.close()
-            await p.stop()
-            return {"ok": False, "error": f"File chooser failed: {e}"}
+            return _done({"ok": False, "error": f"File chooser failed: {e}"})
 
         file_chooser = await fc_info.value
         await file_chooser.set_files(video_path)
+        mark("file_selected")
         print(f"    视频已选择，等待上传...", flush=True)
 
-        # Step 2: Wait for upload to complete
-        max_upload_wait = 600
-        start = time.time()
-        upload_done = False
-        while time.time() - start < max_upload_wait:
-            try:
-                video_elem = upload_frame.locator('video')
-                delete_btn = upload_frame.locator('button:has-text("删除")')
-                video_elem_main = page.locator('video')
-                delete_btn_main = page.locator('button:has-text("删除")')
-
-                if await video_elem.count() > 0 or await delete_btn.count() > 0:
-                    upload_done = True
-                    print(f"    检测到上传完成标志 (iframe)", flush=True)
-                    break
-                if await video_elem_main.count() > 0 or await delete_btn_main.count() > 0:
-                    upload_done = True
-                    print(f"    检测到上传完成标志 (主页面)", flush=True)
-                    break
-
-                short_title_input = upload_frame.locator('input[placeholder*="概括视频主要内容"]')
-                if await short_title_input.count() > 0:
-                    is_disabled = await short_title_input.first.is_disabled()
-                    if not is_disabled:
-                        upload_done = True
-                        print(f"    短标题输入框已启用，上传完成", flush=True)
-                        break
-            except Exception:
-                pass
-            elapsed = int(time.time() - start)
-            if elapsed % 10 == 0 and elapsed > 0:
-                print(f"    上传中... ({elapsed}s)", flush=True)
-            await asyncio.sleep(2)
-
-        if not upload_done:
+        # Step 2: Wait for upload to complete — DFS complete XHR or the
+        # preview/delete button/short-title input appearing, whichever is first
+        waits = {
+            "xhr": upload_xhr_done.wait(),
+            "page": page.wait_for_selector(UPLOAD_READY_SELECTOR, state="attached", timeout=0),
+        }
+        if upload_frame is not page:
+            waits["iframe"] = upload_frame.wait_for_selector(UPLOAD_READY_SELECTOR, state="attached", timeout=0)
+        how = await _first_of(
+            waits, timeout=600,
+            on_tick=lambda s: print(f"    上传中... ({s}s, {net['parts']} 分片)", flush=True))
+
+        if how:
+            mark("upload_done")
+            print(f"    检测到上传完成标志 ({how})", flush=True)
+        else:
             print(f"    {Y}未检测到视频预览，但继续尝试填写表单...{X}", flush=True)
 
         print(f"    上传完成，填写信息...", flush=True)
-        await asyncio.sleep(3)
+        form_waits = {"page": page.wait_for_selector(SHORT_TITLE_READY_SELECTOR, timeout=0)}
+        if upload_frame is not page:
+            form_waits["iframe"] = upload_frame.wait_for_selector(SHORT_TITLE_READY_SELECTOR, timeout=0)
+        await _first_of(form_waits, timeout=15)
 
         # Wujie iframe may be empty after upload, fallback to main page
         short_title_test = upload_frame.locator('input[placeholder*="概括"]')
@@ -324,8 +421,7 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
                 print(f"    ✓ 描述已填写", flush=True)
         except Exception as e:
             print(f"    ⚠ 描述填写异常: {e}", flush=True)
-
-        await asyncio.sleep(2)
+        mark("form_filled")
 
         # Step 5: Wait for publish button
         print(f"    检查发表按钮状态...", flush=True)
@@ -336,22 +432,23 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
 
             if btn_count > 0:
                 max_wait_publish = 600  # 10 min — large videos need server processing
-                is_disabled = True
-                for wait_i in range(max_wait_publish // 5):
-                    cls = await publish_btn.first.get_attribute("class") or ""
-                    html_disabled = await publish_btn.first.get_attribute("disabled")
-                    is_disabled = "disabled" in cls or html_disabled is not None
-                    if not is_disabled:
-                        break
-                    if wait_i == 0:
-                        print(f"    {Y}发表按钮暂时禁用，等待视频处理...{X}", flush=True)
-                    print(f"\r    等待发表按钮可用... ({(wait_i+1)*5}s/{max_wait_publish}s)", end="", flush=True)
-                    await asyncio.sleep(5)
+                cls = await publish_btn.first.get_attribute("class") or ""
+                is_disabled = "disabled" in cls or await publish_btn.first.get_attribute("disabled") is not None
+                if is_disabled:
+                    print(f"    {Y}发表按钮暂时禁用，等待视频处理 (最多{max_wait_publish}s)...{X}", flush=True)
+                    try:
+                        # Evaluated in-page, so no per-check round trips
+                        await upload_frame.wait_for_function(PUBLISH_ENABLED_JS, polling=500,
+                                                             timeout=max_wait_publish * 1000)
+                        is_disabled = False
+                    except Exception:
+                        pass
 
                 if not is_disabled:
-                    print(f"\n    发表按钮状态: enabled", flush=True)
+                    mark("publish_enabled")
+                    print(f"    发表按钮状态: enabled", flush=True)
                 else:
-                    print(f"\n    发表按钮状态: disabled (超时)", flush=True)
+                    print(f"    发表按钮状态: disabled (超时)", flush=True)
                     # Try saving as draft
                     draft_btn = upload_frame.locator('button:has-text("保存草稿")')
                     if await draft_btn.count() > 0:
@@ -359,202 +456,153 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
                         if "disabled" not in draft_cls:
                             await draft_btn.first.click()
                             print(f"    ✓ 已保存为草稿", flush=True)
-                            await asyncio.sleep(3)
-                            await context.close()
-                            await p.stop()
-                            return {"ok": True, "note": "saved as draft"}
-                    await context.close()
-                    await p.stop()
-                    return {"ok": False, "error": "Publish button disabled (timeout)"}
-
-                # Click publish — try multiple methods to ensure it works
-                print(f"    点击发表...", flush=True)
-
-                # Method 1: Direct click
-                try:
-                    await publish_btn.first.click()
-                    print(f"    ✓ 方法1: 直接点击", flush=True)
-                except Exception as e:
-                    print(f"    ✗ 方法1失败: {e}", flush=True)
-
-                await asyncio.sleep(2)
-
-                # Method 2: JavaScript click (more reliable)
-                try:
-                    await upload_frame.evaluate('document.querySelector("button:has-text(\\"发表\\")").click()')
-                    print(f"    ✓ 方法2: JS点击", flush=True)
-                except Exception as e:
-                    print(f"    ✗ 方法2失败: {e}", flush=True)
-
-                await asyncio.sleep(2)
-
-                # Method 3: Force click
-                try:
-                    await publish_btn.first.click(force=True)
-                    print(f"    ✓ 方法3: 强制点击", flush=True)
-                except Exception as e:
-                    print(f"    ✗ 方法3失败: {e}", flush=True)
-
-                publish_clicked = True
-                await asyncio.sleep(3)
+                            await asyncio.sleep(3)  # Let the draft request go out
+                            return _done({"ok": True, "note": "saved as draft"})
+                    return _done({"ok": False, "error": "Publish button disabled (timeout)"})
 
-                # Debug: List all visible buttons after clicking publish
-                print(f"    [DEBUG] 检查页面上所有按钮...", flush=True)
-                try:
-                    all_buttons = upload_frame.locator('button')
-                    btn_count = await all_buttons.count()
-                    print(f"    [DEBUG] 找到 {btn_count} 个按钮", flush=True)
-                    for i in range(min(btn_count, 10)):  # Check first 10 buttons
-                        try:
-                            btn_text = await all_buttons.nth(i).inner_text()
-                            is_visible = await all_buttons.nth(i).is_visible()
-                            if is_visible and btn_text.strip():
-                                print(f"    [DEBUG] 按钮 {i+1}: '{btn_text.strip()}'", flush=True)
-                        except Exception:
-                            pass
-                except Exception as e:
-                    print(f"    [DEBUG] 按钮检查异常: {e}", flush=True)
+                # Click publish — try multiple methods until post_create goes out
+                print(f"    点击发表...", flush=True)
+                post_request = asyncio.ensure_future(page.wait_for_event(
+                    "request", predicate=lambda r: POST_CREATE_API in r.url, timeout=0))
+                post_response = asyncio.ensure_future(page.wait_for_event(
+                    "response", predicate=lambda r: POST_CREATE_API in r.url, timeout=0))
+                await asyncio.sleep(0)  # Let both listeners attach before clicking
+                if state is not None:
+                    state["publish_clicked"] = True
+                click_methods = [
+                    ("方法1: 直接点击", lambda: publish_btn.first.click()),
+                    ("方法2: JS点击", lambda: upload_frame.evaluate(
+                        '[...document.querySelectorAll("button")].find(b => b.textContent.includes("发表")).click()')),
+                    ("方法3: 强制点击", lambda: publish_btn.first.click(force=True)),
+                ]
+                for name, click in click_methods:
+                    try:
+                        await click()
+                        print(f"    ✓ {name}", flush=True)
+                    except Exception as e:
+                        print(f"    ✗ {name} 失败: {e}", flush=True)
+                    publish_clicked = True
+                    await asyncio.wait([post_request], timeout=2)
+                    if post_request.done():
+                        break
+                mark("publish_clicked")
 
-                # Check for confirmation dialog after clicking publish
-                print(f"    检查确认弹窗...", flush=True)
-                await asyncio.sleep(2)
-                try:
-                    # Common confirmation dialog selectors
-                    confirm_selectors = [
-                        'button:has-text("确定")',
-                        'button:has-text("确认")',
-                        'button:has-text("发布")',
-                        'div.dialog button',
-                        'div.modal button',
-                        'button.btn-primary',
-                        'button.primary',
-                    ]
-                    found_confirm = False
-                    for sel in confirm_selectors:
-                        confirm_btn = upload_frame.locator(sel)
-                        count = await confirm_btn.count()
-                        if count > 0:
-                            for i in range(count):
-                                try:
-                                    btn = confirm_btn.nth(i)
-                                    if await btn.is_visible():
-                                        btn_text = await btn.inner_text()
-                                        # Skip if it's the original publish button
-                                        if "发表" in btn_text and "确" not in btn_text:
-                                            continue
-                                        print(f"    检测到确认按钮: '{btn_text}' (选择器: {sel})，点击...", flush=True)
-                                        await btn.click()
-                                        await asyncio.sleep(1)
-                                        found_confirm = True
-                                        break
-                                except Exception as e:
-                                    print(f"    确认按钮点击异常: {e}", flush=True)
-                            if found_confirm:
-                                break
-                    if not found_confirm:
-                        print(f"    未检测到确认弹窗，可能已直接发表", flush=True)
-                except Exception as e:
-                    print(f"    确认弹窗检测异常: {e}", flush=True)
+                if not post_request.done():
+                    # Nothing submitted yet — probably a confirmation dialog
+                    print(f"    检查确认弹窗...", flush=True)
+                    try:
+                        # Common confirmation dialog selectors
+                        confirm_selectors = [
+                            'button:has-text("确定")',
+                            'button:has-text("确认")',
+                            'button:has-text("发布")',
+                            'div.dialog button',
+                            'div.modal button',
+                            'button.btn-primary',
+                            'button.primary',
+                        ]
+                        found_confirm = False
+                        for sel in confirm_selectors:
+                            confirm_btn = upload_frame.locator(sel)
+                            count = await confirm_btn.count()
+                            if count > 0:
+                                for i in range(count):
+                                    try:
+                                        btn = confirm_btn.nth(i)
+                                        if await btn.is_visible():
+                                            btn_text = await btn.inner_text()
+                                            # Skip if it's the original publish button
+                                            if "发表" in btn_text and "确" not in btn_text:
+                                                continue
+                                            print(f"    检测到确认按钮: '{btn_text}' (选择器: {sel})，点击...", flush=True)
+                                            await btn.click()
+                                            found_confirm = True
+                                            break
+                                    except Exception as e:
+                                        print(f"    确认按钮点击异常: {e}", flush=True)
+                                if found_confirm:
+                                    break
+                        if not found_confirm:
+                            print(f"    未检测到确认弹窗，可能已直接发表", flush=True)
+                    except Exception as e:
+                        print(f"    确认弹窗检测异常: {e}", flush=True)
             else:
-                await context.close()
-                await p.stop()
-                return {"ok": False, "error": "Publish button not found"}
+                return _done({"ok": False, "error": "Publish button not found"})
 
         except Exception as e:
             if not publish_clicked:
-                try:
-                    await context.close()
-                    await p.stop()
-                except Exception:
-                    pass
-                return {"ok": False, "error": f"Publish interaction failed: {e}"}
+                return _done({"ok": False, "error": f"Publish interaction failed: {e}"})
             # publish was clicked — continue to cleanup even if error occurred
             print(f"    ⚠ 发表后异常 (已点击发表): {e}", flush=True)
 
-        await asyncio.sleep(3)
-
-        # Step 6: Handle post-publish dialogs (best-effort)
-        print(f"    检查发表后弹窗...", flush=True)
+        # Step 6: Wait for the publish to land: post_create response or the
+        # redirect to the post list. Admin QR verification may come first.
+        print(f"    等待发表请求完成...", flush=True)
+        verify_sel = 'div.mobile-guide-qr-code'
+        how = await _first_of({
+            "post_create": asyncio.shield(post_response),
+            "redirect": page.wait_for_url("**/post/list**", timeout=0),
+            "verify": upload_frame.wait_for_selector(verify_sel, state="visible", timeout=0),
+        }, timeout=30)
+        if how == "verify":
+            print(f"\n  {'='*50}")
+            print(f"  需要管理员扫码验证，请用微信扫描弹窗中的二维码")
+            print(f"  等待验证... (最多4分钟)")
+            print(f"  {'='*50}\n", flush=True)
+            try:
+                await upload_frame.wait_for_selector(verify_sel, state="hidden", timeout=240000)
+                print(f"    ✓ 验证完成", flush=True)
+            except Exception:
+                pass
+            how = await _first_of({
+                "post_create": asyncio.shield(post_response),
+                "redirect": page.wait_for_url("**/post/list**", timeout=0),
+            }, timeout=30)
+
+        confirmed = False
+        if post_response.done() and not post_response.cancelled() and post_response.exception() is None:
+            mark("publish_confirmed")
+            try:
+                body = await post_response.result().json()
+            except Exception:
+                body = {}
+            err_code = body.get("errCode", 0) if isinstance(body, dict) else 0
+            if err_code:
+                print(f"    {R}✗ post_create 返回错误: {err_code} {body.get('errMsg', '')}{X}", flush=True)
+                return _done({"ok": False, "error": f"post_create errCode {err_code}: {body.get('errMsg', '')}",
+                              "submitted": True})
+            confirmed = True
+            print(f"    {G}✓ 发表请求已完成{X}", flush=True)
+        elif how == "redirect":
+            mark("publish_confirmed")
+            confirmed = True
+            print(f"    {G}✓ 检测到页面跳转，发表成功{X}", flush=True)
+        for task in (post_request, post_response):
+            if task.done() and not task.cancelled():
+                task.exception()  # Retrieved, so asyncio does not warn about it
+            task.cancel()
+        print(f"    发表后URL: {page.url}", flush=True)
 
-        # Check for various post-publish dialogs
+        # Post-publish dialogs (best-effort)
         try:
-            # Success message dialog
-            success_selectors = [
-                'div:has-text("发表成功")',
-                'div:has-text("发布成功")',
-                'button:has-text("我知道了")',
-                'button:has-text("确定")',
-            ]
-            for sel in success_selectors:
+            for sel in ['div.post-check-dialog button:has-text("我知道了")',
+                        'button:has-text("我知道了")', 'button:has-text("确定")']:
                 elem = upload_frame.locator(sel)
-                if await elem.count() > 0:
-                    try:
-                        if await elem.first.is_visible():
-                            print(f"    检测到成功提示: {sel}", flush=True)
-                            # Try to click if it's a button
-                            if 'button' in sel:
-                                await elem.first.click()
-                                await asyncio.sleep(1)
-                            break
-                    except Exception:
-                        pass
+                if await elem.count() > 0 and await elem.first.is_visible():
+                    print(f"    点击'{sel}'", flush=True)
+                    await elem.first.click()
+                    break
         except Exception as e:
             print(f"    成功提示检测异常: {e}", flush=True)
 
-        try:
-            verify_dialog = upload_frame.locator('div.mobile-guide-qr-code')
-            if await verify_dialog.count() > 0 and await verify_dialog.is_visible():
-                print(f"\n  {'='*50}")
-                print(f"  需要管理员扫码验证，请用微信扫描弹窗中的二维码")
-                print(f"  等待验证... (最多4分钟)")
-                print(f"  {'='*50}\n", flush=True)
-                v_start = time.time()
-                while time.time() - v_start < 240:
-                    if await verify_dialog.count() == 0 or not await verify_dialog.is_visible():
-                        print(f"    ✓ 验证完成", flush=True)
-                        break
-                    await asyncio.sleep(2)
-        except Exception:
-            pass
-
-        try:
-            notice_btn = upload_frame.locator('div.post-check-dialog button:has-text("我知道了")')
-            if await notice_btn.count() > 0 and await notice_btn.first.is_visible():
-                print(f"    点击'我知道了'按钮", flush=True)
-                await notice_btn.first.click()
-                await asyncio.sleep(2)
-        except Exception:
-            pass
-
-        # Check current URL to see if we're redirected to success page or list page
-        await asyncio.sleep(3)
-        final_url = page.url
-        print(f"    发表后URL: {final_url}", flush=True)
-
-        # Wait longer to ensure publish request completes
-        print(f"    等待发表请求完成...", flush=True)
-        await asyncio.sleep(10)
-
-        # Check if redirected to post list (indicates success)
-        current_url = page.url
-        if "post/list" in current_url or "post/create" not in current_url:
-            print(f"    {G}✓ 检测到页面跳转，发表成功{X}", flush=True)
-            print(f"    当前URL: {current_url}", flush=True)
-        else:
-            print(f"    当前仍在发布页面，继续等待...", flush=True)
-            await asyncio.sleep(10)
-            current_url = page.url
-            print(f"    最终URL: {current_url}", flush=True)
-
-        print(f"    {G}✓ 发表流程完成，保持浏览器打开15秒以确保请求提交...{X}", flush=True)
-        await asyncio.sleep(15)
+        if not confirmed:
+            # No publish XHR or redirect seen — keep the tab open a while so an
+            # in-flight request is not cut off
+            print(f"    {Y}未检测到发表确认，保持浏览器打开15秒以确保请求提交...{X}", flush=True)
+            await asyncio.sleep(15)
+        mark("done")
 
-        try:
-            await context.close()
-            await p.stop()
-        except Exception:
-            pass
-        return {"ok": True}
+        return _done({"ok": True})
 
     except Exception as e:
         import traceback
@@ -563,21 +611,15 @@ async def upload_weixin_channels_async(video_path: str, title: str, desc: str, t
         # If publish was already clicked, treat as success despite cleanup errors
         if publish_clicked:
             print(f"    ⚠ 发表后清理异常 (视频已发布): {e}", flush=True)
-            try:
-                await p.stop()
-            except Exception:
-                pass
-            return {"ok": True, "note": f"published but cleanup error: {e}"}
-        try:
-            await p.stop()
-        except Exception:
-            pass
-        return {"ok": False, "error": str(e)}
+            return _done({"ok": True, "note": f"published but cleanup error: {e}"})
+        return _done({"ok": False, "error": str(e)})
+    finally:
+        await _cleanup()
 
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python _weixin_upload_worker.py '<json_args>' '<result_file>'")
+        print("Usage: python src/workers/weixin_upload_worker.py '<json_args>' '<result_file>'")
         sys.exit(1)
 
     args = json.loads(sys.argv[1])
@@ -589,6 +631,7 @@ def main():
         args["desc"],
         args["tags"],
         args.get("cover_path"),
+        upload_limit=args.get("upload_limit", 0),
     ))
 
     result_file.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")